@@ -0,0 +1,179 @@
+"""
+Binary columnar responses for weights and roots.
+
+Clients that send ``Accept: application/vnd.grouptheory.columnar`` get
+numeric arrays as raw little-endian columns instead of nested JSON lists.
+A browser wraps each column in a typed array without parsing anything.
+
+Layout (all integers little-endian)::
+
+    0   4 bytes   magic b"GTC1"
+    4   uint32    header length H
+    8   H bytes   UTF-8 JSON header, space-padded so columns start 8-aligned
+    ... columns, each starting at an 8-byte aligned offset
+
+The header is ``{"meta": {...}, "columns": [{"name", "dtype", "shape",
+"offset", "length"}]}``: ``meta`` holds the scalar fields of the JSON
+response, ``offset`` and ``length`` are byte positions in the body, and
+``dtype`` is one of int8, int16, int32, float32 or float64. Integer
+columns use the smallest of int8/int16/int32 that holds every value
+(float64 beyond that); float columns are float32. For example, in
+JavaScript::
+
+    new Int8Array(buffer, column.offset, column.length)
+"""
+
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+import json
+import struct
+
+import numpy as np
+from fastapi import Response
+
+
+COLUMNAR_MEDIA_TYPE = "application/vnd.grouptheory.columnar"
+
+MAGIC = b"GTC1"
+_ALIGNMENT = 8
+
+
+def negotiated_headers(headers: Optional[Mapping[str, str]] = None) -> Dict[str, str]:
+    """
+    Headers of a response whose encoding was chosen from the Accept header.
+
+    Endpoints that can answer in columns pass these to the JSON and the
+    columnar response alike, so caches keep the two apart.
+    """
+    return {**(headers or {}), "Vary": "Accept"}
+
+
+def columnar_responses(status_code: int = 200) -> Dict[Any, Any]:
+    """OpenAPI ``responses=`` entry documenting the columnar alternative."""
+    return {
+        status_code: {
+            "content": {COLUMNAR_MEDIA_TYPE: {"schema": {"type": "string", "format": "binary"}}},
+            "description": "JSON, or binary columns when requested through the Accept header",
+        },
+    }
+
+
+def _media_ranges(accept: str) -> Dict[str, float]:
+    """Media types of an Accept header with their q values."""
+    ranges = {}
+    for part in accept.split(","):
+        media_type, *params = (item.strip() for item in part.split(";"))
+        quality = 1.0
+        for param in params:
+            if param.startswith("q="):
+                try:
+                    quality = float(param[2:])
+                except ValueError:
+                    quality = 0.0
+        if media_type:
+            ranges[media_type.lower()] = quality
+    return ranges
+
+
+def wants_columnar(accept: Optional[str]) -> bool:
+    """True if the Accept header prefers the columnar format over JSON."""
+    if not accept:
+        return False
+    ranges = _media_ranges(accept)
+    columnar = ranges.get(COLUMNAR_MEDIA_TYPE, 0.0)
+    json_quality = max(ranges.get(media_type, 0.0) for media_type in ("application/json", "application/*", "*/*"))
+    return columnar > 0 and columnar >= json_quality
+
+
+def column_array(values: Any) -> np.ndarray:
+    """Convert a numeric array or nested list to the column dtype used on the wire."""
+    array = np.asarray(values)
+    if array.dtype == object:
+        raise ValueError("Ragged or non-numeric column")
+    if array.dtype.kind in "biu":
+        bound = int(np.abs(array.astype(np.int64)).max(initial=0))
+        for dtype in (np.int8, np.int16, np.int32):
+            if bound <= np.iinfo(dtype).max:
+                return array.astype(np.dtype(dtype).newbyteorder("<"))
+        return array.astype("<f8")
+    return array.astype("<f4")
+
+
+def records_to_columns(records: Sequence[Mapping[str, Any]]) -> Dict[str, np.ndarray]:
+    """Turn a list of flat numeric records into one column per key."""
+    if not records:
+        return {}
+    return {key: column_array([record[key] for record in records]) for key in records[0]}
+
+
+def encode_columnar(meta: Mapping[str, Any], columns: Mapping[str, Any]) -> bytes:
+    """
+    Encode scalar metadata and numeric columns.
+
+    Raises:
+        ValueError: If a column is not a rectangular numeric array
+    """
+    arrays = {name: column_array(values) for name, values in columns.items()}
+    descriptors: List[Dict[str, Any]] = [
+        {"name": name, "dtype": array.dtype.name, "shape": list(array.shape), "offset": 0,
+         "length": array.nbytes}
+        for name, array in arrays.items()
+    ]
+
+    # Offsets depend on the header length, which depends on the offsets: pad the
+    # header to an aligned size with room for the offset digits, then fill them in
+    def render(descriptors):
+        return json.dumps({"meta": meta, "columns": descriptors}, separators=(",", ":"),
+                          default=_json_default).encode()
+
+    header_length = len(render(descriptors)) + 12 * len(descriptors)
+    header_length += -(8 + header_length) % _ALIGNMENT
+    offset = 8 + header_length
+    for descriptor in descriptors:
+        descriptor["offset"] = offset
+        offset += descriptor["length"] + (-descriptor["length"] % _ALIGNMENT)
+    header = render(descriptors)
+    header += b" " * (header_length - len(header))
+
+    parts = [MAGIC, struct.pack("<I", header_length), header]
+    for array in arrays.values():
+        data = array.tobytes()
+        parts += [data, b"\0" * (-len(data) % _ALIGNMENT)]
+    return b"".join(parts)
+
+
+def decode_columnar(body: bytes) -> Dict[str, Any]:
+    """
+    Decode a columnar body into ``{"meta": ..., "columns": {name: array}}``.
+
+    Raises:
+        ValueError: If the body is not in the columnar format
+    """
+    if body[:4] != MAGIC or len(body) < 8:
+        raise ValueError("Not a columnar body")
+    (header_length,) = struct.unpack("<I", body[4:8])
+    header = json.loads(body[8:8 + header_length])
+    columns = {}
+    for column in header["columns"]:
+        count = column["length"] // np.dtype(column["dtype"]).itemsize
+        array = np.frombuffer(body, dtype=np.dtype(column["dtype"]).newbyteorder("<"),
+                              count=count, offset=column["offset"])
+        columns[column["name"]] = array.reshape(column["shape"])
+    return {"meta": header["meta"], "columns": columns}
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class ColumnarResponse(Response):
+    """Response in the binary columnar format."""
+
+    media_type = COLUMNAR_MEDIA_TYPE
+
+    def __init__(self, meta: Mapping[str, Any], columns: Mapping[str, Any], status_code: int = 200,
+                 headers: Optional[Mapping[str, str]] = None):
+        super().__init__(encode_columnar(meta, columns), status_code=status_code, headers=headers)
@@ -0,0 +1,148 @@
+"""
+HTTP caching for the deterministic GET endpoints.
+
+Responses under ``/groups`` and ``/irreps`` depend only on the request:
+the algebra, the Dynkin labels and the query parameters. Successful
+responses carry a strong ETag, the hash of their body, and a long-lived
+``Cache-Control``, so browsers and reverse proxies can reuse them. Group
+aliases that produce the same bytes (``SU3``, ``su3``, ``A2``) therefore
+share one ETag.
+
+Conditional GETs are answered in two ways:
+
+* The middleware remembers the ETag it issued for each recent 200
+  response, keyed by the canonical request. A matching ``If-None-Match``
+  is answered with 304 before the endpoint runs, without calling the core.
+* Otherwise the endpoint runs, and a 2xx response whose ETag matches is
+  turned into a 304. Errors pass through unchanged, so an unknown group
+  is a 404 whatever ``If-None-Match`` says.
+
+``Vary`` is left to the endpoints (see ``columnar.negotiated_headers``);
+a 304 repeats the ``Vary`` of the response it stands for.
+"""
+
+from collections import OrderedDict
+from typing import List, Optional, Sequence, Tuple
+from urllib.parse import parse_qsl, urlencode
+import hashlib
+
+
+Headers = List[Tuple[bytes, bytes]]
+
+
+def _header(scope, name: bytes) -> Optional[str]:
+    for key, value in scope["headers"]:
+        if key == name:
+            return value.decode("latin-1")
+    return None
+
+
+def request_key(scope) -> str:
+    """
+    Canonical form of a GET request.
+
+    Query parameters are sorted, so their order does not matter. The Accept
+    header is included because it selects the response format.
+    """
+    query = urlencode(sorted(parse_qsl(scope.get("query_string", b"").decode("latin-1"),
+                                       keep_blank_values=True)))
+    accept = (_header(scope, b"accept") or "").replace(" ", "")
+    return "\n".join((scope["path"].rstrip("/"), query, accept))
+
+
+def body_etag(body: bytes) -> str:
+    """Strong ETag of a response body."""
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """
+    Weak comparison of an If-None-Match header against an ETag (RFC 9110).
+
+    ``*`` is not special: only tags the server issued can match.
+    """
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return any((tag[2:] if tag.startswith("W/") else tag) == etag for tag in candidates)
+
+
+class HTTPCacheMiddleware:
+    """ASGI middleware adding ETags and answering conditional GETs."""
+
+    def __init__(self, app, prefixes: Sequence[str] = ("/api/v1/groups", "/api/v1/irreps"),
+                 max_age: int = 86400, max_entries: int = 10000):
+        """
+        Args:
+            app: The wrapped ASGI application
+            prefixes: Paths whose GET responses are deterministic
+            max_age: Seconds clients and proxies may reuse a response
+            max_entries: Issued ETags remembered for answering 304 without the endpoint
+        """
+        self.app = app
+        self.prefixes = tuple(prefix.rstrip("/") for prefix in prefixes)
+        self.cache_control = f"public, max-age={max_age}".encode()
+        self.max_entries = max_entries
+        # request key -> (ETag, Vary) of its last 200 response, least recent first
+        self._issued: "OrderedDict[str, Tuple[str, Optional[bytes]]]" = OrderedDict()
+
+    def _cacheable(self, path: str) -> bool:
+        return any(path == prefix or path.startswith(prefix + "/") for prefix in self.prefixes)
+
+    def _cache_headers(self, etag: str) -> Headers:
+        return [(b"etag", etag.encode()), (b"cache-control", self.cache_control)]
+
+    def _remember(self, key: str, etag: str, vary: Optional[bytes]) -> None:
+        self._issued[key] = (etag, vary)
+        self._issued.move_to_end(key)
+        while len(self._issued) > self.max_entries:
+            self._issued.popitem(last=False)
+
+    async def _not_modified(self, send, etag: str, vary: Optional[bytes]) -> None:
+        headers = self._cache_headers(etag) + ([(b"vary", vary)] if vary is not None else [])
+        await send({"type": "http.response.start", "status": 304, "headers": headers})
+        await send({"type": "http.response.body", "body": b""})
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] not in ("GET", "HEAD") or not self._cacheable(scope["path"]):
+            await self.app(scope, receive, send)
+            return
+
+        key = request_key(scope)
+        if_none_match = _header(scope, b"if-none-match")
+        issued = self._issued.get(key)
+        if if_none_match is not None and issued is not None and etag_matches(if_none_match, issued[0]):
+            self._issued.move_to_end(key)
+            await self._not_modified(send, *issued)
+            return
+
+        start = None
+        chunks: List[bytes] = []
+
+        async def send_with_etag(message):
+            nonlocal start
+            if message["type"] == "http.response.start":
+                if 200 <= message["status"] < 300:
+                    start = message  # held back until the body is complete
+                else:
+                    await send(message)
+                return
+            if message["type"] != "http.response.body" or start is None:
+                await send(message)
+                return
+
+            chunks.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+            body = b"".join(chunks)
+            etag = body_etag(body)
+            headers = [(name, value) for name, value in start.get("headers", [])
+                       if name not in (b"etag", b"cache-control")]
+            vary = next((value for name, value in headers if name == b"vary"), None)
+            if start["status"] == 200:
+                self._remember(key, etag, vary)
+            if if_none_match is not None and etag_matches(if_none_match, etag):
+                await self._not_modified(send, etag, vary)
+                return
+            await send({**start, "headers": headers + self._cache_headers(etag)})
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_with_etag)
@@ -0,0 +1,57 @@
+"""
+Field projection and paging for the group and irrep responses.
+
+``?fields=rank,dimension`` returns only those fields of the response
+model, and the endpoints skip computing the others: a group without
+``positive_roots`` never generates its roots, an irrep without
+``weights`` or ``multiplicities`` never builds its weight system.
+``?offset=&limit=`` page the array fields (positive roots, weights and
+multiplicities); the full length of the paged arrays is sent in the
+``X-Total-Count`` header.
+"""
+
+from typing import Optional, Sequence, Tuple, Type, TypeVar
+
+from fastapi import Query
+from pydantic import BaseModel
+
+
+TOTAL_COUNT_HEADER = "X-Total-Count"
+
+T = TypeVar("T")
+
+# Query parameters shared by the projectable endpoints
+FIELDS_QUERY = Query(default=None, description="Comma-separated response fields to return (default: all)")
+OFFSET_QUERY = Query(default=0, ge=0, description="Index of the first element of the array fields")
+LIMIT_QUERY = Query(default=None, ge=0, description="Maximum number of elements of the array fields")
+
+
+def parse_fields(fields: Optional[str], model: Type[BaseModel]) -> Optional[Tuple[str, ...]]:
+    """
+    Parse a ``fields=`` parameter against a response model.
+
+    Returns:
+        The requested fields in model order, or None for all fields
+
+    Raises:
+        ValueError: For unknown field names or an empty selection
+    """
+    if fields is None:
+        return None
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = requested - set(model.model_fields)
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+    if not requested:
+        raise ValueError("No fields requested")
+    return tuple(name for name in model.model_fields if name in requested)
+
+
+def wants(fields: Optional[Sequence[str]], *names: str) -> bool:
+    """True if any of ``names`` is among the requested fields (None selects all)."""
+    return fields is None or any(name in fields for name in names)
+
+
+def page(values: T, offset: int = 0, limit: Optional[int] = None) -> T:
+    """Slice one array field (list or NumPy array) to the requested page."""
+    return values[offset:None if limit is None else offset + limit]
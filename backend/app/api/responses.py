@@ -0,0 +1,55 @@
+"""
+Fast JSON responses for trusted core output.
+
+Endpoints declare a ``response_model`` for the OpenAPI schema, but when
+they return a Response instance FastAPI skips both ``jsonable_encoder``
+and model re-validation. Core results already have exactly the declared
+shape, so returning ``FastJSONResponse(data)`` serializes them in one
+pass, with NumPy arrays written directly instead of being converted to
+nested lists first.
+
+orjson is used when installed; otherwise the standard library encoder
+produces the same JSON. Content orjson rejects, such as exact dimensions
+beyond 64 bits, is also left to the standard library encoder.
+"""
+
+from typing import Any
+import json
+
+import numpy as np
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def _default(value: Any) -> Any:
+    """Encode what the JSON encoders do not handle natively."""
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    """Serialize trusted content (dicts, lists, numbers, NumPy arrays) to JSON bytes."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(content, default=_default,
+                                option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            pass  # e.g. integers beyond 64 bits
+    return json.dumps(content, default=_default, ensure_ascii=False, allow_nan=False,
+                      separators=(",", ":")).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse that serializes NumPy-backed core results directly."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -0,0 +1,78 @@
+"""
+Batch endpoint - many small operations in one request
+"""
+
+from typing import Any, Dict, List, Optional
+from fastapi import APIRouter, HTTPException, status
+from pydantic import BaseModel, Field
+
+from app.api.responses import FastJSONResponse
+from app.config import settings
+from app.services.batch import BATCH_OPERATIONS, DIMENSION, run_batch
+from app.services.executor import compute_executor
+
+router = APIRouter()
+
+
+# Schemas
+class BatchOperationRequest(BaseModel):
+    """One operation of a batch"""
+    op: str = Field(..., description=f"One of: {', '.join(sorted([*BATCH_OPERATIONS, DIMENSION]))}")
+    group: Optional[str] = Field(default=None, description="Group name (default: the batch's group)")
+    params: Dict[str, Any] = Field(default_factory=dict,
+                                   description="Operation parameters, e.g. {'highest_weight': [1, 0]}")
+
+
+class BatchRequest(BaseModel):
+    """Request schema for a batch of operations"""
+    group: Optional[str] = Field(default=None, description="Default group for every operation")
+    operations: List[BatchOperationRequest] = Field(..., description="Operations, answered in order")
+
+
+class BatchOperationResult(BaseModel):
+    """Outcome of one operation"""
+    status: int
+    result: Optional[Any] = None
+    error: Optional[str] = None
+
+
+class BatchResponse(BaseModel):
+    """Response schema for a batch"""
+    results: List[BatchOperationResult]
+    unique_operations: int
+
+
+# Endpoints
+@router.post("/batch", response_model=BatchResponse)
+async def batch(request: BatchRequest):
+    """
+    Run many operations in one request.
+    
+    Operations and their parameters:
+    - group: fields (optional)
+    - group_info, root_system, dynkin_diagram: none
+    - irrep: highest_weight
+    - dimension: highest_weight
+    - tensor_product: irrep1, irrep2
+    - weight_diagram: irrep
+    
+    Each group is resolved once, identical operations run once, all
+    dimensions of a group are computed in one vectorized call, and the
+    rest run in parallel. Every operation gets its own `status` and either
+    a `result` or an `error`; a failed operation does not fail the batch.
+    
+    Example: {"group": "SU3", "operations": [{"op": "dimension", "params": {"highest_weight": [1, 1]}},
+             {"op": "tensor_product", "params": {"irrep1": [1, 0], "irrep2": [0, 1]}}]}
+    """
+    if len(request.operations) > settings.BATCH_MAX_OPERATIONS:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Batch has {len(request.operations)} operations; the limit is {settings.BATCH_MAX_OPERATIONS}"
+        )
+    
+    requests = [
+        {"op": operation.op, "group": operation.group or request.group, "params": operation.params}
+        for operation in request.operations
+    ]
+    outcomes, unique = await run_batch(compute_executor, requests, settings.BATCH_CONCURRENCY)
+    return FastJSONResponse({"results": outcomes, "unique_operations": unique})
@@ -2,29 +2,33 @@
 Calculations endpoints - Heavy async calculations
 """
 
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 from fastapi import APIRouter, HTTPException, status
 from pydantic import BaseModel, Field
 
+from app.services.executor import ComputeUnavailable, run_light
+from app.tasks.jobs import get_job_manager
+from app.tasks.store import FINISHED_STATES
+
 router = APIRouter()
 
 
 # Schemas
 class CalculationSubmit(BaseModel):
     """Request schema for submitting a calculation"""
-    operation: str = Field(..., description="Operation type")
+    operation: str = Field(..., description="Operation type (e.g., 'irrep', 'tensor_product')")
     parameters: Dict[str, Any] = Field(..., description="Operation parameters")
 
 
 class CalculationStatus(BaseModel):
     """Response schema for calculation status"""
     task_id: str
-    status: str  # pending, running, completed, failed
+    status: str  # pending, running, completed, failed, cancelled
     progress: int = Field(default=0, description="Progress percentage (0-100)")
-    result: Dict[str, Any] = None
-    error: str = None
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
     created_at: str
-    completed_at: str = None
+    completed_at: Optional[str] = None
 
 
 # Endpoints
@@ -33,13 +37,24 @@ async def submit_calculation(calculation: CalculationSubmit):
     """
     Submit a heavy calculation for async processing.
     
+    Operations and their parameters:
+    - irrep: group, highest_weight, max_weights (optional)
+    - tensor_product: group, irrep1, irrep2
+    - weight_diagram: group, irrep
+    - root_system: group
+    - dimension: group, highest_weight
+    
     Returns task_id for polling status.
     """
-    # TODO: Submit to Celery queue
-    raise HTTPException(
-        status_code=status.HTTP_501_NOT_IMPLEMENTED,
-        detail="Async calculations not yet implemented"
-    )
+    try:
+        return await run_light(get_job_manager().submit, calculation.operation, calculation.parameters)
+    except ComputeUnavailable:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Failed to submit calculation: {str(e)}"
+        )
 
 
 @router.get("/{task_id}/status", response_model=CalculationStatus)
@@ -47,20 +62,31 @@ async def get_calculation_status(task_id: str):
     """
     Get status of a submitted calculation.
     
-    Poll this endpoint to track calculation progress.
+    Poll this endpoint to track calculation progress. Finished calculations
+    are kept for JOB_RESULT_TTL seconds.
     """
-    # TODO: Check Celery task status
-    raise HTTPException(
-        status_code=status.HTTP_404_NOT_FOUND,
-        detail=f"Task {task_id} not found"
-    )
+    job = await run_light(get_job_manager().get, task_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Task {task_id} not found"
+        )
+    return job
 
 
-@router.delete("/{task_id}")
+@router.delete("/{task_id}", response_model=CalculationStatus)
 async def cancel_calculation(task_id: str):
-    """Cancel a running calculation"""
-    # TODO: Revoke Celery task
-    raise HTTPException(
-        status_code=status.HTTP_501_NOT_IMPLEMENTED,
-        detail="Calculation cancellation not yet implemented"
-    )
+    """Cancel a pending or running calculation"""
+    manager = get_job_manager()
+    job = await run_light(manager.get, task_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Task {task_id} not found"
+        )
+    if job["status"] in FINISHED_STATES:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Task {task_id} already {job['status']}"
+        )
+    return await run_light(manager.cancel, task_id)
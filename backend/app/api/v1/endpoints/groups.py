@@ -2,11 +2,20 @@
 Groups endpoints - Lie group creation and manipulation
 """
 
-from typing import List, Any, Dict
-from fastapi import APIRouter, HTTPException, status
+from typing import List, Any, Dict, Optional, Tuple
+from fastapi import APIRouter, Header, HTTPException, status
 from pydantic import BaseModel, Field
 
+from app.api.columnar import (
+    COLUMNAR_MEDIA_TYPE, ColumnarResponse, columnar_responses, negotiated_headers, wants_columnar,
+)
+from app.api.projection import (
+    FIELDS_QUERY, LIMIT_QUERY, OFFSET_QUERY, TOTAL_COUNT_HEADER, page, parse_fields,
+)
+from app.api.responses import FastJSONResponse
 from app.core.lie_algebra import LieAlgebraCalculator
+from app.services import operations
+from app.services.executor import ComputeUnavailable, run_light
 
 router = APIRouter()
 
@@ -43,32 +52,44 @@ class SymmetryBreakResponse(BaseModel):
     latex: str
 
 
+def _selected_fields(fields: Optional[str]) -> Optional[Tuple[str, ...]]:
+    """Parse ``fields=`` against GroupResponse, rejecting unknown names with a 400."""
+    try:
+        return parse_fields(fields, GroupResponse)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+def _group_response(data: Dict[str, Any], offset: int = 0, limit: Optional[int] = None,
+                    status_code: int = status.HTTP_200_OK) -> FastJSONResponse:
+    """GroupResponse with the positive roots paged, when they were requested."""
+    headers = {}
+    if "positive_roots" in data:
+        headers[TOTAL_COUNT_HEADER] = str(len(data["positive_roots"]))
+        data = {**data, "positive_roots": page(data["positive_roots"], offset, limit)}
+    return FastJSONResponse(data, status_code=status_code, headers=headers)
+
+
 # Endpoints
 @router.post("/create", response_model=GroupResponse, status_code=status.HTTP_201_CREATED)
-async def create_group(group: GroupCreate):
+async def create_group(group: GroupCreate, fields: Optional[str] = FIELDS_QUERY,
+                       offset: int = OFFSET_QUERY, limit: Optional[int] = LIMIT_QUERY):
     """
     Create a Lie group and return its properties.
     
     Supports:
     - Classical groups: SU(n), SO(n)
     - Exceptional groups: E6, E7, E8
+    
+    `fields` selects the response fields; `offset` and `limit` page the
+    positive roots.
     """
+    selected = _selected_fields(fields)
     try:
-        calc = LieAlgebraCalculator(group.name)
-        
-        # Generate unique ID from group name
-        group_id = f"{calc.cartan_type.lower()}-{calc.get_rank()}"
-        
-        return {
-            "id": group_id,
-            "name": calc.physics_name,
-            "cartan_name": calc.cartan_type,
-            "rank": calc.get_rank(),
-            "cartan_matrix": calc.get_cartan_matrix(),
-            "simple_roots": calc.get_simple_roots(),
-            "dimension": calc.get_dimension(),
-            "positive_roots": calc.get_positive_roots(),
-        }
+        data = await run_light(operations.group_data, group.name, fields=selected)
+        return _group_response(data, offset, limit, status.HTTP_201_CREATED)
+    except ComputeUnavailable:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -77,22 +98,19 @@ async def create_group(group: GroupCreate):
 
 
 @router.get("/{group_name}", response_model=GroupResponse)
-async def get_group(group_name: str):
-    """Get group details by name (e.g., 'SU3', 'A2', 'E6')"""
+async def get_group(group_name: str, fields: Optional[str] = FIELDS_QUERY,
+                    offset: int = OFFSET_QUERY, limit: Optional[int] = LIMIT_QUERY):
+    """
+    Get group details by name (e.g., 'SU3', 'A2', 'E6').
+    
+    Example: `?fields=rank,dimension` skips the root system entirely;
+    `?fields=positive_roots&offset=0&limit=20` returns the first 20 roots.
+    """
+    selected = _selected_fields(fields)
     try:
-        calc = LieAlgebraCalculator(group_name)
-        group_id = f"{calc.cartan_type.lower()}-{calc.get_rank()}"
-        
-        return {
-            "id": group_id,
-            "name": calc.physics_name,
-            "cartan_name": calc.cartan_type,
-            "rank": calc.get_rank(),
-            "cartan_matrix": calc.get_cartan_matrix(),
-            "simple_roots": calc.get_simple_roots(),
-            "dimension": calc.get_dimension(),
-            "positive_roots": calc.get_positive_roots(),
-        }
+        return _group_response(await run_light(operations.group_data, group_name, fields=selected), offset, limit)
+    except ComputeUnavailable:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -118,15 +136,16 @@ async def break_symmetry(group_id: str, request: SymmetryBreakRequest):
 async def list_groups(skip: int = 0, limit: int = 100):
     """List all available groups"""
     groups = LieAlgebraCalculator.list_available_groups()
-    return groups[skip:skip + limit]
+    return FastJSONResponse(groups[skip:skip + limit])
 
 
 @router.get("/{group_name}/info")
 async def get_group_info(group_name: str):
     """Get detailed algebra information"""
     try:
-        calc = LieAlgebraCalculator(group_name)
-        return calc.get_algebra_info()
+        return FastJSONResponse(await run_light(operations.group_info, group_name))
+    except ComputeUnavailable:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -134,12 +153,22 @@ async def get_group_info(group_name: str):
         )
 
 
-@router.get("/{group_name}/root-system")
-async def get_root_system(group_name: str):
-    """Get complete root system data"""
+@router.get("/{group_name}/root-system", responses=columnar_responses())
+async def get_root_system(group_name: str, accept: Optional[str] = Header(
+        default=None, description=f"'{COLUMNAR_MEDIA_TYPE}' for binary columns")):
+    """
+    Get complete root system data.
+    
+    Roots are float32 columns and the Cartan matrix an int8 column in the
+    columnar format.
+    """
     try:
-        calc = LieAlgebraCalculator(group_name)
-        return calc.get_root_system_data()
+        data = await run_light(operations.root_system_data, group_name)
+        if wants_columnar(accept):
+            return ColumnarResponse({}, data, headers=negotiated_headers())
+        return FastJSONResponse(data, headers=negotiated_headers())
+    except ComputeUnavailable:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -151,8 +180,9 @@ async def get_root_system(group_name: str):
 async def get_dynkin_diagram(group_name: str):
     """Get Dynkin diagram representation"""
     try:
-        calc = LieAlgebraCalculator(group_name)
-        return calc.get_dynkin_diagram()
+        return FastJSONResponse(await run_light(operations.dynkin_diagram, group_name))
+    except ComputeUnavailable:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
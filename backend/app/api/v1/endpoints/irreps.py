@@ -2,13 +2,26 @@
 Irreps endpoints - Irreducible representation calculations
 """
 
-from typing import List
-from fastapi import APIRouter, HTTPException, status
+import json
+from typing import Dict, Iterator, List, Optional, Tuple
+import numpy as np
+from fastapi import APIRouter, Header, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
-from app.core.irreps import IrrepCalculator
-from app.core.tensor_products import TensorProductCalculator
-from app.core.weight_systems import calculate_weight_diagram_data
+from app.api.columnar import (
+    COLUMNAR_MEDIA_TYPE, ColumnarResponse, columnar_responses, negotiated_headers, records_to_columns,
+    wants_columnar,
+)
+from app.api.projection import (
+    FIELDS_QUERY, LIMIT_QUERY, OFFSET_QUERY, TOTAL_COUNT_HEADER, page, parse_fields, wants,
+)
+from app.api.responses import FastJSONResponse
+from app.config import settings
+from app.core.freudenthal import WeightLimitExceeded, iter_weight_system
+from app.core.registry import get_algebra
+from app.services import operations
+from app.services.executor import ComputeUnavailable, run_heavy, run_light
 
 router = APIRouter()
 
@@ -45,6 +58,35 @@ class TensorProductResponse(BaseModel):
     latex: str
 
 
+class IrrepDimensionsRequest(BaseModel):
+    """Request schema for the dimensions of many irreps of one group"""
+    group: str = Field(..., description="Group name (e.g., 'E6', 'SU(3)xSU(2)')")
+    dynkin_labels: List[List[int]] = Field(..., description="Highest weights in Dynkin basis, one per irrep")
+
+
+class IrrepDimensionsResponse(BaseModel):
+    """Response schema for the dimensions of many irreps"""
+    group: str
+    dimensions: List[int]
+    computation_method: str = "weyl_dimension_formula"
+
+
+class IrrepSearchResult(BaseModel):
+    """One irrep found by a dimension search"""
+    dynkin_labels: List[int]
+    dimension: int
+
+
+class IrrepSearchResponse(BaseModel):
+    """Response schema for a dimension search"""
+    group: str
+    cartan_type: str
+    dimension_min: int
+    dimension_max: int
+    total: int
+    irreps: List[IrrepSearchResult]
+
+
 class WeightSystemVisualizationRequest(BaseModel):
     """Request schema for weight system visualization"""
     group: str = Field(..., description="Group name (e.g., 'SU3')")
@@ -61,33 +103,155 @@ class WeightSystemVisualizationResponse(BaseModel):
     coordinate_system: str
 
 
+class WeightSystemStreamRequest(BaseModel):
+    """Request schema for streaming a weight system as NDJSON"""
+    group: str = Field(..., description="Group name (e.g., 'E8', 'SO(10)')")
+    dynkin_labels: List[int] = Field(..., description="Highest weight in Dynkin basis")
+    max_weights: Optional[int] = Field(
+        default=None, gt=0,
+        description="Maximum number of weights in this page (default: stream all)"
+    )
+    cursor: Optional[str] = Field(default=None, description="Cursor returned by the previous page")
+
+
+# Lines of NDJSON sent per chunk
+STREAM_CHUNK_LINES = 256
+
+
+def _parse_cursor(cursor: Optional[str], num_orbits: int) -> Tuple[int, int]:
+    """Parse an 'orbit:offset' cursor."""
+    if cursor is None:
+        return 0, 0
+    try:
+        orbit, offset = (int(x) for x in cursor.split(":"))
+    except ValueError:
+        raise ValueError(f"Invalid cursor: {cursor}")
+    if not (0 <= orbit < num_orbits and offset >= 0):
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return orbit, offset
+
+
+def _stream_weights(rs, character, cursor: Tuple[int, int], max_weights: Optional[int],
+                    header: dict) -> Iterator[str]:
+    """
+    Generate NDJSON lines: a header, one line per weight, and an end marker.
+    
+    Metadata lines carry a "type" key; weight lines are {"weight", "multiplicity"}.
+    """
+    yield json.dumps(header) + "\n"
+    
+    lines = []
+    returned = 0
+    next_cursor = None
+    for orbit, offset, weight, multiplicity in iter_weight_system(rs, character, cursor):
+        if max_weights is not None and returned == max_weights:
+            next_cursor = f"{orbit}:{offset}"
+            break
+        lines.append(json.dumps({"weight": weight, "multiplicity": multiplicity}))
+        returned += 1
+        if len(lines) == STREAM_CHUNK_LINES:
+            yield "\n".join(lines) + "\n"
+            lines = []
+    
+    if lines:
+        yield "\n".join(lines) + "\n"
+    yield json.dumps({"type": "end", "returned": returned, "next_cursor": next_cursor}) + "\n"
+
+
+def _selected_fields(fields: Optional[str]) -> Optional[Tuple[str, ...]]:
+    """Parse ``fields=`` against IrrepResponse, rejecting unknown names with a 400."""
+    try:
+        return parse_fields(fields, IrrepResponse)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+async def _fetch_irrep(group_id: str, highest_weight: List[int],
+                       fields: Optional[Tuple[str, ...]] = None) -> Dict:
+    """
+    Irrep data, with the weight system only if weights or multiplicities were requested.
+    
+    The operations are called with the canonical group name, so every alias
+    of a group (and the startup warm-up) shares one cached result.
+    """
+    group = operations.canonical_group_name(group_id)
+    if wants(fields, *operations.WEIGHT_SYSTEM_FIELDS):
+        return await run_heavy(operations.irrep_data, group, highest_weight,
+                               max_weights=settings.MAX_WEIGHT_SYSTEM_SIZE)
+    return await run_light(operations.irrep_summary, group, highest_weight)
+
+
+def _irrep_response(irrep_id: str, group_id: str, data: Dict, accept: Optional[str] = None,
+                    status_code: int = status.HTTP_200_OK, fields: Optional[Tuple[str, ...]] = None,
+                    offset: int = 0, limit: Optional[int] = None):
+    """
+    IrrepResponse with the WeightSystem arrays serialized directly, as JSON or columns.
+    
+    Only the requested fields are included; weights and multiplicities are
+    paged by ``offset`` and ``limit``.
+    """
+    meta = {
+        "id": irrep_id,
+        "group_id": group_id,
+        "highest_weight": data["highest_weight"],
+        "dimension": data["dimension"],
+        "latex_name": data["latex_name"],
+    }
+    columns = {}
+    headers = {}
+    weight_system = data.get("weight_system")
+    if weight_system is not None:
+        headers[TOTAL_COUNT_HEADER] = str(len(weight_system))
+        columns = {
+            "weights": np.ascontiguousarray(page(weight_system.dynkin, offset, limit)),
+            "multiplicities": page(weight_system.multiplicities, offset, limit),
+        }
+    if fields is not None:
+        meta = {key: value for key, value in meta.items() if key in fields}
+        columns = {key: value for key, value in columns.items() if key in fields}
+    headers = negotiated_headers(headers)
+    if wants_columnar(accept):
+        return ColumnarResponse(meta, columns, status_code=status_code, headers=headers)
+    return FastJSONResponse({**meta, **columns}, status_code=status_code, headers=headers)
+
+
+# Accept header parameter of the endpoints that can answer in binary columns
+_ACCEPT = Header(default=None, description=f"'{COLUMNAR_MEDIA_TYPE}' for binary columns")
+
+
 # Endpoints
-@router.post("/", response_model=IrrepResponse, status_code=status.HTTP_201_CREATED)
-async def create_irrep(irrep: IrrepCreate):
+@router.post("/", response_model=IrrepResponse, status_code=status.HTTP_201_CREATED,
+             responses=columnar_responses(status.HTTP_201_CREATED))
+async def create_irrep(irrep: IrrepCreate, accept: Optional[str] = _ACCEPT,
+                       fields: Optional[str] = FIELDS_QUERY, offset: int = OFFSET_QUERY,
+                       limit: Optional[int] = LIMIT_QUERY):
     """
     Construct an irreducible representation from highest weight.
     
     Methods:
     - weyl_reflection: Fast Weyl reflection algorithm
     - freudenthal: Freudenthal's multiplicity formula
+    
+    `fields` selects the response fields; `offset` and `limit` page the
+    weights and multiplicities.
     """
+    selected = _selected_fields(fields)
     try:
-        calc = IrrepCalculator(irrep.group_id, irrep.highest_weight)
-        data = calc.get_irrep_data()
+        data = await _fetch_irrep(irrep.group_id, irrep.highest_weight, selected)
         
         # Generate ID
         weight_str = "_".join(map(str, irrep.highest_weight))
         irrep_id = f"{irrep.group_id.lower()}-{weight_str}"
         
-        return {
-            "id": irrep_id,
-            "group_id": irrep.group_id,
-            "highest_weight": data["highest_weight"],
-            "dimension": data["dimension"],
-            "weights": data["weights"],
-            "multiplicities": data["multiplicities"],
-            "latex_name": data["latex_name"],
-        }
+        return _irrep_response(irrep_id, irrep.group_id, data, accept, status.HTTP_201_CREATED,
+                               selected, offset, limit)
+    except WeightLimitExceeded as e:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"{str(e)}; use /irreps/weight-system/stream instead"
+        )
+    except ComputeUnavailable:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -95,14 +259,72 @@ async def create_irrep(irrep: IrrepCreate):
         )
 
 
-@router.get("/{irrep_id}", response_model=IrrepResponse)
-async def get_irrep(irrep_id: str):
+# Declared before GET /{irrep_id}, which would otherwise match "search"
+@router.get("/search", response_model=IrrepSearchResponse)
+async def search_irreps(
+    group: str = Query(..., description="Simple group (e.g., 'SU4', 'E6')"),
+    dimension: Optional[int] = Query(default=None, ge=1, description="Exact dimension"),
+    dimension_min: Optional[int] = Query(default=None, ge=1, description="Smallest dimension (default: 1)"),
+    dimension_max: Optional[int] = Query(default=None, ge=1, description="Largest dimension"),
+    offset: int = OFFSET_QUERY,
+    limit: Optional[int] = Query(default=1000, ge=0, description="Maximum number of irreps returned"),
+):
+    """
+    Find the irreps of a group by dimension.
+    
+    Pass either `dimension` or a `dimension_min`/`dimension_max` range.
+    Results are sorted by dimension, then by Dynkin labels; `total` (and
+    the X-Total-Count header) counts all matches, `offset` and `limit`
+    page them.
+    
+    Example: SU4 with dimension=20 → [0,0,3], [0,1,1], [0,2,0], [1,1,0], [3,0,0]
+    """
+    if dimension is not None:
+        if dimension_min is not None or dimension_max is not None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Pass either dimension or dimension_min/dimension_max, not both"
+            )
+        dimension_min = dimension_max = dimension
+    if dimension_max is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="dimension or dimension_max is required"
+        )
+    dimension_min = 1 if dimension_min is None else dimension_min
+    
+    try:
+        data = await run_heavy(operations.irrep_search, group, dimension_min, dimension_max,
+                               offset=offset, limit=limit)
+    except ComputeUnavailable:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Failed to search irreps: {str(e)}"
+        )
+    
+    return FastJSONResponse(
+        {"group": group, "cartan_type": data["cartan_type"], "dimension_min": dimension_min,
+         "dimension_max": dimension_max, "total": data["total"], "irreps": data["irreps"]},
+        headers={TOTAL_COUNT_HEADER: str(data["total"])},
+    )
+
+
+@router.get("/{irrep_id}", response_model=IrrepResponse, responses=columnar_responses())
+async def get_irrep(irrep_id: str, accept: Optional[str] = _ACCEPT,
+                    fields: Optional[str] = FIELDS_QUERY, offset: int = OFFSET_QUERY,
+                    limit: Optional[int] = LIMIT_QUERY):
     """
     Get irrep details by ID.
     
     ID format: 'groupname-weight1_weight2_...'
     Example: 'su3-1_0' for SU(3) fundamental representation
+    
+    With `?fields=dimension,latex_name` the weight system is not computed,
+    so irreps beyond the weight limit can still be queried.
     """
+    selected = _selected_fields(fields)
     try:
         # Parse ID to extract group and weight
         parts = irrep_id.split("-")
@@ -113,18 +335,17 @@ async def get_irrep(irrep_id: str):
         weight_str = "-".join(parts[1:])
         highest_weight = [int(x) for x in weight_str.split("_")]
         
-        calc = IrrepCalculator(group_id, highest_weight)
-        data = calc.get_irrep_data()
+        data = await _fetch_irrep(group_id, highest_weight, selected)
         
-        return {
-            "id": irrep_id,
-            "group_id": group_id,
-            "highest_weight": data["highest_weight"],
-            "dimension": data["dimension"],
-            "weights": data["weights"],
-            "multiplicities": data["multiplicities"],
-            "latex_name": data["latex_name"],
-        }
+        return _irrep_response(irrep_id, group_id, data, accept, fields=selected,
+                               offset=offset, limit=limit)
+    except WeightLimitExceeded as e:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"{str(e)}; use /irreps/weight-system/stream instead"
+        )
+    except ComputeUnavailable:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -141,14 +362,10 @@ async def tensor_product(request: TensorProductRequest):
               (3 ⊗ 3 = 3̄ ⊕ 6)
     """
     try:
-        calc = TensorProductCalculator(request.group)
-        decomposition = calc.decompose(request.irrep1, request.irrep2)
-        latex_formula = calc.get_latex_formula(request.irrep1, request.irrep2, decomposition)
-        
-        return {
-            "decomposition": decomposition,
-            "latex": latex_formula,
-        }
+        data = await run_heavy(operations.tensor_product, request.group, request.irrep1, request.irrep2)
+        return FastJSONResponse(data)
+    except ComputeUnavailable:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -156,6 +373,41 @@ async def tensor_product(request: TensorProductRequest):
         )
 
 
+@router.post("/dimensions", response_model=IrrepDimensionsResponse)
+async def irrep_dimensions(request: IrrepDimensionsRequest):
+    """
+    Calculate the dimensions of many irreps of one group.
+    
+    All label vectors go through the Weyl dimension formula in one NumPy
+    pass; dimensions are exact integers in request order. No weights are
+    computed.
+    
+    Example: SU(3) [[1, 0], [1, 1], [3, 0]] → [3, 8, 10]
+    """
+    if len(request.dynkin_labels) > settings.MAX_DIMENSION_BATCH_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"{len(request.dynkin_labels)} label vectors; the limit is {settings.MAX_DIMENSION_BATCH_SIZE}"
+        )
+    
+    try:
+        dimensions = []
+        if request.dynkin_labels:
+            dimensions = await run_heavy(operations.irrep_dimensions, request.group, request.dynkin_labels)
+        return FastJSONResponse({
+            "group": request.group,
+            "dimensions": dimensions,
+            "computation_method": "weyl_dimension_formula",
+        })
+    except ComputeUnavailable:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Failed to calculate dimensions: {str(e)}"
+        )
+
+
 @router.get("/", response_model=List[IrrepResponse])
 async def list_irreps(group_id: str = None, skip: int = 0, limit: int = 100):
     """List irreps, optionally filtered by group"""
@@ -163,8 +415,10 @@ async def list_irreps(group_id: str = None, skip: int = 0, limit: int = 100):
     return []
 
 
-@router.post("/weight-system", response_model=WeightSystemVisualizationResponse)
-async def get_weight_system_visualization(request: WeightSystemVisualizationRequest):
+@router.post("/weight-system", response_model=WeightSystemVisualizationResponse,
+             responses=columnar_responses())
+async def get_weight_system_visualization(request: WeightSystemVisualizationRequest,
+                                          accept: Optional[str] = _ACCEPT):
     """
     Get weight system with visualization coordinates for multiplet diagrams.
     
@@ -174,7 +428,7 @@ async def get_weight_system_visualization(request: WeightSystemVisualizationRequ
     Example: SU(3) fundamental [1,0] returns 3 weights forming a triangle
     """
     try:
-        weight_data = calculate_weight_diagram_data(request.group, request.irrep)
+        weight_data = await run_heavy(operations.weight_diagram, request.group, request.irrep)
         
         if "error" in weight_data:
             raise HTTPException(
@@ -182,8 +436,11 @@ async def get_weight_system_visualization(request: WeightSystemVisualizationRequ
                 detail=weight_data["error"]
             )
         
-        return weight_data
-    except HTTPException:
+        if wants_columnar(accept):
+            meta = {key: value for key, value in weight_data.items() if key != "weights"}
+            return ColumnarResponse(meta, records_to_columns(weight_data["weights"]), headers=negotiated_headers())
+        return FastJSONResponse(weight_data, headers=negotiated_headers())
+    except (HTTPException, ComputeUnavailable):
         raise
     except Exception as e:
         raise HTTPException(
@@ -191,3 +448,41 @@ async def get_weight_system_visualization(request: WeightSystemVisualizationRequ
             detail=f"Failed to calculate weight system: {str(e)}"
         )
 
+
+@router.post("/weight-system/stream")
+async def stream_weight_system(request: WeightSystemStreamRequest):
+    """
+    Stream the full weight system of an irrep as NDJSON.
+    
+    Weights are generated lazily from the dominant character, orbit by orbit,
+    so the server never holds the whole weight system. With `max_weights`
+    the stream stops after that many weights and the final line carries a
+    `next_cursor` to resume from.
+    
+    Example: E8 [1,0,0,0,0,0,0,0] (the 3875) streams 2401 distinct weights
+    """
+    try:
+        data = await run_heavy(operations.weight_system_header, request.group, request.dynkin_labels)
+        character = data["character"]
+        cursor = _parse_cursor(request.cursor, len(character))
+        
+        header = {
+            "type": "header",
+            "group": data["cartan_type"],
+            "dynkin_labels": request.dynkin_labels,
+            "dimension": data["dimension"],
+            "num_dominant_weights": len(character),
+            "cursor": request.cursor,
+        }
+    except ComputeUnavailable:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Failed to stream weight system: {str(e)}"
+        )
+    
+    return StreamingResponse(
+        _stream_weights(get_algebra(data["cartan_type"]).root_system, character, cursor, request.max_weights, header),
+        media_type="application/x-ndjson",
+    )
@@ -4,7 +4,7 @@ API v1 Router - Combines all endpoint routers
 
 from fastapi import APIRouter
 
-from app.api.v1.endpoints import groups, irreps, calculations
+from app.api.v1.endpoints import batch, groups, irreps, calculations
 
 # Create main API router
 api_router = APIRouter()
@@ -27,3 +27,8 @@ api_router.include_router(
     prefix="/calculations",
     tags=["calculations"]
 )
+
+api_router.include_router(
+    batch.router,
+    tags=["batch"]
+)
@@ -2,7 +2,7 @@
 Application configuration using Pydantic settings
 """
 
-from typing import List
+from typing import List, Optional, Tuple
 from pydantic_settings import BaseSettings
 from pydantic import Field
 
@@ -30,6 +30,14 @@ class Settings(BaseSettings):
         default=10000,
         description="Maximum dimension for tensor product computation"
     )
+    MAX_DIMENSION_BATCH_SIZE: int = Field(
+        default=100000,
+        description="Maximum number of label vectors in one POST /irreps/dimensions request"
+    )
+    IRREP_SEARCH_MAX_DIMENSION: int = Field(
+        default=1000000,
+        description="Largest dimension GET /irreps/search accepts (bounds the size of each dimension index)"
+    )
     
     # Caching
     ENABLE_CACHE: bool = Field(
@@ -41,6 +49,141 @@ class Settings(BaseSettings):
         description="LRU cache size for expensive computations"
     )
     
+    # HTTP caching of GET /groups and /irreps responses
+    HTTP_CACHE_MAX_AGE: int = Field(
+        default=86400,
+        description="Cache-Control max-age in seconds (0 disables ETags and caching headers)"
+    )
+    
+    # Precomputed data
+    ALGEBRA_BUNDLE_PATH: Optional[str] = Field(
+        default=None,
+        description="Path to the prebuilt algebra bundle (default: app/data/lie_algebras.bin)"
+    )
+    DIMENSION_INDEX_DIR: Optional[str] = Field(
+        default=None,
+        description="Directory of the persisted irrep dimension indexes (default: app/data/dimension_index)"
+    )
+    
+    # Persistent result cache
+    RESULT_CACHE_ENABLED: bool = Field(
+        default=False,
+        description="Keep calculation results in an on-disk cache shared by all workers (enabled in deployments)"
+    )
+    RESULT_CACHE_PATH: Optional[str] = Field(
+        default=None,
+        description="SQLite file of the result cache (default: app/data/result_cache.sqlite)"
+    )
+    RESULT_CACHE_MAX_BYTES: int = Field(
+        default=256 * 1024 * 1024,
+        description="Size of cached results before least recently used ones are evicted"
+    )
+    
+    SHARED_CACHE: str = Field(
+        default="auto",
+        description="Second-level cache shared between hosts: 'none', 'memory', 'redis' or 'auto'"
+    )
+    SHARED_CACHE_TTL: Optional[float] = Field(
+        default=86400.0,
+        description="Seconds to keep results in the shared cache"
+    )
+    SHARED_CACHE_PREFIX: str = Field(
+        default="",
+        description="Prefix for shared cache keys, e.g. to separate deployments"
+    )
+    
+    # Startup warm-up
+    WARMUP_ENABLED: bool = Field(
+        default=True,
+        description="Warm the registry and result caches in the background at startup"
+    )
+    WARMUP_IRREPS: List[Tuple[str, List[int]]] = Field(
+        default=[
+            ("SU3", [1, 0]), ("SU3", [1, 1]), ("SU5", [1, 0, 0, 0]), ("SU5", [0, 1, 0, 0]),
+            ("SO10", [0, 0, 0, 0, 1]), ("SO10", [1, 0, 0, 0, 0]), ("E6", [1, 0, 0, 0, 0, 0]),
+        ],
+        description="Irreps (group, Dynkin labels) warmed at startup, in addition to every supported group"
+    )
+    WARMUP_TENSOR_PRODUCTS: List[Tuple[str, List[int], List[int]]] = Field(
+        default=[
+            ("SU3", [1, 0], [0, 1]), ("SU3", [1, 1], [1, 1]), ("SU5", [1, 0, 0, 0], [0, 0, 0, 1]),
+            ("SO10", [0, 0, 0, 0, 1], [0, 0, 0, 0, 1]), ("E6", [1, 0, 0, 0, 0, 0], [1, 0, 0, 0, 0, 0]),
+        ],
+        description="Tensor products (group, irrep1, irrep2) warmed at startup"
+    )
+    WARMUP_CONCURRENCY: int = Field(
+        default=2,
+        description="Warm-up calls running at the same time"
+    )
+    
+    # Compute executor
+    COMPUTE_MODE: str = Field(
+        default="process",
+        description="Where heavy calculations run: 'process', 'thread' or 'inline'"
+    )
+    COMPUTE_PROCESS_WORKERS: Optional[int] = Field(
+        default=None,
+        description="Worker processes for heavy calculations (default: CPU count)"
+    )
+    COMPUTE_THREAD_WORKERS: int = Field(
+        default=8,
+        description="Worker threads for cheap calculations"
+    )
+    COMPUTE_MAX_PENDING: int = Field(
+        default=64,
+        description="Maximum outstanding calculations per pool before returning 503"
+    )
+    COMPUTE_TIMEOUT: Optional[float] = Field(
+        default=30.0,
+        description="Per-request calculation timeout in seconds before returning 504"
+    )
+    COMPUTE_START_METHOD: Optional[str] = Field(
+        default="spawn",
+        description="multiprocessing start method for worker processes"
+    )
+    
+    # Batch endpoint
+    BATCH_MAX_OPERATIONS: int = Field(
+        default=1000,
+        description="Maximum operations in one POST /batch request"
+    )
+    BATCH_CONCURRENCY: int = Field(
+        default=8,
+        description="Operations of one batch running at the same time"
+    )
+    
+    # Calculation jobs
+    JOB_BACKEND: str = Field(
+        default="local",
+        description="Where jobs run: 'local' worker processes or 'celery'"
+    )
+    JOB_STORE: str = Field(
+        default="auto",
+        description="Job records: 'memory', 'sqlite', 'redis' or 'auto'"
+    )
+    JOB_DB_PATH: Optional[str] = Field(
+        default=None,
+        description="SQLite file for job records (used by 'sqlite' and 'auto')"
+    )
+    JOB_MAX_WORKERS: int = Field(
+        default=2,
+        description="Jobs running at the same time with the local backend"
+    )
+    JOB_MAX_WEIGHT_SYSTEM_SIZE: int = Field(
+        default=200000,
+        description="Maximum number of weights of an irrep computed by a job"
+    )
+    JOB_RESULT_TTL: float = Field(
+        default=3600.0,
+        description="Seconds to keep finished jobs and their results"
+    )
+    REDIS_URL: Optional[str] = Field(
+        default=None,
+        description="Redis URL for shared job records, the shared cache and Celery"
+    )
+    CELERY_BROKER_URL: Optional[str] = None
+    CELERY_RESULT_BACKEND: Optional[str] = None
+    
     class Config:
         env_file = ".env"
         case_sensitive = True
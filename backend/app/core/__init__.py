@@ -1,13 +1,30 @@
 """
 Core calculation modules for Lie algebra and group theory.
+
+The calculators are imported on first access, so importing a single
+submodule (e.g. ``app.core.root_systems`` in a worker process or the
+bundle builder) does not load the others.
 """
 
-from .lie_algebra import LieAlgebraCalculator
-from .irreps import IrrepCalculator
-from .tensor_products import TensorProductCalculator
+from importlib import import_module
+
+_EXPORTS = {
+    "LieAlgebraCalculator": ".lie_algebra",
+    "IrrepCalculator": ".irreps",
+    "TensorProductCalculator": ".tensor_products",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
 
-__all__ = [
-    "LieAlgebraCalculator",
-    "IrrepCalculator",
-    "TensorProductCalculator",
-]
+def __dir__():
+    return sorted(list(globals()) + __all__)
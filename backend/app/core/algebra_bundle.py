@@ -0,0 +1,239 @@
+"""
+Prebuilt, memory-mapped bundle of Lie algebra data.
+
+An offline build step precomputes, for every simple algebra up to a
+configurable rank, the Cartan matrix, inverse Cartan matrix, quadratic
+form matrix, simple roots and positive roots (sorted by height, in both
+bases). The highest root and rho follow directly from the sorted roots.
+
+File layout (all integers little-endian):
+
+    8 bytes   magic  b"GTLIEBN1"
+    8 bytes   uint64 length of the JSON header
+    ...       JSON header: per algebra, the offset/shape/dtype of each
+              array plus scalar denominators
+    ...       raw array data, every array aligned to 64 bytes
+
+At runtime the file is opened with ``mmap`` and arrays are exposed as
+read-only ``np.frombuffer`` views, so no root generation runs and forked
+workers share the same page-cache pages.
+
+Build with:
+
+    python -m app.core.algebra_bundle --max-rank-a 30 --max-rank-bcd 20
+"""
+
+from pathlib import Path
+from threading import Lock
+from typing import Dict, Iterable, List, Optional
+import argparse
+import json
+import logging
+import mmap
+import struct
+
+import numpy as np
+
+from .root_systems import IntegerRootSystem
+
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"GTLIEBN1"
+FORMAT_VERSION = 1
+ALIGNMENT = 64
+ARRAY_DTYPE = np.dtype("<i4")
+
+DEFAULT_BUNDLE_PATH = Path(__file__).resolve().parent.parent / "data" / "lie_algebras.bin"
+
+# Arrays stored per algebra, in file order
+ARRAY_NAMES = (
+    "cartan_matrix",
+    "inverse_cartan",
+    "quadratic_form",
+    "simple_roots",
+    "positive_roots",
+    "positive_roots_orthogonal",
+)
+
+
+def bundled_cartan_types(max_rank_a: int = 30, max_rank_bcd: int = 20) -> List[str]:
+    """All Cartan types covered by a bundle with the given rank limits."""
+    types = [f"A{n}" for n in range(1, max_rank_a + 1)]
+    types += [f"B{n}" for n in range(2, max_rank_bcd + 1)]
+    types += [f"C{n}" for n in range(2, max_rank_bcd + 1)]
+    types += [f"D{n}" for n in range(3, max_rank_bcd + 1)]
+    types += ["E6", "E7", "E8", "F4", "G2"]
+    return types
+
+
+def _algebra_arrays(rs: IntegerRootSystem) -> Dict[str, np.ndarray]:
+    return {
+        "cartan_matrix": rs.cartan_matrix,
+        "inverse_cartan": rs.inverse_cartan.numerator,
+        "quadratic_form": rs.quadratic_form.numerator,
+        "simple_roots": rs.simple_roots,
+        "positive_roots": rs.positive_roots,
+        "positive_roots_orthogonal": rs.positive_roots_orthogonal,
+    }
+
+
+def build_bundle(path: Path, cartan_types: Iterable[str]) -> Dict:
+    """
+    Compute all algebra data and write the bundle file.
+
+    Returns:
+        The JSON header that was written
+    """
+    header = {"version": FORMAT_VERSION, "algebras": {}}
+    blobs: List[bytes] = []
+    offset = 0
+
+    for cartan_type in cartan_types:
+        rs = IntegerRootSystem(cartan_type)
+        entry = {
+            "rank": rs.rank,
+            "scalars": {
+                "orthogonal_scale": rs.orthogonal_scale,
+                "inverse_cartan_denominator": rs.inverse_cartan.denominator,
+                "quadratic_form_denominator": rs.quadratic_form.denominator,
+            },
+            "arrays": {},
+        }
+
+        for name, array in _algebra_arrays(rs).items():
+            if np.abs(array).max(initial=0) > np.iinfo(ARRAY_DTYPE).max:
+                raise OverflowError(f"{cartan_type}.{name} does not fit in {ARRAY_DTYPE}")
+            data = np.ascontiguousarray(array, dtype=ARRAY_DTYPE).tobytes()
+            padding = -len(data) % ALIGNMENT
+            entry["arrays"][name] = {"offset": offset, "shape": list(array.shape)}
+            blobs.append(data + b"\0" * padding)
+            offset += len(data) + padding
+
+        header["algebras"][rs.cartan_type] = entry
+
+    header_bytes = json.dumps(header, separators=(",", ":")).encode("utf-8")
+    # Data section starts at the first aligned offset after the header
+    prefix_len = len(MAGIC) + 8 + len(header_bytes)
+    header_bytes += b" " * (-prefix_len % ALIGNMENT)
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<Q", len(header_bytes)))
+        f.write(header_bytes)
+        for blob in blobs:
+            f.write(blob)
+    tmp_path.replace(path)
+
+    return header
+
+
+class AlgebraBundle:
+    """Read-only, memory-mapped view of a bundle file."""
+
+    def __init__(self, path: Path):
+        """
+        Open and map a bundle file.
+
+        Raises:
+            ValueError: If the file is not a bundle of a supported version
+        """
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if self._mmap[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"{self.path} is not an algebra bundle")
+
+        (header_len,) = struct.unpack_from("<Q", self._mmap, len(MAGIC))
+        header_start = len(MAGIC) + 8
+        header = json.loads(bytes(self._mmap[header_start:header_start + header_len]))
+        if header.get("version") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported bundle version: {header.get('version')}")
+
+        self._data_start = header_start + header_len
+        self._algebras: Dict[str, Dict] = header["algebras"]
+
+    def __contains__(self, cartan_type: str) -> bool:
+        return cartan_type in self._algebras
+
+    def cartan_types(self) -> List[str]:
+        return list(self._algebras)
+
+    def get_arrays(self, cartan_type: str) -> Optional[Dict[str, np.ndarray]]:
+        """Zero-copy read-only arrays for one algebra, or None if not bundled."""
+        entry = self._algebras.get(cartan_type)
+        if entry is None:
+            return None
+
+        arrays = {}
+        for name, spec in entry["arrays"].items():
+            shape = tuple(spec["shape"])
+            count = int(np.prod(shape))
+            arrays[name] = np.frombuffer(
+                self._mmap, dtype=ARRAY_DTYPE, count=count,
+                offset=self._data_start + spec["offset"],
+            ).reshape(shape)
+        return arrays
+
+    def get_root_system(self, cartan_type: str) -> Optional[IntegerRootSystem]:
+        """Root system backed by the mapped arrays, or None if not bundled."""
+        arrays = self.get_arrays(cartan_type)
+        if arrays is None:
+            return None
+        scalars = self._algebras[cartan_type]["scalars"]
+        return IntegerRootSystem.from_arrays(cartan_type, arrays, scalars)
+
+
+_default_bundle: Optional[AlgebraBundle] = None
+_default_bundle_loaded = False
+_default_bundle_lock = Lock()
+
+
+def get_default_bundle() -> Optional[AlgebraBundle]:
+    """
+    Open the configured bundle on first use.
+
+    Returns None if no bundle has been built; callers then compute the
+    data on the fly.
+    """
+    global _default_bundle, _default_bundle_loaded
+
+    if _default_bundle_loaded:
+        return _default_bundle
+
+    with _default_bundle_lock:
+        if not _default_bundle_loaded:
+            from ..config import settings
+
+            path = Path(settings.ALGEBRA_BUNDLE_PATH or DEFAULT_BUNDLE_PATH)
+            try:
+                _default_bundle = AlgebraBundle(path)
+            except FileNotFoundError:
+                _default_bundle = None
+            except ValueError as e:
+                logger.warning("Ignoring algebra bundle %s: %s", path, e)
+                _default_bundle = None
+            _default_bundle_loaded = True
+
+    return _default_bundle
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Build the precomputed Lie algebra bundle")
+    parser.add_argument("--output", type=Path, default=DEFAULT_BUNDLE_PATH)
+    parser.add_argument("--max-rank-a", type=int, default=30)
+    parser.add_argument("--max-rank-bcd", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    cartan_types = bundled_cartan_types(args.max_rank_a, args.max_rank_bcd)
+    build_bundle(args.output, cartan_types)
+    size_kb = args.output.stat().st_size / 1024
+    print(f"Wrote {len(cartan_types)} algebras to {args.output} ({size_kb:.1f} KiB)")
+
+
+if __name__ == "__main__":
+    main()
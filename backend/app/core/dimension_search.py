@@ -0,0 +1,211 @@
+"""
+Search for irreps by dimension.
+
+The Weyl dimension formula is strictly increasing in every Dynkin label:
+each factor (lambda + rho, alpha^vee) / (rho, alpha^vee) is non-decreasing
+in every label, and the factor of the simple coroot alpha_i^vee grows
+with a_i. So once raising a label pushes the dimension above the bound,
+raising it further, or raising any other label as well, cannot bring it
+back. ``enumerate_irreps`` uses this to generate exactly the irreps up to
+a dimension bound, one label at a time, evaluating each step as a single
+vectorized ``root_system_dimensions`` call.
+
+``DimensionIndex`` keeps the result per algebra, sorted by dimension and
+complete up to a bound, so range queries below the bound are two binary
+searches. The bound grows on demand (at least doubling, so a sequence of
+growing queries stays cheap) and the index is saved to disk, where every
+worker process picks it up.
+"""
+
+from pathlib import Path
+from threading import Lock
+from typing import Dict, Optional, Tuple
+import logging
+import os
+import tempfile
+
+import numpy as np
+
+from .lie_algebra import parse_semisimple_notation
+from .registry import get_algebra
+from .root_systems import IntegerRootSystem
+from .weyl import root_system_dimensions
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INDEX_DIR = Path(__file__).resolve().parent.parent / "data" / "dimension_index"
+
+# Bumped when the saved index layout changes; older files are rebuilt
+INDEX_FORMAT_VERSION = 1
+
+# Permissions of saved index files
+INDEX_FILE_MODE = 0o644
+
+# Most label vectors evaluated per root_system_dimensions call
+_CANDIDATES_PER_CALL = 4096
+
+
+def enumerate_irreps(rs: IntegerRootSystem, max_dimension: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    All irreps of dimension at most ``max_dimension``.
+
+    Labels are filled in one at a time: every label vector found so far is
+    extended with a_k = 1, 2, ... until its dimension exceeds the bound,
+    which by monotonicity ends that branch. The number of values of a_k
+    tried per branch doubles every round (within a budget per call), so
+    long chains in low-rank algebras take logarithmically many calls.
+
+    Returns:
+        (labels, dimensions): (N, rank) Dynkin labels and their (N,)
+        dimensions, in no particular order
+    """
+    if max_dimension < 1:
+        return np.zeros((0, rs.rank), dtype=np.int64), np.zeros(0, dtype=np.int64)
+
+    labels = np.zeros((1, rs.rank), dtype=np.int64)
+    dimensions = np.ones(1, dtype=np.int64)
+    for k in range(rs.rank):
+        found_labels, found_dimensions = [labels], [dimensions]
+        alive = labels      # vectors with a_k = 0 whose a_k can still grow
+        start, width = 1, 1
+        while len(alive):
+            # Double the values tried per branch each round, within the call budget
+            block = max(1, min(width, _CANDIDATES_PER_CALL // len(alive)))
+            width *= 2
+            candidates = np.repeat(alive, block, axis=0)
+            candidates[:, k] = np.tile(np.arange(start, start + block), len(alive))
+            values = root_system_dimensions(rs, candidates)
+            keep = np.fromiter((value <= max_dimension for value in values), dtype=bool, count=len(values))
+            found_labels.append(candidates[keep])
+            found_dimensions.append(np.array(values, dtype=object)[keep].astype(np.int64))
+            # A vector goes on while the last value of its block was within the bound
+            alive = alive[keep.reshape(len(alive), block)[:, -1]]
+            start += block
+        labels, dimensions = np.concatenate(found_labels), np.concatenate(found_dimensions)
+    return labels, dimensions
+
+
+class DimensionIndex:
+    """Irreps of one simple algebra sorted by dimension, complete up to ``bound``."""
+
+    def __init__(self, cartan_type: str, path: Optional[Path] = None, max_bound: Optional[int] = None):
+        """
+        Args:
+            cartan_type: Canonical Cartan type (e.g. 'A3')
+            path: File the index is loaded from and saved to (None: memory only)
+            max_bound: Largest dimension the index may grow to
+        """
+        self.cartan_type = cartan_type
+        self.path = path
+        self.max_bound = max_bound
+        self.rank = get_algebra(cartan_type).get_rank()
+        self.bound = 0
+        self.labels = np.zeros((0, self.rank), dtype=np.int64)
+        self.dimensions = np.zeros(0, dtype=np.int64)
+        self._lock = Lock()
+        self._load()
+
+    def search(self, dimension_min: int, dimension_max: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Irreps with ``dimension_min <= dimension <= dimension_max``.
+
+        Returns:
+            (labels, dimensions), sorted by dimension, then by labels
+
+        Raises:
+            ValueError: If ``dimension_max`` exceeds the index's maximum bound
+        """
+        if self.max_bound is not None and dimension_max > self.max_bound:
+            raise ValueError(f"dimension_max must be at most {self.max_bound}")
+
+        with self._lock:
+            if dimension_max > self.bound:
+                # Another worker may have grown the index on disk meanwhile
+                self._load()
+            if dimension_max > self.bound:
+                self._grow(dimension_max)
+            labels, dimensions = self.labels, self.dimensions
+
+        start = np.searchsorted(dimensions, dimension_min, side="left")
+        stop = np.searchsorted(dimensions, dimension_max, side="right")
+        return labels[start:stop], dimensions[start:stop]
+
+    def _grow(self, dimension_max: int) -> None:
+        bound = max(dimension_max, 2 * self.bound)
+        if self.max_bound is not None:
+            bound = max(dimension_max, min(bound, self.max_bound))
+
+        labels, dimensions = enumerate_irreps(get_algebra(self.cartan_type).root_system, bound)
+        # Sort by dimension, ties by labels (lexsort takes its primary key last)
+        order = np.lexsort((*labels.T[::-1], dimensions))
+        self.labels, self.dimensions, self.bound = labels[order], dimensions[order], bound
+        self._save()
+
+    def _load(self) -> None:
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            with np.load(self.path) as data:
+                if int(data["version"]) != INDEX_FORMAT_VERSION or data["labels"].shape[1] != self.rank:
+                    raise ValueError("incompatible layout")
+                if int(data["bound"]) > self.bound:
+                    self.labels, self.dimensions = data["labels"], data["dimensions"]
+                    self.bound = int(data["bound"])
+        except Exception as e:
+            logger.warning("Ignoring dimension index %s: %s", self.path, e)
+
+    def _save(self) -> None:
+        if self.path is None:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # Write a temporary file and rename it, so readers never see a partial index
+            fd, tmp = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                np.savez(f, version=INDEX_FORMAT_VERSION, bound=self.bound,
+                         labels=self.labels, dimensions=self.dimensions)
+            # mkstemp creates the file as 0600; workers running as other users read it too
+            os.chmod(tmp, INDEX_FILE_MODE)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            logger.warning("Could not save dimension index %s: %s", self.path, e)
+
+
+_indexes: Dict[str, DimensionIndex] = {}
+_indexes_lock = Lock()
+
+
+def get_dimension_index(group_name: str) -> DimensionIndex:
+    """
+    Shared dimension index of a simple group, loaded from disk on first use.
+
+    Raises:
+        ValueError: If the group is not a supported simple algebra
+    """
+    if len(parse_semisimple_notation(group_name)) != 1:
+        raise ValueError(f"{group_name} is not a simple group")
+    cartan_type = get_algebra(group_name).cartan_type
+    with _indexes_lock:
+        index = _indexes.get(cartan_type)
+        if index is None:
+            from ..config import settings
+
+            directory = Path(settings.DIMENSION_INDEX_DIR or DEFAULT_INDEX_DIR)
+            index = DimensionIndex(cartan_type, directory / f"{cartan_type}.npz",
+                                   max_bound=settings.IRREP_SEARCH_MAX_DIMENSION)
+            _indexes[cartan_type] = index
+    return index
+
+
+def search_irreps(group_name: str, dimension_min: int, dimension_max: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Irreps of a simple group with dimension in ``[dimension_min, dimension_max]``.
+
+    Returns:
+        (labels, dimensions), sorted by dimension, then by labels
+
+    Raises:
+        ValueError: For unsupported groups or bounds above the configured maximum
+    """
+    return get_dimension_index(group_name).search(dimension_min, dimension_max)
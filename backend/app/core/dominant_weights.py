@@ -0,0 +1,161 @@
+"""
+Dominant weights below a highest weight.
+
+Freudenthal's and Klimyk's formulas and the dominance order of an irrep all
+start from the set of dominant weights mu <= lambda. Each of them can be
+reached from lambda by subtracting positive roots while staying dominant
+at every step. The set is therefore enumerated level by level, with one
+NumPy step per level. The level of mu is the height of lambda - mu in
+simple roots.
+
+* A weight at level L produces mu - alpha at level L + height(alpha).
+  Only dominant results are kept.
+* Each weight has exactly one level, so duplicates only need to be
+  removed within a level. The weights there are packed into int64 keys.
+* The inverse Cartan matrix bounds every label, and these bounds are the
+  radices of the keys. mu <= lambda means (lambda - mu) A^{-1} >= 0.
+  A^{-1} has no negative entries, so
+  mu_i <= min_j (lambda A^{-1})_j / (A^{-1})_ij.
+
+No separate rho-norm test is needed. Every dominant mu < lambda already
+satisfies |mu + rho|^2 < |lambda + rho|^2, so the Freudenthal denominator
+is positive for every weight produced here.
+"""
+
+from functools import lru_cache
+from typing import Iterator, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..config import settings
+from .registry import get_algebra
+from .root_systems import IntegerRootSystem
+from .weight_keys import WeightPacker
+
+
+Weight = Tuple[int, ...]
+
+
+def _as_highest_weight(rs: IntegerRootSystem, highest_weight: Sequence[int]) -> np.ndarray:
+    lam = np.asarray([int(x) for x in highest_weight], dtype=np.int64)
+    if len(lam) != rs.rank:
+        raise ValueError(f"Expected {rs.rank} Dynkin labels, got {len(lam)}")
+    if (lam < 0).any():
+        raise ValueError("Dynkin labels must be non-negative integers")
+    return lam
+
+
+def label_bounds(rs: IntegerRootSystem, highest_weight: Sequence[int]) -> np.ndarray:
+    """
+    Upper bound on each Dynkin label of the dominant weights mu <= lambda.
+
+    Raises:
+        ValueError: If the labels are malformed
+    """
+    lam = _as_highest_weight(rs, highest_weight)
+    # The common denominator of A^{-1} cancels out of the ratios
+    inverse = rs.inverse_cartan.numerator.astype(np.int64)
+    top = lam @ inverse
+    ratios = np.where(inverse > 0, top[np.newaxis, :] // np.maximum(inverse, 1), np.iinfo(np.int64).max)
+    return ratios.min(axis=1)
+
+
+def dominant_packer(rs: IntegerRootSystem, highest_weight: Sequence[int]) -> Optional[WeightPacker]:
+    """
+    Key packer for the dominant weights mu <= lambda, or None if their keys do not fit in int64.
+
+    Its key order is the lexicographic order of the weights.
+    """
+    bounds = label_bounds(rs, highest_weight)
+    try:
+        return WeightPacker(np.zeros_like(bounds), bounds)
+    except ValueError:
+        return None
+
+
+def _unique_descending(weights: np.ndarray, packer: Optional[WeightPacker]) -> np.ndarray:
+    """Distinct rows, in descending lexicographic order."""
+    if packer is None:
+        return np.unique(weights, axis=0)[::-1]
+    _, first = np.unique(packer.pack(weights), return_index=True)
+    return weights[first[::-1]]
+
+
+def iter_dominant_weight_levels(rs: IntegerRootSystem,
+                                highest_weight: Sequence[int]) -> Iterator[Tuple[int, np.ndarray]]:
+    """
+    Dominant weights mu <= lambda, one level at a time.
+
+    Only the levels that can still receive weights are kept in memory, up
+    to the height of the highest root below the current level.
+
+    Args:
+        rs: Root system of the algebra
+        highest_weight: Dynkin labels of lambda
+
+    Yields:
+        (level, weights): weights is an (n, rank) int64 array in descending
+        lexicographic order. Levels that have no dominant weights are skipped.
+
+    Raises:
+        ValueError: If the labels are malformed
+    """
+    lam = _as_highest_weight(rs, highest_weight)
+    packer = dominant_packer(rs, lam)
+
+    roots = (rs.positive_roots @ rs.cartan_matrix).astype(np.int64)
+    heights = rs.heights.astype(np.int64)
+
+    pending = {0: [lam[np.newaxis, :]]}
+    while pending:
+        level = min(pending)
+        weights = _unique_descending(np.concatenate(pending.pop(level)), packer)
+        yield level, weights
+
+        lowered = weights[:, np.newaxis, :] - roots[np.newaxis, :, :]
+        dominant = (lowered >= 0).all(axis=2)
+        lowered, lowered_heights = lowered[dominant], np.broadcast_to(heights, dominant.shape)[dominant]
+        for height in np.unique(lowered_heights).tolist():
+            pending.setdefault(level + height, []).append(lowered[lowered_heights == height])
+
+
+def iter_dominant_weights(rs: IntegerRootSystem, highest_weight: Sequence[int]) -> Iterator[Tuple[Weight, int]]:
+    """
+    Dominant weights mu <= lambda as tuples, ordered by level.
+
+    Yields:
+        (weight, level), with descending lexicographic order inside a level
+    """
+    for level, weights in iter_dominant_weight_levels(rs, highest_weight):
+        for mu in weights.tolist():
+            yield tuple(mu), level
+
+
+def dominant_weight_array(rs: IntegerRootSystem, highest_weight: Sequence[int]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    All dominant weights mu <= lambda as arrays.
+
+    Returns:
+        (weights, levels): an (n, rank) int64 array and an (n,) int64
+        array, in the order of ``iter_dominant_weights``
+    """
+    blocks, levels = [], []
+    for level, weights in iter_dominant_weight_levels(rs, highest_weight):
+        blocks.append(weights)
+        levels.append(np.full(len(weights), level, dtype=np.int64))
+    return np.concatenate(blocks), np.concatenate(levels)
+
+
+@lru_cache(maxsize=settings.CACHE_SIZE if settings.ENABLE_CACHE else 0)
+def dominant_weights(cartan_type: str, highest_weight: Weight) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Cached, read-only ``dominant_weight_array`` of an irrep.
+
+    Args:
+        cartan_type: Canonical Cartan type (e.g., 'E6')
+        highest_weight: Dynkin labels as a tuple
+    """
+    weights, levels = dominant_weight_array(get_algebra(cartan_type).root_system, highest_weight)
+    weights.setflags(write=False)
+    levels.setflags(write=False)
+    return weights, levels
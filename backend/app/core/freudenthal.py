@@ -0,0 +1,312 @@
+"""
+Freudenthal multiplicity engine.
+
+Only dominant weights are ever computed. The dominant weights below the
+highest weight (see ``dominant_weights``) are processed level by level
+(level = height of lambda - mu in simple roots), and their multiplicities
+follow from Freudenthal's formula
+
+    m(mu) [ |lambda+rho|^2 - |mu+rho|^2 ] = 2 sum_{alpha>0} sum_{k>=1} m(mu+k alpha) (mu+k alpha, alpha)
+
+where m(mu + k alpha) is looked up through the dominant representative of
+mu + k alpha. The weights of one level only depend on lower levels, so each
+level is evaluated as a whole: all terms are reflected at once and found
+through packed int64 keys in a ``WeightIndex``. Weights are integer
+Dynkin labels and the quadratic form is used as an integer numerator, so
+the multiplicities are exact; float arithmetic only estimates how long
+each alpha-string can be.
+Non-dominant weights are filled in afterwards from Weyl orbits.
+"""
+
+from functools import lru_cache
+from itertools import islice
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..config import settings
+from .dominant_weights import Weight, dominant_packer, dominant_weights
+from .registry import get_algebra
+from .root_systems import IntegerRootSystem
+from .weight_keys import index_weights
+
+
+Character = Tuple[Tuple[Weight, int], ...]
+# Progress callbacks receive the completed fraction in [0, 1]
+ProgressCallback = Callable[[float], None]
+
+# Dominant weights evaluated per vectorized Freudenthal step
+_WEIGHTS_PER_STEP = 256
+# Sums of products stay in int64 below this bound
+_INT64_SUM_LIMIT = 2 ** 62
+
+
+class WeightLimitExceeded(ValueError):
+    """Raised when a weight system has more distinct weights than allowed."""
+
+
+def scaled_progress(progress: Optional[ProgressCallback], start: float,
+                    end: float) -> Optional[ProgressCallback]:
+    """Map a sub-task's [0, 1] progress onto [start, end] of the parent task."""
+    if progress is None:
+        return None
+    return lambda fraction: progress(start + (end - start) * fraction)
+
+
+def reflect_to_dominant(cartan: Sequence[Sequence[int]], weight: Sequence[int]) -> Weight:
+    """
+    Dominant representative of the Weyl orbit of a weight (Dynkin basis).
+
+    Applies s_i mu = mu - mu_i alpha_i while some label is negative, where
+    alpha_i in the Dynkin basis is row i of the Cartan matrix.
+    """
+    mu = list(weight)
+    rank = len(mu)
+    while True:
+        for i in range(rank):
+            if mu[i] < 0:
+                mi = mu[i]
+                row = cartan[i]
+                for j in range(rank):
+                    mu[j] -= mi * row[j]
+                break
+        else:
+            return tuple(mu)
+
+
+def reflect_rows_to_dominant(cartan: np.ndarray, weights: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Reflect every row of a weight matrix into the dominant chamber.
+
+    Each pass applies s_i for the first negative label of every row that is
+    not yet dominant, so the whole batch moves together.
+
+    Args:
+        cartan: (rank, rank) Cartan matrix
+        weights: (N, rank) weights in the Dynkin basis
+
+    Returns:
+        (dominant weights, sign of the Weyl element used for each row)
+    """
+    nu = np.array(weights, dtype=np.int64)
+    signs = np.ones(len(nu), dtype=np.int64)
+    active = np.arange(len(nu))
+
+    while len(active):
+        rows = nu[active]
+        negative = rows < 0
+        moving = negative.any(axis=1)
+        active, rows, negative = active[moving], rows[moving], negative[moving]
+        if not len(active):
+            break
+        i = negative.argmax(axis=1)
+        nu[active] -= rows[np.arange(len(active)), i][:, None] * cartan[i]
+        signs[active] = -signs[active]
+
+    return nu, signs
+
+
+def iter_weyl_orbit(cartan: Sequence[Sequence[int]], dominant: Weight) -> Iterator[Weight]:
+    """
+    Iterate over the Weyl orbit of a dominant weight, from the top down.
+
+    Each step applies s_i to a weight with positive label mu_i, which lowers
+    it by mu_i alpha_i. Weights are processed in order of depth below the
+    dominant weight, so only the current frontier is kept for deduplication.
+    """
+    rank = len(dominant)
+    pending: Dict[int, set] = {0: {tuple(dominant)}}
+
+    while pending:
+        depth = min(pending)
+        for mu in sorted(pending.pop(depth), reverse=True):
+            yield mu
+            for i in range(rank):
+                if mu[i] > 0:
+                    mi = mu[i]
+                    row = cartan[i]
+                    reflected = tuple(mu[j] - mi * row[j] for j in range(rank))
+                    pending.setdefault(depth + mi, set()).add(reflected)
+
+
+def _string_lengths(inner: np.ndarray, root_norms: np.ndarray, norms: np.ndarray,
+                    top_norm: int, levels: np.ndarray, heights: np.ndarray) -> np.ndarray:
+    """
+    Largest k for which mu + k alpha can be a weight, for every mu and alpha > 0.
+
+    Weights of V(lambda) satisfy |mu + k alpha|^2 <= |lambda|^2, which bounds
+    k by the larger root of a quadratic, and mu + k alpha <= lambda needs
+    k height(alpha) <= level(mu). The float estimate of the root is then
+    moved in exact integer steps until it is the largest k that fits, since
+    for large labels it can be off by more than one step.
+
+    Args:
+        inner: (n, P) numerators of (mu, alpha)
+        root_norms: (P,) numerators of |alpha|^2
+        norms: (n,) numerators of |mu|^2
+        top_norm: Numerator of |lambda|^2
+        levels: (n,) levels of the weights
+        heights: (P,) heights of the roots
+    """
+    def fits(k):
+        return k * k * root_norms + 2 * k * inner + (norms - top_norm)[:, np.newaxis] <= 0
+
+    discriminant = inner.astype(float) ** 2 - root_norms * (norms - top_norm)[:, np.newaxis].astype(float)
+    k = np.floor((np.sqrt(np.maximum(discriminant, 0)) - inner) / root_norms).astype(np.int64)
+    # k = 0 always fits and the fitting k form an interval
+    k = np.maximum(k, 0)
+    up = fits(k + 1)
+    while up.any():
+        k += up
+        up = fits(k + 1)
+    down = (k > 0) & ~fits(k)
+    while down.any():
+        k -= down
+        down = (k > 0) & ~fits(k)
+    return np.minimum(k, levels[:, np.newaxis] // heights)
+
+
+def compute_dominant_character(rs: IntegerRootSystem, highest_weight: Sequence[int],
+                               progress: Optional[ProgressCallback] = None) -> Character:
+    """
+    Multiplicities of the dominant weights of an irrep.
+
+    Each level is evaluated in bulk: every term mu + k alpha of the level
+    is reflected to its dominant representative, packed into an int64 key
+    and looked up in a ``WeightIndex`` over the dominant weights. Sums
+    stay in int64 while they provably fit and use Python integers beyond.
+
+    Args:
+        rs: Root system of the algebra
+        highest_weight: Dynkin labels of the highest weight
+        progress: Called with the fraction of dominant weights done
+
+    Returns:
+        Tuple of (dominant weight, multiplicity), ordered by level
+    """
+    lam = tuple(int(x) for x in highest_weight)
+    rank = rs.rank
+    if len(lam) != rank:
+        raise ValueError(f"Expected {rank} Dynkin labels, got {len(lam)}")
+    if min(lam, default=0) < 0:
+        raise ValueError("Dynkin labels must be non-negative integers")
+
+    cartan = rs.cartan_matrix.astype(np.int64)
+    # Integer numerators of inner products; the common denominator cancels out
+    form = rs.quadratic_form.numerator.astype(np.int64)
+    roots = (rs.positive_roots @ rs.cartan_matrix).astype(np.int64)
+    root_norms = np.einsum("ij,jk,ik->i", roots, form, roots)
+    heights = rs.heights.astype(np.int64)
+
+    # Shared with other calls for the irrep, including the uncached ones that report progress
+    weights, levels = dominant_weights(rs.cartan_type, lam)
+    lookup = index_weights(weights, dominant_packer(rs, lam)).lookup
+
+    lam_array = np.array(lam, dtype=np.int64)
+    top_norm = int(lam_array @ form @ lam_array)
+    top_rho_norm = int((lam_array + 1) @ form @ (lam_array + 1))
+
+    multiplicities = np.zeros(len(weights), dtype=np.int64)
+    multiplicities[0] = 1
+    level_starts = np.flatnonzero(np.diff(levels)) + 1
+    for start, stop in zip(level_starts, [*level_starts[1:], len(weights)]):
+        if progress is not None:
+            progress(start / len(weights))
+        for begin in range(start, stop, _WEIGHTS_PER_STEP):
+            block = slice(begin, min(begin + _WEIGHTS_PER_STEP, stop))
+            mu = weights[block]
+            inner = mu @ form @ roots.T
+            norms = np.einsum("ij,jk,ik->i", mu, form, mu)
+            lengths = _string_lengths(inner, root_norms, norms, top_norm, levels[block], heights)
+
+            # One row per term (mu, alpha, k) with 1 <= k <= length
+            counts = lengths.ravel()
+            pairs = np.repeat(np.arange(counts.size), counts)
+            k = np.arange(len(pairs)) - np.repeat(np.cumsum(counts) - counts, counts) + 1
+            owner, alpha = np.divmod(pairs, len(roots))
+
+            dominant, _ = reflect_rows_to_dominant(cartan, mu[owner] + k[:, np.newaxis] * roots[alpha])
+            rows = lookup(dominant)
+            m = np.where(rows >= 0, multiplicities[rows], 0)
+            factors = inner[owner, alpha] + k * root_norms[alpha]
+
+            bound = int(m.max(initial=0)) * int(np.abs(factors).max(initial=0)) * len(m)
+            if bound >= _INT64_SUM_LIMIT:
+                m, factors = m.astype(object), factors.astype(object)
+            sums = np.concatenate(([0], np.cumsum(m * factors)))
+            ends = np.cumsum(counts.reshape(len(mu), -1).sum(axis=1))
+            totals = sums[ends] - sums[np.concatenate(([0], ends[:-1]))]
+
+            rho_norms = np.einsum("ij,jk,ik->i", mu + 1, form, mu + 1)
+            values = 2 * totals // (top_rho_norm - rho_norms)
+            if multiplicities.dtype != object and max(values.tolist(), default=0) >= _INT64_SUM_LIMIT:
+                multiplicities = multiplicities.astype(object)
+            multiplicities[block] = values
+
+    if progress is not None:
+        progress(1.0)
+    return tuple((tuple(mu), int(m)) for mu, m in zip(weights.tolist(), multiplicities.tolist()) if m)
+
+
+@lru_cache(maxsize=settings.CACHE_SIZE if settings.ENABLE_CACHE else 0)
+def dominant_character(cartan_type: str, highest_weight: Weight) -> Character:
+    """
+    Cached dominant character of an irrep.
+
+    Args:
+        cartan_type: Canonical Cartan type (e.g., 'E6')
+        highest_weight: Dynkin labels as a tuple
+    """
+    return compute_dominant_character(get_algebra(cartan_type).root_system, highest_weight)
+
+
+def iter_weight_system(rs: IntegerRootSystem, character: Character,
+                       cursor: Tuple[int, int] = (0, 0)) -> Iterator[Tuple[int, int, Weight, int]]:
+    """
+    Lazily generate the weights of an irrep, orbit by orbit.
+
+    Only one Weyl orbit frontier is alive at any time, so arbitrarily large
+    weight systems can be streamed.
+
+    Args:
+        rs: Root system of the algebra
+        character: Dominant character (see ``dominant_character``)
+        cursor: (orbit index, offset within orbit) to resume from
+
+    Yields:
+        (orbit index, offset within orbit, weight, multiplicity)
+    """
+    cartan = rs.cartan_matrix.tolist()
+    start_orbit, start_offset = cursor
+
+    for index in range(start_orbit, len(character)):
+        dominant, multiplicity = character[index]
+        skip = start_offset if index == start_orbit else 0
+        orbit = islice(iter_weyl_orbit(cartan, dominant), skip, None)
+        for offset, mu in enumerate(orbit, start=skip):
+            yield index, offset, mu, multiplicity
+
+
+def expand_character(rs: IntegerRootSystem, character: Character,
+                     max_weights: Optional[int] = None) -> Tuple[List[Weight], List[int]]:
+    """
+    All weights of an irrep from its dominant character.
+
+    Args:
+        rs: Root system of the algebra
+        character: Dominant character
+        max_weights: If given, raise WeightLimitExceeded beyond this many weights
+
+    Returns:
+        (weights, multiplicities), orbit by orbit in order of the dominant weights
+    """
+    weights: List[Weight] = []
+    multiplicities: List[int] = []
+
+    for _, _, mu, multiplicity in iter_weight_system(rs, character):
+        if max_weights is not None and len(weights) >= max_weights:
+            raise WeightLimitExceeded(f"Weight system has more than {max_weights} weights")
+        weights.append(mu)
+        multiplicities.append(multiplicity)
+
+    return weights, multiplicities
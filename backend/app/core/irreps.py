@@ -5,9 +5,17 @@ This module handles the construction of irreps from highest weights
 and calculation of their properties using various algorithms.
 """
 
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
 import numpy as np
-from itertools import product
+
+from .freudenthal import (
+    ProgressCallback, WeightLimitExceeded, compute_dominant_character, dominant_character,
+    scaled_progress,
+)
+from .lie_algebra import parse_semisimple_notation
+from .registry import get_algebra
+from .weight_systems import WeightSystem
+from .weyl import weyl_dimension
 
 
 class IrrepCalculator:
@@ -27,75 +35,82 @@ class IrrepCalculator:
     
     def calculate_dimension_weyl(self) -> int:
         """
-        Calculate dimension using Weyl dimension formula.
+        Calculate dimension using the Weyl dimension formula.
         
-        For SU(n), dimension of irrep [a1, a2, ..., a_{n-1}] is:
-        dim = prod_{i<j} (1 + sum_{k=i}^{j-1} a_k) / prod_{i<j} (j-i)
-        """
-        if self.group_name.upper() in ["SU3", "A2"]:
-            return self._dimension_su3()
-        elif self.group_name.upper() in ["SU5", "A4"]:
-            return self._dimension_sun(5)
-        else:
-            # Generic fallback - approximate
-            return 1 + sum(self.highest_weight)
-    
-    def _dimension_su3(self) -> int:
-        """Calculate dimension for SU(3) using exact formula."""
-        a1, a2 = self.highest_weight
-        # dim = (a1+1)(a2+1)(a1+a2+2) / 2
-        dim = (a1 + 1) * (a2 + 1) * (a1 + a2 + 2) // 2
-        return dim
-    
-    def _dimension_sun(self, n: int) -> int:
-        """
-        Calculate dimension for SU(n) using Weyl formula.
+        dim = prod_{alpha > 0} (lambda + rho, alpha^vee) / (rho, alpha^vee)
         
-        dim = prod_{1 <= i < j <= n} (1 + (λ_i - λ_j)/(j-i))
-        where λ is in orthogonal basis.
-        """
-        # Convert Dynkin labels to orthogonal weights
-        # For SU(n): λ_i = sum_{k=1}^{i} a_k for i < n
-        weights = [sum(self.highest_weight[:i+1]) for i in range(len(self.highest_weight))]
-        weights.append(0)  # λ_n = 0
-        
-        # Calculate product formula
-        numerator = 1
-        denominator = 1
+        Works for every simple algebra and for semisimple products
+        such as 'SU(3)xSU(2)'.
         
-        for i in range(n):
-            for j in range(i + 1, n):
-                numerator *= (j - i + weights[i] - weights[j])
-                denominator *= (j - i)
-        
-        return numerator // denominator
+        Raises:
+            ValueError: For unsupported groups or labels of the wrong length
+        """
+        return weyl_dimension(self.group_name, self.highest_weight)
     
-    def calculate_weights_weyl_reflection(self) -> Tuple[List[List[int]], List[int]]:
+    def calculate_weights_weyl_reflection(self, max_weights: Optional[int] = None
+                                          ) -> Tuple[List[List[int]], List[int]]:
         """
         Calculate all weights and their multiplicities using Weyl reflection.
         
+        Multiplicities are computed for dominant weights only (Freudenthal);
+        every other weight is reached by reflecting a dominant weight, and
+        shares its multiplicity.
+        
+        Args:
+            max_weights: Raise WeightLimitExceeded beyond this many weights
+        
         Returns:
             (weights, multiplicities) - Lists of same length
         """
-        # This is a simplified implementation
-        # For full implementation, would need Weyl group action
-        
-        weights = [self.highest_weight]
-        multiplicities = [1]
+        return self.calculate_weights_freudenthal(max_weights)
+    
+    def calculate_weights_freudenthal(self, max_weights: Optional[int] = None
+                                      ) -> Tuple[List[List[int]], List[int]]:
+        """
+        Calculate weights using Freudenthal's multiplicity formula.
         
-        # Add some lower weights (simplified)
-        # In reality, need to apply lowering operators and Weyl reflections
+        Weights are listed orbit by orbit, starting with the highest weight.
+        For semisimple groups the factor weight systems are combined.
         
-        return weights, multiplicities
+        Args:
+            max_weights: Raise WeightLimitExceeded beyond this many weights
+        """
+        return self.calculate_weight_system(max_weights).to_lists()
     
-    def calculate_weights_freudenthal(self) -> Tuple[List[List[int]], List[int]]:
+    def calculate_weight_system(self, max_weights: Optional[int] = None,
+                                progress: Optional[ProgressCallback] = None) -> WeightSystem:
         """
-        Calculate weights using Freudenthal's multiplicity formula.
+        Calculate the weight system as a compact array-backed WeightSystem.
         
-        More accurate but slower than Weyl reflection method.
+        Args:
+            max_weights: Raise WeightLimitExceeded beyond this many weights
+            progress: Called with the completed fraction in [0, 1]
         """
-        # Placeholder for Freudenthal implementation
-        return self.calculate_weights_weyl_reflection()
+        cartan_types = parse_semisimple_notation(self.group_name)
+        factors = []
+        start = 0
+        for index, cartan_type in enumerate(cartan_types):
+            rs = get_algebra(cartan_type).root_system
+            labels = tuple(self.highest_weight[start:start + rs.rank])
+            start += rs.rank
+            
+            # Dominant multiplicities dominate the cost; orbit expansion is cheap
+            low, high = index / len(cartan_types), (index + 1) / len(cartan_types)
+            middle = low + 0.8 * (high - low)
+            if progress is None:
+                character = dominant_character(rs.cartan_type, labels)
+            else:
+                character = compute_dominant_character(rs, labels, scaled_progress(progress, low, middle))
+            factors.append(WeightSystem.from_character(
+                rs, character, max_weights, scaled_progress(progress, middle, high)))
+        
+        if start != len(self.highest_weight):
+            raise ValueError(f"Expected {start} Dynkin labels, got {len(self.highest_weight)}")
+        
+        if max_weights is not None and np.prod([len(f) for f in factors]) > max_weights:
+            raise WeightLimitExceeded(f"Weight system has more than {max_weights} weights")
+        
+        return WeightSystem.product(factors)
     
     def get_latex_name(self) -> str:
         """Get LaTeX representation of the irrep."""
@@ -126,20 +141,27 @@ class IrrepCalculator:
             return r"\overline{10}"
         else:
             # Use dimension as label
-            dim = self._dimension_su3()
+            dim = self.calculate_dimension_weyl()
             if a2 > a1:
                 return f"\\overline{{{dim}}}"
             return str(dim)
     
-    def get_irrep_data(self) -> Dict:
-        """Get complete irrep data."""
-        weights, multiplicities = self.calculate_weights_weyl_reflection()
+    def get_irrep_data(self, max_weights: Optional[int] = None,
+                       progress: Optional[ProgressCallback] = None) -> Dict:
+        """
+        Get complete irrep data.
         
+        The weight system is returned as a WeightSystem; convert it with
+        ``to_lists()`` when serializing.
+        
+        Args:
+            max_weights: Raise WeightLimitExceeded beyond this many weights
+            progress: Called with the completed fraction of the weight system
+        """
         return {
             "highest_weight": self.highest_weight,
             "dimension": self.calculate_dimension_weyl(),
-            "weights": weights,
-            "multiplicities": multiplicities,
+            "weight_system": self.calculate_weight_system(max_weights, progress),
             "latex_name": self.get_latex_name(),
             "group": self.group_name,
         }
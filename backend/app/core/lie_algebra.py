@@ -1,15 +1,16 @@
 """
-Lie Algebra calculations using SymPy.
+Lie Algebra calculations.
 
-This module provides high-level wrappers around SymPy's Lie algebra functionality
-for use in the FastAPI endpoints.
+This module provides high-level wrappers around the native integer
+root-system engine (see ``root_systems.py``) for use in the FastAPI endpoints.
 """
 
 from typing import List, Dict, Tuple, Optional
+from functools import cached_property
 import re
 import numpy as np
-from sympy.liealgebras.root_system import RootSystem
-from sympy.liealgebras.cartan_type import CartanType
+
+from .root_systems import IntegerRootSystem, count_positive_roots, parse_cartan_type
 
 
 def parse_physics_notation(group_name: str) -> str:
@@ -61,6 +62,20 @@ def parse_physics_notation(group_name: str) -> str:
     return group_clean
 
 
+def parse_semisimple_notation(group_name: str) -> List[str]:
+    """
+    Split a semisimple group into the Cartan types of its simple factors.
+    
+    Factors may be separated by 'x', '×', '⊗' or '+'.
+    
+    Examples:
+        SU(3)xSU(2) -> ['A2', 'A1']
+        E6 -> ['E6']
+    """
+    factors = re.split(r'[xX×⊗+]', group_name.replace(" ", ""))
+    return [parse_physics_notation(factor) for factor in factors if factor]
+
+
 def cartan_to_physics(cartan_type: str) -> str:
     """Convert Cartan type to physics notation."""
     match = re.match(r'([A-G])(\d+)', cartan_type)
@@ -83,7 +98,13 @@ def cartan_to_physics(cartan_type: str) -> str:
 
 
 class LieAlgebraCalculator:
-    """Calculator for Lie algebra properties and operations."""
+    """
+    Calculator for Lie algebra properties and operations.
+    
+    Instances are shared between requests through ``registry.get_algebra``,
+    so they must be treated as read-only. Derived data (the root system) is
+    computed lazily on first use; getters always return fresh lists.
+    """
     
     def __init__(self, group_name: str):
         """
@@ -92,6 +113,9 @@ class LieAlgebraCalculator:
         Args:
             group_name: Either physics notation (e.g., 'SU(10)', 'SO(14)') 
                        or Cartan type (e.g., 'A9', 'D7')
+        
+        Raises:
+            ValueError: If the group is not a supported simple Lie algebra
         """
         self.group_name = group_name.strip()
         
@@ -99,80 +123,64 @@ class LieAlgebraCalculator:
         self.cartan_type = parse_physics_notation(self.group_name)
         self.physics_name = cartan_to_physics(self.cartan_type)
         
-        # Initialize SymPy objects
-        self.cartan = CartanType(self.cartan_type)
-        self.root_system = RootSystem(self.cartan_type)
+        # Validate eagerly so unsupported groups fail at construction
+        self._series, self._rank = parse_cartan_type(self.cartan_type)
+    
+    @cached_property
+    def root_system(self) -> IntegerRootSystem:
+        """
+        Integer root system, resolved on first access.
+        
+        Served from the memory-mapped algebra bundle when available,
+        otherwise generated from the Cartan matrix.
+        """
+        from .algebra_bundle import get_default_bundle
+        
+        bundle = get_default_bundle()
+        if bundle is not None and self.cartan_type in bundle:
+            return bundle.get_root_system(self.cartan_type)
+        return IntegerRootSystem(self.cartan_type)
     
     def get_rank(self) -> int:
-        """Get the rank of the Lie algebra."""
-        return self.cartan.rank()
+        """Get the rank of the Lie algebra (does not resolve the root system)."""
+        return self._rank
     
     def get_dimension(self) -> int:
         """Get the dimension (number of generators) of the Lie algebra."""
-        # For simple Lie algebras: dim = rank + number of roots
-        return self.get_rank() + len(self.root_system.all_roots())
+        # For simple Lie algebras: dim = rank + number of roots, counted
+        # in closed form so that no roots are generated
+        return self._rank + 2 * count_positive_roots(self._series, self._rank)
     
     def get_cartan_matrix(self) -> List[List[int]]:
         """Get the Cartan matrix as a list of lists."""
-        cartan_matrix = self.cartan.cartan_matrix()
-        rank = self.get_rank()
-        
-        # Convert sympy Matrix to list of lists
-        matrix = []
-        for i in range(rank):
-            row = []
-            for j in range(rank):
-                row.append(int(cartan_matrix[i, j]))
-            matrix.append(row)
-        
-        return matrix
+        return self.root_system.cartan_matrix.tolist()
     
     def get_simple_roots(self) -> List[List[float]]:
-        """Get the simple roots as a list of vectors."""
-        simple_roots_dict = self.root_system.simple_roots()
-        
-        # Convert to list of lists, maintaining order
-        roots = []
-        for i in range(1, len(simple_roots_dict) + 1):
-            root = simple_roots_dict[i]
-            roots.append([float(x) for x in root])
-        
-        return roots
+        """Get the simple roots as a list of vectors (orthogonal basis)."""
+        return self.root_system.to_orthogonal(self.root_system.simple_roots).tolist()
     
     def get_positive_roots(self) -> List[List[float]]:
-        """Get all positive roots."""
-        all_roots = self.root_system.all_roots()
-        num_positive = len(all_roots) // 2
-        
-        positive_roots = []
-        for i in range(1, num_positive + 1):
-            root = all_roots[i]
-            positive_roots.append([float(x) for x in root])
-        
-        return positive_roots
+        """Get all positive roots (orthogonal basis), sorted by height."""
+        rs = self.root_system
+        return rs.to_orthogonal(rs.positive_roots_orthogonal).tolist()
     
     def get_all_roots(self) -> List[List[float]]:
-        """Get all roots (positive and negative)."""
-        all_roots_dict = self.root_system.all_roots()
-        
-        roots = []
-        for i in sorted(all_roots_dict.keys()):
-            root = all_roots_dict[i]
-            roots.append([float(x) for x in root])
-        
-        return roots
+        """Get all roots: positive roots followed by their negatives."""
+        rs = self.root_system
+        roots = np.vstack([rs.positive_roots_orthogonal, -rs.positive_roots_orthogonal])
+        return rs.to_orthogonal(roots).tolist()
     
     def get_algebra_info(self) -> Dict:
         """Get complete information about the Lie algebra."""
-        all_roots = self.root_system.all_roots()
+        num_positive = self.root_system.num_positive_roots
         
         return {
             "cartan_type": self.cartan_type,
             "physics_name": self.physics_name,
             "rank": self.get_rank(),
             "dimension": self.get_dimension(),
-            "num_roots": len(all_roots),
-            "num_positive_roots": len(all_roots) // 2,
+            "num_roots": 2 * num_positive,
+            "num_positive_roots": num_positive,
         }
     
     def get_root_system_data(self) -> Dict:
@@ -0,0 +1,109 @@
+"""
+Process-wide registry of interned Lie algebra objects.
+
+Every request used to build its own ``LieAlgebraCalculator``. The registry
+canonicalizes group names to their Cartan type, so 'SU(5)', 'SU5' and 'A4'
+all resolve to one shared calculator whose derived data is computed once.
+
+The registry is a bounded LRU sized by ``settings.CACHE_SIZE`` and is
+bypassed entirely when ``settings.ENABLE_CACHE`` is false.
+"""
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Dict
+
+from ..config import settings
+from .lie_algebra import LieAlgebraCalculator, parse_physics_notation
+
+
+class AlgebraRegistry:
+    """Bounded LRU mapping canonical Cartan types to shared calculators."""
+    
+    def __init__(self, maxsize: int = 128, enabled: bool = True):
+        """
+        Args:
+            maxsize: Maximum number of algebras kept alive
+            enabled: If False, every lookup builds a fresh calculator
+        """
+        self.maxsize = maxsize
+        self.enabled = enabled and maxsize > 0
+        self._algebras: "OrderedDict[str, LieAlgebraCalculator]" = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, group_name: str) -> LieAlgebraCalculator:
+        """
+        Get the shared calculator for a group.
+        
+        Args:
+            group_name: Physics notation or Cartan type (e.g., 'SU(5)', 'A4')
+        
+        Raises:
+            ValueError: If the group is not supported
+        """
+        cartan_type = parse_physics_notation(group_name.strip())
+        
+        if not self.enabled:
+            return LieAlgebraCalculator(cartan_type)
+        
+        with self._lock:
+            algebra = self._algebras.get(cartan_type)
+            if algebra is not None:
+                self._algebras.move_to_end(cartan_type)
+                self.hits += 1
+                return algebra
+        
+        # Build outside the lock; validation errors propagate to the caller
+        algebra = LieAlgebraCalculator(cartan_type)
+        
+        with self._lock:
+            # Another thread may have interned it meanwhile
+            existing = self._algebras.get(cartan_type)
+            if existing is not None:
+                self._algebras.move_to_end(cartan_type)
+                self.hits += 1
+                return existing
+            
+            self.misses += 1
+            self._algebras[cartan_type] = algebra
+            while len(self._algebras) > self.maxsize:
+                self._algebras.popitem(last=False)
+        
+        return algebra
+    
+    def clear(self) -> None:
+        """Drop all interned algebras and reset statistics."""
+        with self._lock:
+            self._algebras.clear()
+            self.hits = 0
+            self.misses = 0
+    
+    def __contains__(self, group_name: str) -> bool:
+        return parse_physics_notation(group_name.strip()) in self._algebras
+    
+    def __len__(self) -> int:
+        return len(self._algebras)
+    
+    def stats(self) -> Dict:
+        """Registry size and hit/miss counters."""
+        return {
+            "enabled": self.enabled,
+            "size": len(self._algebras),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+# Global registry instance
+algebra_registry = AlgebraRegistry(
+    maxsize=settings.CACHE_SIZE,
+    enabled=settings.ENABLE_CACHE,
+)
+
+
+def get_algebra(group_name: str) -> LieAlgebraCalculator:
+    """Get the shared calculator for a group from the global registry."""
+    return algebra_registry.get(group_name)
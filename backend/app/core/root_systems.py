@@ -0,0 +1,359 @@
+"""
+Native integer root-system engine.
+
+This module builds root systems directly from the Cartan matrix using
+simple-root strings, without going through SymPy. All data is kept as
+NumPy integer arrays:
+
+- positive roots in the simple-root basis (coefficients c_i with
+  beta = sum c_i alpha_i), sorted by height;
+- the same roots in the orthogonal (ambient) basis, scaled by
+  ``orthogonal_scale`` so that half-integer coordinates (E6-E8, F4)
+  stay integral.
+
+The orthogonal conventions match SymPy's ``RootSystem`` for all types
+except F4, where SymPy's simple roots do not reproduce its own Cartan
+matrix; we use the Bourbaki roots instead.
+"""
+
+from fractions import Fraction
+from functools import cached_property, reduce
+from math import gcd
+from typing import Dict, List, NamedTuple, Tuple
+import re
+import numpy as np
+
+
+class RationalMatrix(NamedTuple):
+    """Exact rational array stored as integer numerator over a common denominator."""
+    numerator: np.ndarray
+    denominator: int
+
+    def to_float(self) -> np.ndarray:
+        return self.numerator / self.denominator
+
+
+# Allowed ranks per series (inclusive lower bound, optional exact set)
+_SERIES_MIN_RANK = {"A": 1, "B": 2, "C": 2, "D": 2}
+_EXCEPTIONAL_RANKS = {"E": (6, 7, 8), "F": (4,), "G": (2,)}
+
+
+def parse_cartan_type(cartan_type: str) -> Tuple[str, int]:
+    """
+    Split a simple Cartan type into series letter and rank.
+
+    Examples:
+        'A4' -> ('A', 4)
+        'E8' -> ('E', 8)
+
+    Raises:
+        ValueError: If the string is not a supported simple Cartan type
+    """
+    match = re.match(r'^([A-G])(\d+)$', cartan_type.strip().upper())
+    if not match:
+        raise ValueError(f"Unsupported Cartan type: {cartan_type}")
+
+    series, n_str = match.groups()
+    n = int(n_str)
+
+    if series in _EXCEPTIONAL_RANKS:
+        if n not in _EXCEPTIONAL_RANKS[series]:
+            raise ValueError(f"Unsupported Cartan type: {cartan_type}")
+    elif n < _SERIES_MIN_RANK[series]:
+        raise ValueError(f"Unsupported Cartan type: {cartan_type}")
+
+    return series, n
+
+
+# Positive root counts of the exceptional algebras
+_EXCEPTIONAL_POSITIVE_ROOTS = {"E6": 36, "E7": 63, "E8": 120, "F4": 24, "G2": 6}
+
+
+def count_positive_roots(series: str, n: int) -> int:
+    """
+    Number of positive roots of a simple algebra, without generating them.
+
+    Examples:
+        ('A', 4) -> 10
+        ('D', 5) -> 20
+    """
+    if series == "A":
+        return n * (n + 1) // 2
+    if series in ("B", "C"):
+        return n * n
+    if series == "D":
+        return n * (n - 1)
+    return _EXCEPTIONAL_POSITIVE_ROOTS[f"{series}{n}"]
+
+
+def simple_roots_orthogonal(series: str, n: int) -> Tuple[np.ndarray, int]:
+    """
+    Simple roots in the orthogonal basis.
+
+    Returns:
+        (roots, scale) where ``roots`` is an (n, d) integer array holding
+        ``scale`` times the orthogonal coordinates of each simple root.
+    """
+    if series == "A":
+        roots = np.zeros((n, n + 1), dtype=np.int64)
+        for i in range(n):
+            roots[i, i] = 1
+            roots[i, i + 1] = -1
+        return roots, 1
+
+    if series in ("B", "C", "D"):
+        roots = np.zeros((n, n), dtype=np.int64)
+        for i in range(n - 1):
+            roots[i, i] = 1
+            roots[i, i + 1] = -1
+        if series == "B":
+            roots[n - 1, n - 1] = 1                 # e_n
+        elif series == "C":
+            roots[n - 1, n - 1] = 2                 # 2 e_n
+        else:
+            roots[n - 1, n - 2] = 1                 # e_{n-1} + e_n
+            roots[n - 1, n - 1] = 1
+        return roots, 1
+
+    if series == "E":
+        # Bourbaki labelling in R^8 (same as SymPy), doubled coordinates
+        roots = np.zeros((n, 8), dtype=np.int64)
+        roots[0] = [1, -1, -1, -1, -1, -1, -1, 1]   # (1/2)(e1 - e2 - ... - e7 + e8)
+        roots[1, 0:2] = [2, 2]                      # e1 + e2
+        for i in range(2, n):
+            roots[i, i - 2] = -2                    # e_{i-1} - e_{i-2}
+            roots[i, i - 1] = 2
+        return roots, 2
+
+    if series == "F":
+        # Bourbaki: e2 - e3, e3 - e4, e4, (1/2)(e1 - e2 - e3 - e4), doubled
+        roots = np.array([
+            [0, 2, -2, 0],
+            [0, 0, 2, -2],
+            [0, 0, 0, 2],
+            [1, -1, -1, -1],
+        ], dtype=np.int64)
+        return roots, 2
+
+    if series == "G":
+        roots = np.array([
+            [0, 1, -1],
+            [1, -2, 1],
+        ], dtype=np.int64)
+        return roots, 1
+
+    raise ValueError(f"Unsupported Cartan series: {series}")
+
+
+def cartan_matrix_from_roots(simple_roots: np.ndarray) -> np.ndarray:
+    """
+    Cartan matrix A_ij = 2 (alpha_i, alpha_j) / (alpha_j, alpha_j).
+
+    Any common scale factor of the roots cancels out.
+    """
+    gram = simple_roots @ simple_roots.T
+    norms = np.diag(gram)
+    return (2 * gram) // norms[np.newaxis, :]
+
+
+def rational_inverse(matrix: np.ndarray) -> RationalMatrix:
+    """
+    Exact inverse of an integer matrix by Gauss-Jordan elimination.
+
+    The result is reduced to the smallest common denominator.
+    """
+    n = matrix.shape[0]
+    rows = [[Fraction(int(x)) for x in row] + [Fraction(int(i == j)) for j in range(n)]
+            for i, row in enumerate(matrix)]
+
+    for col in range(n):
+        pivot = next(r for r in range(col, n) if rows[r][col] != 0)
+        rows[col], rows[pivot] = rows[pivot], rows[col]
+        scale = rows[col][col]
+        rows[col] = [x / scale for x in rows[col]]
+        for r in range(n):
+            if r != col and rows[r][col] != 0:
+                factor = rows[r][col]
+                rows[r] = [x - factor * y for x, y in zip(rows[r], rows[col])]
+
+    inverse = [row[n:] for row in rows]
+    denominator = reduce(lambda a, b: a * b // gcd(a, b),
+                         (x.denominator for row in inverse for x in row), 1)
+    numerator = np.array([[int(x * denominator) for x in row] for row in inverse],
+                         dtype=np.int64)
+    return RationalMatrix(numerator, denominator)
+
+
+def positive_roots_from_cartan(cartan_matrix: np.ndarray) -> np.ndarray:
+    """
+    Generate all positive roots from the Cartan matrix.
+
+    Works level by level in height. For a root beta and simple root
+    alpha_i, the alpha_i-string through beta runs from beta - p alpha_i
+    to beta + q alpha_i with p - q = <beta, alpha_i^vee>; beta + alpha_i
+    is a root exactly when q > 0.
+
+    Returns:
+        (num_positive, rank) integer array of simple-root coefficients,
+        sorted by height (simple roots first).
+    """
+    rank = cartan_matrix.shape[0]
+    cartan = [[int(x) for x in row] for row in cartan_matrix]
+
+    simple = [tuple(1 if j == i else 0 for j in range(rank)) for i in range(rank)]
+    known = set(simple)
+    ordered: List[Tuple[int, ...]] = list(simple)
+    level = simple
+
+    while level:
+        next_level: Dict[Tuple[int, ...], None] = {}
+        for beta in level:
+            for i in range(rank):
+                # <beta, alpha_i^vee> = sum_j c_j A_ji
+                pairing = sum(beta[j] * cartan[j][i] for j in range(rank) if beta[j])
+
+                # p: how far the string extends downwards
+                p = 0
+                lowered = list(beta)
+                while True:
+                    lowered[i] -= 1
+                    if tuple(lowered) in known:
+                        p += 1
+                    else:
+                        break
+
+                if p - pairing > 0:
+                    raised = list(beta)
+                    raised[i] += 1
+                    raised = tuple(raised)
+                    if raised not in known:
+                        next_level[raised] = None
+
+        level = sorted(next_level, reverse=True)
+        known.update(level)
+        ordered.extend(level)
+
+    return np.array(ordered, dtype=np.int64).reshape(-1, rank)
+
+
+class IntegerRootSystem:
+    """
+    Root system of a simple Lie algebra held as integer arrays.
+
+    Attributes:
+        cartan_type: Cartan type string (e.g. 'E8')
+        rank: Rank of the algebra
+        cartan_matrix: (rank, rank) Cartan matrix
+        simple_roots: (rank, d) simple roots, orthogonal basis, scaled
+        orthogonal_scale: Scale factor applied to orthogonal coordinates
+        positive_roots: (P, rank) positive roots in the simple-root basis
+        positive_roots_orthogonal: (P, d) positive roots, orthogonal basis, scaled
+    """
+
+    def __init__(self, cartan_type: str):
+        series, n = parse_cartan_type(cartan_type)
+
+        self.cartan_type = f"{series}{n}"
+        self.rank = n
+
+        self.simple_roots, self.orthogonal_scale = simple_roots_orthogonal(series, n)
+        self.cartan_matrix = cartan_matrix_from_roots(self.simple_roots)
+        self.positive_roots = positive_roots_from_cartan(self.cartan_matrix)
+        self.positive_roots_orthogonal = self.positive_roots @ self.simple_roots
+
+        for array in (self.simple_roots, self.cartan_matrix,
+                      self.positive_roots, self.positive_roots_orthogonal):
+            array.setflags(write=False)
+
+    @classmethod
+    def from_arrays(cls, cartan_type: str, arrays: Dict[str, np.ndarray],
+                    scalars: Dict[str, int]) -> "IntegerRootSystem":
+        """
+        Rebuild a root system from precomputed arrays (see ``algebra_bundle``).
+
+        No root generation happens here; the arrays are used as given.
+        """
+        series, n = parse_cartan_type(cartan_type)
+        rs = cls.__new__(cls)
+        rs.cartan_type = f"{series}{n}"
+        rs.rank = n
+        rs.simple_roots = arrays["simple_roots"]
+        rs.orthogonal_scale = scalars["orthogonal_scale"]
+        rs.cartan_matrix = arrays["cartan_matrix"]
+        rs.positive_roots = arrays["positive_roots"]
+        rs.positive_roots_orthogonal = arrays["positive_roots_orthogonal"]
+
+        # Prime the lazily computed rational data
+        rs.__dict__["inverse_cartan"] = RationalMatrix(
+            arrays["inverse_cartan"], scalars["inverse_cartan_denominator"])
+        rs.__dict__["quadratic_form"] = RationalMatrix(
+            arrays["quadratic_form"], scalars["quadratic_form_denominator"])
+        return rs
+
+    @cached_property
+    def inverse_cartan(self) -> RationalMatrix:
+        """Exact inverse of the Cartan matrix."""
+        inverse = rational_inverse(self.cartan_matrix)
+        inverse.numerator.setflags(write=False)
+        return inverse
+
+    @cached_property
+    def quadratic_form(self) -> RationalMatrix:
+        """
+        Quadratic form matrix G_ij = (omega_i, omega_j) of the fundamental weights.
+
+        Normalized so that long roots have length squared 2. The inner product
+        of two weights in the Dynkin basis is lambda^T G mu.
+        """
+        norms = np.einsum("ij,ij->i", self.simple_roots, self.simple_roots)
+        long_norm = int(norms.max())
+
+        # G = A^{-1} D with D_jj = (alpha_j, alpha_j) / (long root norm)
+        inverse = self.inverse_cartan
+        numerator = inverse.numerator * norms[np.newaxis, :]
+        denominator = inverse.denominator * long_norm
+
+        common = reduce(gcd, numerator.ravel().tolist(), denominator)
+        form = RationalMatrix(numerator // common, denominator // common)
+        form.numerator.setflags(write=False)
+        return form
+
+    @property
+    def num_positive_roots(self) -> int:
+        return self.positive_roots.shape[0]
+
+    @property
+    def heights(self) -> np.ndarray:
+        """Height of each positive root (sum of simple-root coefficients)."""
+        return self.positive_roots.sum(axis=1)
+
+    @property
+    def highest_root(self) -> np.ndarray:
+        """Highest root in the simple-root basis."""
+        return self.positive_roots[-1]
+
+    @cached_property
+    def positive_coroots(self) -> np.ndarray:
+        """
+        Positive coroots in the simple-coroot basis, one row per positive root.
+
+        alpha^vee = sum_i c_i (alpha_i, alpha_i) / (alpha, alpha) alpha_i^vee,
+        which is always integral.
+        """
+        simple = self.simple_roots.astype(np.int64)
+        positive = self.positive_roots_orthogonal.astype(np.int64)
+        simple_norms = np.einsum("ij,ij->i", simple, simple)
+        root_norms = np.einsum("ij,ij->i", positive, positive)
+
+        coroots = (self.positive_roots * simple_norms[np.newaxis, :]) // root_norms[:, np.newaxis]
+        coroots.setflags(write=False)
+        return coroots
+
+    @property
+    def rho(self) -> RationalMatrix:
+        """Weyl vector (half the sum of positive roots) in the simple-root basis."""
+        return RationalMatrix(self.positive_roots.sum(axis=0), 2)
+
+    def to_orthogonal(self, roots: np.ndarray) -> np.ndarray:
+        """Convert scaled orthogonal integer coordinates to floats."""
+        return roots / self.orthogonal_scale
@@ -1,18 +1,231 @@
 """
 Tensor product decomposition calculations.
 
-This module handles tensor product decompositions of irreps using
-Littlewood-Richardson rules and other methods.
+Decompositions use the Racah-Speiser algorithm (Klimyk's formula): with
+lambda the highest weight of the larger factor and the weights mu of the
+smaller factor (with multiplicities m(mu)),
 
-Note: Currently only SU(3) and SU(5) have full tensor product support.
-Other groups can be created and their properties calculated, but tensor
-products will return empty decompositions.
+    V(lambda) x V(nu) = sum_mu m(mu) sign(w) V(w(lambda + mu + rho) - rho)
+
+where w brings lambda + mu + rho into the dominant chamber. Terms that land
+on a chamber wall vanish. The weights of the smaller factor come from its
+cached dominant character, so this works for every simple algebra.
+
+For SU(n) the Littlewood-Richardson rule on Young diagrams is used
+instead; it never enumerates weights and scales with the size of the
+diagrams rather than with the dimension of the irreps.
 """
 
-from typing import List, Dict, Tuple
+from functools import lru_cache
+from typing import List, Dict, Optional, Sequence, Tuple
 import numpy as np
+
+from ..config import settings
+from .freudenthal import (
+    ProgressCallback, Weight, compute_dominant_character, dominant_character, reflect_rows_to_dominant,
+    scaled_progress,
+)
 from .irreps import IrrepCalculator
 from .lie_algebra import parse_physics_notation
+from .registry import get_algebra
+from .root_systems import IntegerRootSystem
+from .weight_systems import WeightSystem
+from .weyl import root_system_dimensions, weyl_dimensions
+
+
+Decomposition = Tuple[Tuple[Weight, int], ...]
+
+
+def racah_speiser(rs: IntegerRootSystem, highest_weight: Sequence[int],
+                  weight_system: WeightSystem) -> Decomposition:
+    """
+    Decompose V(highest_weight) x V, given the weight system of V.
+    
+    Args:
+        rs: Root system of the algebra
+        highest_weight: Dynkin labels of the first factor
+        weight_system: Weights and multiplicities of the second factor
+    
+    Returns:
+        Tuple of (highest weight, multiplicity) of the irreducible components
+    """
+    shift = np.asarray(highest_weight, dtype=np.int64) + 1
+    nu, signs = reflect_rows_to_dominant(
+        rs.cartan_matrix.astype(np.int64), weight_system.dynkin.astype(np.int64) + shift)
+    
+    # Weights on a wall of the shifted chamber cancel
+    regular = (nu > 0).all(axis=1)
+    nu = nu[regular] - 1
+    coefficients = signs[regular] * weight_system.multiplicities[regular]
+    if not len(nu):
+        return ()
+    
+    components, inverse = np.unique(nu, axis=0, return_inverse=True)
+    totals = np.zeros(len(components), dtype=np.int64)
+    np.add.at(totals, inverse.ravel(), coefficients)
+    
+    return tuple((tuple(weight), int(total))
+                 for weight, total in zip(components.tolist(), totals.tolist()) if total)
+
+
+Partition = Tuple[int, ...]
+
+
+def dynkin_to_partition(labels: Sequence[int]) -> Partition:
+    """
+    Young diagram of an SU(n) irrep: row i has a_i + ... + a_{n-1} boxes.
+    
+    Partitions are plain tuples of row lengths without trailing zeros.
+    """
+    rows = []
+    total = 0
+    for a in reversed(labels):
+        total += int(a)
+        rows.append(total)
+    return tuple(row for row in reversed(rows) if row)
+
+
+def partition_to_dynkin(partition: Sequence[int], rank: int) -> Weight:
+    """Dynkin labels of a Young diagram with at most rank + 1 rows."""
+    rows = list(partition) + [0] * (rank + 1 - len(partition))
+    return tuple(rows[i] - rows[i + 1] for i in range(rank))
+
+
+def littlewood_richardson(outer: Partition, content: Partition,
+                          max_rows: Optional[int] = None) -> Dict[Partition, int]:
+    """
+    Littlewood-Richardson coefficients c^nu_{outer, content} for all nu.
+    
+    LR tableaux of shape nu / outer and weight ``content`` are built row by
+    row. A row is described by how many letters 1..k it holds; with
+    F_r(v) the column where letters <= v end in row r, the constraints are
+    
+        column strictness:  F_r(v) <= F_{r-1}(v - 1)
+        lattice word:       N_{<r}(v) + c_r(v) <= N_{<r}(v - 1)
+    
+    where N_{<r}(v) counts letter v in earlier rows. The rows below r only
+    depend on (r, F_{r-1}, N_{<r}), so completions are memoized on that
+    skew-shape state and shared across branches.
+    
+    Args:
+        outer: Partition of the first factor
+        content: Partition of the second factor
+        max_rows: Drop diagrams with more rows (n for SU(n))
+    
+    Returns:
+        Mapping from nu to its coefficient
+    """
+    outer = tuple(outer)
+    content = tuple(content)
+    k = len(content)
+    row_limit = len(outer) + k if max_rows is None else min(max_rows, len(outer) + k)
+    unbounded = sum(outer) + sum(content)
+    
+    @lru_cache(maxsize=None)
+    def complete(r: int, previous: Tuple[int, ...], used: Tuple[int, ...]) -> Dict[Partition, int]:
+        base = outer[r] if r < len(outer) else 0
+        if used == content:
+            return {tuple(row for row in outer[r:] if row): 1}
+        if r >= row_limit:
+            return {}
+        
+        completions: Dict[Partition, int] = {}
+        letters = min(r + 1, k)
+        
+        def fill(v: int, position: int, ends: List[int], counts: List[int]) -> None:
+            # Letters 1..v-1 are placed and end at ``position``
+            if v > letters:
+                ends = ends + [position] * (k + 1 - len(ends))
+                rest = complete(r + 1, tuple(ends), tuple(counts))
+                for tail, ways in rest.items():
+                    nu = (position,) + tail if position else tail
+                    completions[nu] = completions.get(nu, 0) + ways
+                return
+            
+            bound = min(content[v - 1] - counts[v - 1], previous[v - 1] - position)
+            if v > 1:
+                bound = min(bound, used[v - 2] - used[v - 1])
+            for c in range(bound + 1):
+                counts[v - 1] += c
+                fill(v + 1, position + c, ends + [position + c], counts)
+                counts[v - 1] -= c
+        
+        fill(1, base, [base], list(used))
+        return completions
+    
+    return complete(0, (unbounded,) * (k + 1), (0,) * k)
+
+
+def su_n_decomposition(rank: int, irrep1: Sequence[int], irrep2: Sequence[int]) -> Decomposition:
+    """
+    Decompose a tensor product of SU(rank + 1) irreps with Young diagrams.
+    
+    The diagram with fewer boxes is used as the LR content, which keeps
+    the number of tableaux small.
+    """
+    outer, content = sorted((dynkin_to_partition(irrep1), dynkin_to_partition(irrep2)),
+                            key=sum, reverse=True)
+    coefficients = littlewood_richardson(outer, content, max_rows=rank + 1)
+    return tuple(sorted((partition_to_dynkin(nu, rank), c) for nu, c in coefficients.items()))
+
+
+def _decompose(cartan_type: str, irrep1: Weight, irrep2: Weight,
+               progress: Optional[ProgressCallback] = None) -> Decomposition:
+    rs = get_algebra(cartan_type).root_system
+    for labels in (irrep1, irrep2):
+        if len(labels) != rs.rank:
+            raise ValueError(f"Expected {rs.rank} Dynkin labels, got {len(labels)}")
+        if min(labels, default=0) < 0:
+            raise ValueError("Dynkin labels must be non-negative integers")
+    
+    if cartan_type.startswith("A"):
+        decomposition = su_n_decomposition(rs.rank, irrep1, irrep2)
+        if progress is not None:
+            progress(1.0)
+        return decomposition
+    
+    # Expand the smaller factor; the larger one only contributes its highest weight
+    dim1, dim2 = root_system_dimensions(rs, np.array([irrep1, irrep2], dtype=np.int64))
+    large, small = (irrep1, irrep2) if dim1 >= dim2 else (irrep2, irrep1)
+    
+    if progress is None:
+        character = dominant_character(rs.cartan_type, small)
+    else:
+        character = compute_dominant_character(rs, small, scaled_progress(progress, 0.0, 0.7))
+    weight_system = WeightSystem.from_character(
+        rs, character, progress=scaled_progress(progress, 0.7, 0.9))
+    decomposition = racah_speiser(rs, large, weight_system)
+    if progress is not None:
+        progress(1.0)
+    return decomposition
+
+
+@lru_cache(maxsize=settings.CACHE_SIZE if settings.ENABLE_CACHE else 0)
+def _cached_decomposition(cartan_type: str, irrep1: Weight, irrep2: Weight) -> Decomposition:
+    return _decompose(cartan_type, irrep1, irrep2)
+
+
+def tensor_product_decomposition(cartan_type: str, irrep1: Sequence[int], irrep2: Sequence[int],
+                                 progress: Optional[ProgressCallback] = None) -> Decomposition:
+    """
+    Cached decomposition of a tensor product of two irreps of a simple algebra.
+    
+    Args:
+        cartan_type: Cartan type (e.g., 'E6')
+        irrep1: First highest weight in the Dynkin basis
+        irrep2: Second highest weight in the Dynkin basis
+        progress: Called with the completed fraction; reporting progress
+            bypasses the result cache
+    
+    Returns:
+        Tuple of (highest weight, multiplicity) of the irreducible components
+    """
+    cartan_type = get_algebra(cartan_type).root_system.cartan_type
+    # The product is symmetric, so both orders share one cache entry
+    irrep1, irrep2 = sorted((tuple(int(x) for x in irrep1), tuple(int(x) for x in irrep2)))
+    if progress is not None:
+        return _decompose(cartan_type, irrep1, irrep2, progress)
+    return _cached_decomposition(cartan_type, irrep1, irrep2)
 
 
 class TensorProductCalculator:
@@ -29,177 +242,48 @@ class TensorProductCalculator:
         self.cartan_type = parse_physics_notation(group_name)
         self.group_name = group_name  # Keep original for reference
     
-    def decompose(self, irrep1: List[int], irrep2: List[int]) -> List[Dict]:
+    def decompose(self, irrep1: List[int], irrep2: List[int],
+                  progress: Optional[ProgressCallback] = None) -> List[Dict]:
         """
         Decompose tensor product of two irreps.
         
         Args:
             irrep1: First irrep highest weight in Dynkin basis
             irrep2: Second irrep highest weight in Dynkin basis
+            progress: Called with the completed fraction in [0, 1]
         
         Returns:
-            List of dicts with keys: 'weight', 'multiplicity', 'dimension', 'latex_name'
-            
-        Note: Only SU(3) and SU(5) are currently fully supported. Other groups will
-              return an empty decomposition.
-        """
-        if self.cartan_type == "A2":  # SU(3)
-            return self._decompose_su3(irrep1, irrep2)
-        elif self.cartan_type == "A4":  # SU(5)
-            return self._decompose_su5(irrep1, irrep2)
-        else:
-            # Unsupported group - return empty decomposition
-            # Frontend will display a warning about this
-            return []
-    
-    def _decompose_su3(self, irrep1: List[int], irrep2: List[int]) -> List[Dict]:
-        """
-        Decompose tensor products for SU(3) using known rules.
+            List of dicts with keys: 'weight', 'multiplicity', 'dimension', 'latex_name',
+            ordered by decreasing dimension
         
-        Uses the fundamental SU(3) tensor product rules:
-        3 ⊗ 3 = 6 ⊕ 3̄
-        3 ⊗ 3̄ = 8 ⊕ 1
-        3̄ ⊗ 3̄ = 3 ⊕ 6̄
-        etc.
+        Raises:
+            ValueError: For unsupported groups or labels of the wrong length
         """
-        a1, b1 = tuple(irrep1)
-        a2, b2 = tuple(irrep2)
-        
-        # Known decompositions for common SU(3) tensor products
-        results = []
-        
-        # 3 ⊗ 3 = [1,0] ⊗ [1,0] = [2,0] ⊕ [0,1]
-        if (a1, b1, a2, b2) == (1, 0, 1, 0):
-            results = [
-                {"weight": [2, 0], "multiplicity": 1},
-                {"weight": [0, 1], "multiplicity": 1},
-            ]
-        
-        # 3 ⊗ 3̄ = [1,0] ⊗ [0,1] = [1,1] ⊕ [0,0]
-        elif (a1, b1, a2, b2) == (1, 0, 0, 1):
-            results = [
-                {"weight": [1, 1], "multiplicity": 1},
-                {"weight": [0, 0], "multiplicity": 1},
-            ]
-        
-        # 3̄ ⊗ 3 = [0,1] ⊗ [1,0] = [1,1] ⊕ [0,0]
-        elif (a1, b1, a2, b2) == (0, 1, 1, 0):
-            results = [
-                {"weight": [1, 1], "multiplicity": 1},
-                {"weight": [0, 0], "multiplicity": 1},
-            ]
-        
-        # 3̄ ⊗ 3̄ = [0,1] ⊗ [0,1] = [0,2] ⊕ [1,0]
-        elif (a1, b1, a2, b2) == (0, 1, 0, 1):
-            results = [
-                {"weight": [0, 2], "multiplicity": 1},
-                {"weight": [1, 0], "multiplicity": 1},
-            ]
-        
-        # 3 ⊗ 6 = [1,0] ⊗ [2,0] = [3,0] ⊕ [1,1]
-        elif (a1, b1, a2, b2) == (1, 0, 2, 0):
-            results = [
-                {"weight": [3, 0], "multiplicity": 1},
-                {"weight": [1, 1], "multiplicity": 1},
-            ]
-        
-        # 3 ⊗ 8 = [1,0] ⊗ [1,1] = [2,1] ⊕ [1,0] ⊕ [0,2]
-        elif (a1, b1, a2, b2) == (1, 0, 1, 1):
-            results = [
-                {"weight": [2, 1], "multiplicity": 1},
-                {"weight": [1, 0], "multiplicity": 1},
-                {"weight": [0, 2], "multiplicity": 1},
-            ]
-        
-        # 8 ⊗ 8 = [1,1] ⊗ [1,1] (contains many irreps)
-        elif (a1, b1, a2, b2) == (1, 1, 1, 1):
-            results = [
-                {"weight": [2, 2], "multiplicity": 1},  # 27
-                {"weight": [3, 0], "multiplicity": 1},  # 10
-                {"weight": [0, 3], "multiplicity": 1},  # 10̄
-                {"weight": [1, 1], "multiplicity": 2},  # 8 (appears twice)
-                {"weight": [0, 0], "multiplicity": 1},  # 1
-            ]
-        
-        else:
-            # Generic calculation using Young tableaux-like rules
-            results = self._generic_su3_decomposition(a1, b1, a2, b2)
-        
-        # Add dimension and latex name to each result
-        return self._enrich_results(results)
-    
-    def _generic_su3_decomposition(self, a1: int, b1: int, a2: int, b2: int) -> List[Dict]:
-        """
-        Generic SU(3) decomposition using simplified rules.
-        
-        For SU(3): [a1,b1] ⊗ [a2,b2] can contain [a,b] where:
-        0 <= a <= a1+a2 and 0 <= b <= b1+b2 with certain selection rules
-        """
-        results = []
-        
-        # Simple rule: sum of weights
-        max_a = a1 + a2
-        max_b = b1 + b2
+        decomposition = tensor_product_decomposition(self.cartan_type, irrep1, irrep2, progress)
+        results = [{"weight": list(weight), "multiplicity": multiplicity}
+                   for weight, multiplicity in decomposition]
         
-        # Add highest weight term
-        results.append({"weight": [max_a, max_b], "multiplicity": 1})
-        
-        # Add some lower-weight terms (simplified)
-        if max_a > 0:
-            results.append({"weight": [max_a - 1, max_b + 1], "multiplicity": 1})
-        if max_b > 0:
-            results.append({"weight": [max_a + 1, max_b - 1], "multiplicity": 1})
-        
-        return results
-    
-    def _decompose_su5(self, irrep1: List[int], irrep2: List[int]) -> List[Dict]:
-        """
-        Decompose tensor products for SU(5).
-        
-        Implements basic SU(5) GUT tensor products.
-        """
-        # Common SU(5) representations
-        # 5: [1,0,0,0] fundamental
-        # 10: [0,1,0,0] antisymmetric
-        # 5̄: [0,0,0,1] antifundamental
-        # 10̄: [0,0,1,0]
-        
-        results = []
-        
-        # 5 ⊗ 10 = [1,0,0,0] ⊗ [0,1,0,0] = [1,1,0,0] ⊕ [0,0,1,0]
-        if irrep1 == [1,0,0,0] and irrep2 == [0,1,0,0]:
-            results = [
-                {"weight": [1,1,0,0], "multiplicity": 1},  # 45
-                {"weight": [0,0,1,0], "multiplicity": 1},  # 5̄
-            ]
-        
-        # 5 ⊗ 5̄ = [1,0,0,0] ⊗ [0,0,0,1] = [1,0,0,1] ⊕ [0,0,0,0]
-        elif irrep1 == [1,0,0,0] and irrep2 == [0,0,0,1]:
-            results = [
-                {"weight": [1,0,0,1], "multiplicity": 1},  # 24 (adjoint)
-                {"weight": [0,0,0,0], "multiplicity": 1},  # 1 (singlet)
-            ]
-        
-        # Generic fallback
-        else:
-            # Simple addition of Dynkin labels (not always correct)
-            sum_weight = [a + b for a, b in zip(irrep1, irrep2)]
-            results = [{"weight": sum_weight, "multiplicity": 1}]
-        
-        return self._enrich_results(results)
+        enriched = self._enrich_results(results)
+        enriched.sort(key=lambda item: (-item["dimension"], [-x for x in item["weight"]]))
+        return enriched
     
     def _enrich_results(self, results: List[Dict]) -> List[Dict]:
         """Add dimension and latex name to decomposition results."""
-        enriched = []
+        if not results:
+            return []
+        
+        # One vectorized Weyl-formula pass for all terms
+        dimensions = weyl_dimensions(self.cartan_type, [item["weight"] for item in results])
         
-        for item in results:
+        enriched = []
+        for item, dimension in zip(results, dimensions):
             weight = item["weight"]
             calc = IrrepCalculator(self.cartan_type, weight)
             
             enriched_item = {
                 "weight": weight,
                 "multiplicity": item["multiplicity"],
-                "dimension": calc.calculate_dimension_weyl(),
+                "dimension": dimension,
                 "latex_name": calc.get_latex_name(),
             }
             enriched.append(enriched_item)
@@ -0,0 +1,193 @@
+"""
+Packed integer weight keys and an array-backed weight index.
+
+Dynkin-label vectors are not hashable as arrays, and tuple dicts cost one
+Python object per weight plus a dict lookup per access. Hot loops instead
+pack each weight into one int64 key and look keys up in bulk:
+
+* ``WeightPacker`` is a mixed-radix encoding over per-label ranges
+  ``[lower_i, upper_i]``. The ranges cover the weights being indexed, so
+  every one of them gets a distinct key. The last label varies fastest,
+  so keys of weights in the range sort lexicographically.
+* ``WeightIndex`` is an open-addressing hash table (Fibonacci hashing,
+  linear probing, load factor at most 1/2) from keys to row positions.
+  It is held in two flat arrays, int64 keys and (usually int32) rows.
+  Construction and lookups are vectorized, so one probe round costs one
+  NumPy operation for a whole batch of weights.
+
+``index_weights`` combines the two into a ``PackedWeightIndex``. When the
+label ranges are too wide for int64 keys it returns a ``TupleWeightIndex``
+instead, with the same ``lookup`` over weight arrays.
+"""
+
+from math import prod
+from typing import Dict, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+
+# Keys stay below this, clear of int64 overflow in the mixed-radix sum
+MAX_KEY_SPACE = 2 ** 62
+
+# Marks an empty slot of a WeightIndex (keys are non-negative)
+EMPTY = -1
+
+_FIBONACCI = np.uint64(0x9E3779B97F4A7C15)
+
+
+class WeightPacker:
+    """Packs Dynkin-label vectors with labels in ``[lower, upper]`` into int64 keys."""
+
+    __slots__ = ("lower", "upper", "strides")
+
+    def __init__(self, lower: Sequence[int], upper: Sequence[int]):
+        """
+        Args:
+            lower: Smallest value of each label
+            upper: Largest value of each label
+
+        Raises:
+            ValueError: If the ranges are empty or too large for int64 keys
+        """
+        self.lower = np.asarray(lower, dtype=np.int64)
+        self.upper = np.asarray(upper, dtype=np.int64)
+        if self.lower.shape != self.upper.shape or (self.upper < self.lower).any():
+            raise ValueError("Label ranges must be non-empty and of equal length")
+        radices = [int(r) for r in self.upper - self.lower + 1]
+        if prod(radices) >= MAX_KEY_SPACE:
+            raise ValueError("Label ranges are too large for int64 keys")
+        self.strides = np.array([prod(radices[i + 1:]) for i in range(len(radices))], dtype=np.int64)
+
+    @classmethod
+    def from_weights(cls, weights: np.ndarray) -> "WeightPacker":
+        """Packer covering the label ranges of an (n, rank) weight array and of 0."""
+        weights = np.asarray(weights, dtype=np.int64)
+        return cls(weights.min(axis=0, initial=0), weights.max(axis=0, initial=0))
+
+    @property
+    def rank(self) -> int:
+        return len(self.strides)
+
+    def pack(self, weights) -> np.ndarray:
+        """
+        Keys of an (n, rank) array of weights.
+
+        Weights outside the label ranges get key -1.
+        """
+        weights = np.atleast_2d(np.asarray(weights, dtype=np.int64))
+        inside = ((weights >= self.lower) & (weights <= self.upper)).all(axis=1)
+        keys = (weights - self.lower) @ self.strides
+        return np.where(inside, keys, -1)
+
+
+class WeightIndex:
+    """Open-addressing hash index from packed weight keys to row positions."""
+
+    __slots__ = ("_keys", "_rows", "_mask", "_shift", "_size")
+
+    def __init__(self, keys: np.ndarray):
+        """
+        Index ``keys[i] -> i``. For repeated keys the first row is kept.
+
+        Args:
+            keys: Non-negative packed keys (see ``WeightPacker``)
+
+        Raises:
+            ValueError: If a key is negative
+        """
+        keys = np.asarray(keys, dtype=np.int64).ravel()
+        if (keys < 0).any():
+            raise ValueError("Weight keys must be non-negative")
+        bits = max(3, (2 * len(keys) - 1).bit_length())
+        self._mask = (1 << bits) - 1
+        self._shift = np.uint64(64 - bits)
+        self._keys = np.full(1 << bits, EMPTY, dtype=np.int64)
+        self._rows = np.full(1 << bits, -1, dtype=np.int32 if len(keys) < 2 ** 31 else np.int64)
+
+        rows = np.arange(len(keys), dtype=np.int64)
+        slots = self._slots(keys)
+        while len(rows):
+            # Each empty slot goes to its first claimant; everyone else probes on
+            empty = np.flatnonzero(self._keys[slots] == EMPTY)
+            claimed_slots, first = np.unique(slots[empty], return_index=True)
+            claimants = rows[empty[first]]
+            self._keys[claimed_slots] = keys[claimants]
+            self._rows[claimed_slots] = claimants
+            # A row is done once its key sits in its slot (it or an earlier duplicate put it there)
+            pending = self._keys[slots] != keys[rows]
+            rows, slots = rows[pending], (slots[pending] + 1) & self._mask
+        self._size = int((self._keys != EMPTY).sum())
+
+    def _slots(self, keys: np.ndarray) -> np.ndarray:
+        # Fibonacci hashing: the top bits of key * 2^64/phi (mod 2^64)
+        return ((keys.astype(np.uint64) * _FIBONACCI) >> self._shift).astype(np.int64)
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def nbytes(self) -> int:
+        return self._keys.nbytes + self._rows.nbytes
+
+    def lookup(self, keys) -> np.ndarray:
+        """Row position of each key, or -1 where the key is absent (including key -1)."""
+        keys = np.asarray(keys, dtype=np.int64).ravel()
+        result = np.full(len(keys), -1, dtype=np.int64)
+        active = np.flatnonzero(keys >= 0)
+        slots = self._slots(keys[active])
+        while len(active):
+            occupants = self._keys[slots]
+            hit = occupants == keys[active]
+            result[active[hit]] = self._rows[slots[hit]]
+            probing = ~hit & (occupants != EMPTY)
+            active, slots = active[probing], (slots[probing] + 1) & self._mask
+        return result
+
+
+class PackedWeightIndex:
+    """Row lookup over an (n, rank) weight array through packed keys."""
+
+    __slots__ = ("packer", "index")
+
+    def __init__(self, weights: np.ndarray, packer: WeightPacker):
+        """
+        Args:
+            weights: Weights to index, each inside the packer's label ranges
+            packer: Packer for the keys
+        """
+        self.packer = packer
+        self.index = WeightIndex(packer.pack(weights))
+
+    def lookup(self, weights) -> np.ndarray:
+        """Row position of each weight, or -1 where the weight is absent."""
+        return self.index.lookup(self.packer.pack(weights))
+
+
+class TupleWeightIndex:
+    """Row lookup over an (n, rank) weight array through a dict of tuples."""
+
+    __slots__ = ("positions",)
+
+    def __init__(self, weights: np.ndarray):
+        self.positions: Dict[Tuple[int, ...], int] = {}
+        for row, mu in enumerate(map(tuple, np.asarray(weights).tolist())):
+            self.positions.setdefault(mu, row)
+
+    def lookup(self, weights) -> np.ndarray:
+        """Row position of each weight, or -1 where the weight is absent."""
+        weights = np.atleast_2d(np.asarray(weights, dtype=np.int64))
+        return np.array([self.positions.get(mu, -1) for mu in map(tuple, weights.tolist())], dtype=np.int64)
+
+
+def index_weights(weights: np.ndarray,
+                  packer: Optional[WeightPacker]) -> Union[PackedWeightIndex, TupleWeightIndex]:
+    """
+    Row lookup over an (n, rank) weight array; repeated weights map to their first row.
+
+    Args:
+        weights: Weights to index
+        packer: Packer covering the weights, or None if their keys do not fit in int64
+    """
+    if packer is None:
+        return TupleWeightIndex(weights)
+    return PackedWeightIndex(weights, packer)
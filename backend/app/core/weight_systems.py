@@ -5,9 +5,231 @@ This module computes complete weight systems for irreducible representations
 and projects them into 2D/3D spaces for visualization.
 """
 
-from typing import List, Tuple, Dict
+from math import gcd
+from typing import List, Optional, Sequence, Tuple, Dict
 import numpy as np
 
+from .freudenthal import (
+    Character, ProgressCallback, WeightLimitExceeded, dominant_character, iter_weight_system,
+)
+from .registry import get_algebra
+from .root_systems import IntegerRootSystem
+from .weight_keys import WeightPacker, index_weights
+
+
+def _smallest_int_dtype(array: np.ndarray) -> np.dtype:
+    """Smallest signed integer dtype that holds every entry of ``array``."""
+    bound = int(np.abs(array).max(initial=0))
+    for dtype in (np.int8, np.int16, np.int32):
+        if bound <= np.iinfo(dtype).max:
+            return np.dtype(dtype)
+    return np.dtype(np.int64)
+
+
+class WeightSystem:
+    """
+    Compact array-backed weight system of a representation.
+    
+    All weights live in one contiguous small-int matrix of shape
+    (num_weights, rank + d): the first ``rank`` columns are Dynkin labels,
+    the remaining ``d`` columns are orthogonal-basis coordinates multiplied
+    by ``orthogonal_denominator``. ``dynkin`` and ``orthogonal`` are
+    zero-copy views into that matrix. Multiplicities are a separate vector.
+    
+    Weights are hashed by packing their Dynkin labels into a single int64
+    (mixed radix over the per-column label range) and found through an
+    open-addressing ``WeightIndex``, so lookups build no tuples.
+    
+    Conversion to Python lists happens only at the API edge (``to_lists``).
+    """
+    
+    __slots__ = ("cartan_type", "rank", "orthogonal_denominator", "multiplicities",
+                 "_coordinates", "_packer", "_lookup")
+    
+    def __init__(self, cartan_type: str, coordinates: np.ndarray, rank: int,
+                 orthogonal_denominator: int, multiplicities: np.ndarray):
+        """
+        Args:
+            cartan_type: Cartan type of the algebra (e.g. 'E6', 'A2+A1')
+            coordinates: (n, rank + d) matrix [Dynkin labels | scaled orthogonal]
+            rank: Number of Dynkin-label columns
+            orthogonal_denominator: Scale of the orthogonal columns
+            multiplicities: (n,) multiplicity of each weight
+        """
+        self.cartan_type = cartan_type
+        self.rank = rank
+        self.orthogonal_denominator = orthogonal_denominator
+        self._coordinates = np.ascontiguousarray(
+            coordinates, dtype=_smallest_int_dtype(coordinates))
+        self.multiplicities = np.asarray(multiplicities, dtype=np.int64)
+        self._coordinates.setflags(write=False)
+        self.multiplicities.setflags(write=False)
+        
+        # Packed-key hashing over the Dynkin columns (None if too wide for
+        # int64 keys); the lookup index is built on first use
+        try:
+            self._packer = WeightPacker.from_weights(self.dynkin)
+        except ValueError:
+            self._packer = None
+        self._lookup = None
+    
+    @classmethod
+    def from_character(cls, rs: IntegerRootSystem, character: Character,
+                       max_weights: Optional[int] = None,
+                       progress: Optional[ProgressCallback] = None) -> "WeightSystem":
+        """
+        Build the weight system of an irrep from its dominant character.
+        
+        Orbits are converted to arrays one at a time, so no per-weight
+        Python objects survive construction. ``progress`` is called with
+        the fraction of orbits done.
+        
+        Raises:
+            WeightLimitExceeded: If there are more than ``max_weights`` weights
+        """
+        # Fundamental weights in scaled orthogonal coordinates:
+        # omega = A^{-1} alpha, scaled by (inverse denominator * root scale)
+        inverse = rs.inverse_cartan
+        fundamental = inverse.numerator.astype(np.int64) @ rs.simple_roots.astype(np.int64)
+        denominator = inverse.denominator * rs.orthogonal_scale
+        common = gcd(int(np.gcd.reduce(fundamental.ravel())), denominator)
+        fundamental //= common
+        denominator //= common
+        
+        blocks = []
+        multiplicities = []
+        count = 0
+        orbit_weights: List[Tuple[int, ...]] = []
+        current_orbit = 0
+        current_multiplicity = None
+        
+        def flush():
+            if orbit_weights:
+                dynkin = np.array(orbit_weights, dtype=np.int64)
+                blocks.append(np.hstack([dynkin, dynkin @ fundamental]))
+                multiplicities.append(np.full(len(orbit_weights), current_multiplicity, dtype=np.int64))
+                orbit_weights.clear()
+        
+        for orbit, _, mu, multiplicity in iter_weight_system(rs, character):
+            if max_weights is not None and count >= max_weights:
+                raise WeightLimitExceeded(f"Weight system has more than {max_weights} weights")
+            if orbit != current_orbit:
+                flush()
+                current_orbit = orbit
+                if progress is not None:
+                    progress(orbit / len(character))
+            current_multiplicity = multiplicity
+            orbit_weights.append(mu)
+            count += 1
+        flush()
+        if progress is not None:
+            progress(1.0)
+        
+        width = rs.rank + fundamental.shape[1]
+        coordinates = np.vstack(blocks) if blocks else np.zeros((0, width), dtype=np.int64)
+        mults = np.concatenate(multiplicities) if multiplicities else np.zeros(0, dtype=np.int64)
+        return cls(rs.cartan_type, coordinates, rs.rank, denominator, mults)
+    
+    @classmethod
+    def product(cls, factors: Sequence["WeightSystem"]) -> "WeightSystem":
+        """
+        Weight system of an outer tensor product (semisimple algebras).
+        
+        Weights are all concatenations of factor weights; multiplicities multiply.
+        """
+        if len(factors) == 1:
+            return factors[0]
+        
+        denominator = 1
+        for factor in factors:
+            denominator = denominator * factor.orthogonal_denominator // gcd(
+                denominator, factor.orthogonal_denominator)
+        
+        sizes = [len(f) for f in factors]
+        total = int(np.prod(sizes))
+        dynkin_parts, orthogonal_parts = [], []
+        multiplicities = np.ones(total, dtype=np.int64)
+        
+        repeat = total
+        tile = 1
+        for factor, size in zip(factors, sizes):
+            # Factor index varies slowest for the first factor
+            repeat //= size
+            index = np.tile(np.repeat(np.arange(size), repeat), tile)
+            tile *= size
+            dynkin_parts.append(factor.dynkin[index].astype(np.int64))
+            orthogonal_parts.append(factor.orthogonal[index].astype(np.int64)
+                                    * (denominator // factor.orthogonal_denominator))
+            multiplicities *= factor.multiplicities[index]
+        
+        coordinates = np.hstack(dynkin_parts + orthogonal_parts)
+        cartan_type = "+".join(f.cartan_type for f in factors)
+        rank = sum(f.rank for f in factors)
+        return cls(cartan_type, coordinates, rank, denominator, multiplicities)
+    
+    def __len__(self) -> int:
+        return self._coordinates.shape[0]
+    
+    @property
+    def dynkin(self) -> np.ndarray:
+        """(n, rank) Dynkin labels, a zero-copy view."""
+        return self._coordinates[:, :self.rank]
+    
+    @property
+    def orthogonal(self) -> np.ndarray:
+        """(n, d) orthogonal coordinates times ``orthogonal_denominator``, a zero-copy view."""
+        return self._coordinates[:, self.rank:]
+    
+    def orthogonal_float(self) -> np.ndarray:
+        """Orthogonal coordinates as floats."""
+        return self.orthogonal / self.orthogonal_denominator
+    
+    @property
+    def dimension(self) -> int:
+        """Dimension of the representation (sum of multiplicities)."""
+        return int(self.multiplicities.sum())
+    
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the weight and multiplicity arrays."""
+        return self._coordinates.nbytes + self.multiplicities.nbytes
+    
+    def pack(self, weights) -> np.ndarray:
+        """
+        Pack Dynkin-label vectors into int64 keys.
+        
+        Weights outside the label range of this system get key -1.
+        
+        Raises:
+            ValueError: If the label ranges are too wide for int64 keys
+        """
+        if self._packer is None:
+            raise ValueError("Label ranges of this weight system are too wide for int64 keys")
+        return self._packer.pack(weights)
+    
+    def keys(self) -> np.ndarray:
+        """Packed int64 key of every weight."""
+        return self.pack(self.dynkin)
+    
+    def index_of(self, weights) -> np.ndarray:
+        """Row index of each weight, or -1 where the weight is absent."""
+        if self._lookup is None:
+            # Tuple lookups when the label ranges are too wide for int64 keys
+            self._lookup = index_weights(self.dynkin, self._packer)
+        return self._lookup.lookup(weights)
+    
+    def multiplicity(self, weight: Sequence[int]) -> int:
+        """Multiplicity of a weight (0 if it is not a weight)."""
+        index = int(self.index_of([weight])[0])
+        return int(self.multiplicities[index]) if index >= 0 else 0
+    
+    def __contains__(self, weight) -> bool:
+        return self.multiplicity(weight) > 0
+    
+    def to_lists(self) -> Tuple[List[List[int]], List[int]]:
+        """(weights, multiplicities) as plain lists for JSON responses."""
+        return self.dynkin.tolist(), self.multiplicities.tolist()
+
 
 class WeightSystemCalculator:
     """Calculate weight systems for multiplet diagram visualization."""
@@ -34,8 +256,8 @@ class WeightSystemCalculator:
         a1, a2 = self.dynkin_labels
         weights_with_mult = []
         
-        # Generate all weights using dominant weight and Weyl reflections
-        # This is a simplified implementation covering common cases
+        # Exact hexagonal geometry for the smallest irreps; everything else
+        # comes from the Freudenthal engine
         
         if (a1, a2) == (1, 0):  # Fundamental 3
             # The fundamental 3 of SU(3): 3 quarks forming equilateral triangle (pointing up)
@@ -78,49 +300,12 @@ class WeightSystemCalculator:
             ]
             return result
         
-        elif (a1, a2) == (2, 0):  # Sextet 6
-            weights_with_mult = [
-                {"h1": 2, "h2": 0, "mult": 1},
-                {"h1": -1, "h2": 2, "mult": 1},
-                {"h1": 1, "h2": 1, "mult": 1},
-                {"h1": -2, "h2": 1, "mult": 1},
-                {"h1": 0, "h2": -1, "mult": 1},
-                {"h1": 1, "h2": -2, "mult": 1},
-            ]
-        
-        elif (a1, a2) == (0, 2):  # Anti-sextet 6̄
-            weights_with_mult = [
-                {"h1": 0, "h2": 2, "mult": 1},
-                {"h1": 2, "h2": -1, "mult": 1},
-                {"h1": 1, "h2": 1, "mult": 1},
-                {"h1": 1, "h2": -2, "mult": 1},
-                {"h1": -1, "h2": 0, "mult": 1},
-                {"h1": -2, "h2": 1, "mult": 1},
-            ]
-        
-        elif (a1, a2) == (3, 0):  # Decuplet 10
-            weights_with_mult = [
-                {"h1": 3, "h2": 0, "mult": 1},    # highest weight
-                {"h1": 1, "h2": 1, "mult": 1},
-                {"h1": -1, "h2": 2, "mult": 1},
-                {"h1": 2, "h2": -1, "mult": 1},
-                {"h1": 0, "h2": 0, "mult": 1},
-                {"h1": -2, "h2": 1, "mult": 1},
-                {"h1": 1, "h2": -2, "mult": 1},
-                {"h1": -1, "h2": -1, "mult": 1},
-                {"h1": 0, "h2": -3, "mult": 1},
-                {"h1": -3, "h2": 0, "mult": 1},
-            ]
-        
-        elif (a1, a2) == (0, 0):  # Singlet 1
-            weights_with_mult = [
-                {"h1": 0, "h2": 0, "mult": 1},
-            ]
-        
         else:
-            # For  other representations, return simplified version
+            rs = get_algebra("SU3").root_system
+            ws = WeightSystem.from_character(rs, dominant_character(rs.cartan_type, (a1, a2)))
             weights_with_mult = [
-                {"h1": a1, "h2": a2, "mult": 1},
+                {"h1": h1, "h2": h2, "mult": mult}
+                for (h1, h2), mult in zip(ws.dynkin.tolist(), ws.multiplicities.tolist())
             ]
         
         # Convert to (I₃, Y) coordinates for physics visualization
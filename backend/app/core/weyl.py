@@ -0,0 +1,123 @@
+"""
+Weyl dimension formula for simple and semisimple Lie algebras.
+
+For a highest weight lambda with Dynkin labels a_i,
+
+    dim V(lambda) = prod_{alpha > 0} (lambda + rho, alpha^vee) / (rho, alpha^vee)
+
+In the Dynkin basis (lambda + rho, alpha^vee) = sum_i (a_i + 1) k_i, where
+k_i are the coefficients of alpha^vee in simple coroots. The coroot matrix
+is cached on the shared root system, so a batch of N label vectors costs a
+single (N, rank) x (rank, P) integer product followed by an exact big-integer
+reduction over the P positive roots.
+"""
+
+from math import prod
+from typing import List, Sequence
+import numpy as np
+
+from .lie_algebra import parse_semisimple_notation
+from .registry import get_algebra
+from .root_systems import IntegerRootSystem
+
+
+def root_systems_for(group_name: str) -> List[IntegerRootSystem]:
+    """Root systems of the simple factors of a (semi)simple group."""
+    return [get_algebra(cartan_type).root_system
+            for cartan_type in parse_semisimple_notation(group_name)]
+
+
+def _as_label_matrix(labels, rank: int) -> np.ndarray:
+    """Validate labels and return them as an (N, rank) int64 array."""
+    matrix = np.asarray(labels, dtype=np.int64)
+    if matrix.ndim == 1:
+        matrix = matrix[np.newaxis, :]
+    if matrix.ndim != 2 or matrix.shape[1] != rank:
+        raise ValueError(f"Expected {rank} Dynkin labels per weight, got shape {matrix.shape}")
+    if (matrix < 0).any():
+        raise ValueError("Dynkin labels must be non-negative integers")
+    return matrix
+
+
+def exact_row_products(values: np.ndarray) -> List[int]:
+    """
+    Exact products of the rows of a positive integer matrix.
+
+    Columns are multiplied in int64 in chunks small enough not to
+    overflow, so only one big-integer product per chunk remains.
+    """
+    rows, columns = values.shape
+    bits = max(int(values.max(initial=1)).bit_length(), 1)
+    chunk = max(1, min(columns, 62 // bits))
+    padded = np.ones((rows, -(-columns // chunk) * chunk), dtype=np.int64)
+    padded[:, :columns] = values
+    partial = padded.reshape(rows, -1, chunk).prod(axis=2)
+    return [prod(row) for row in partial.tolist()]
+
+
+def root_system_dimensions(rs: IntegerRootSystem, labels: np.ndarray) -> List[int]:
+    """
+    Weyl dimensions of a batch of irreps of one simple algebra.
+
+    The product over positive roots is first taken in float64: with P
+    factors its relative error is below 2P ulp, so dimensions under
+    2**50 / P round to the exact integer. Larger dimensions are recomputed
+    exactly with integer arithmetic.
+
+    Args:
+        rs: Root system of the algebra
+        labels: (N, rank) array of Dynkin labels
+
+    Returns:
+        N exact dimensions as Python ints
+    """
+    coroots = rs.positive_coroots
+    if coroots.shape[0] == 0:
+        return [1] * labels.shape[0]
+
+    # (lambda + rho, alpha^vee) for every weight and positive root
+    numerators = (labels + 1) @ coroots.T
+    # (rho, alpha^vee) is the height of the coroot
+    heights = coroots.sum(axis=1)
+
+    with np.errstate(over="ignore"):
+        estimates = np.prod(numerators / heights, axis=1)
+    exact = estimates < 2.0 ** 50 / coroots.shape[0]
+    dimensions = np.rint(np.where(exact, estimates, 0)).astype(np.int64).tolist()
+
+    large = np.flatnonzero(~exact)
+    if large.size:
+        denominator = int(np.prod(heights.astype(object)))
+        for index, product in zip(large.tolist(), exact_row_products(numerators[large])):
+            dimensions[index] = product // denominator
+    return dimensions
+
+
+def weyl_dimensions(group_name: str, labels) -> List[int]:
+    """
+    Exact dimensions for a batch of highest weights.
+
+    Args:
+        group_name: Simple or semisimple group (e.g., 'E6', 'SU(3)xSU(2)')
+        labels: (N, rank) array-like of Dynkin labels; for semisimple groups
+                the labels of the factors are concatenated in order
+
+    Raises:
+        ValueError: For unsupported groups or malformed labels
+    """
+    systems = root_systems_for(group_name)
+    matrix = _as_label_matrix(labels, sum(rs.rank for rs in systems))
+
+    dimensions = [1] * matrix.shape[0]
+    start = 0
+    for rs in systems:
+        factor = root_system_dimensions(rs, matrix[:, start:start + rs.rank])
+        dimensions = [d * f for d, f in zip(dimensions, factor)]
+        start += rs.rank
+
+    return dimensions
+
+
+def weyl_dimension(group_name: str, highest_weight: Sequence[int]) -> int:
+    """Exact dimension of a single irrep."""
+    return weyl_dimensions(group_name, [list(highest_weight)])[0]
@@ -0,0 +1,119 @@
+"""
+Import-time report for cold starts.
+
+Runs ``python -X importtime -c "import <module>"`` in a fresh interpreter
+and summarizes where the time goes, per module and per top-level package.
+Forbidden packages (SymPy by default) make the report fail, so
+regressions of the cold-start path show up in review and CI.
+
+Usage::
+
+    python -m app.import_report                  # app.main, top 25 modules
+    python -m app.import_report app.core.irreps --top 10
+    python -m app.import_report --forbid sympy --forbid scipy
+"""
+
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Sequence
+import argparse
+import subprocess
+import sys
+
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+DEFAULT_FORBIDDEN = ("sympy",)
+
+
+class ImportTiming(NamedTuple):
+    """One line of ``-X importtime`` output (times in microseconds)."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(output: str) -> List[ImportTiming]:
+    """Parse the stderr of ``python -X importtime``."""
+    timings = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # header line
+        name = fields[2].rstrip()
+        depth = (len(name) - len(name.lstrip())) // 2
+        timings.append(ImportTiming(name.strip(), int(fields[0]), int(fields[1]), depth))
+    return timings
+
+
+def measure_imports(module: str, python: str = sys.executable) -> List[ImportTiming]:
+    """
+    Import ``module`` in a fresh interpreter and return its import timings.
+
+    Raises:
+        RuntimeError: If the import fails
+    """
+    process = subprocess.run(
+        [python, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_DIR, capture_output=True, text=True,
+    )
+    if process.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{process.stderr[-2000:]}")
+    return parse_importtime(process.stderr)
+
+
+def package_totals(timings: Sequence[ImportTiming]) -> Dict[str, int]:
+    """Self time per top-level package, in microseconds."""
+    totals: Dict[str, int] = defaultdict(int)
+    for timing in timings:
+        totals[timing.module.split(".")[0]] += timing.self_us
+    return dict(totals)
+
+
+def loaded_forbidden(timings: Sequence[ImportTiming], forbidden: Sequence[str]) -> List[str]:
+    """Forbidden packages or modules (with their submodules) that were imported."""
+    return sorted(name for name in set(forbidden)
+                  if any(timing.module == name or timing.module.startswith(name + ".") for timing in timings))
+
+
+def format_report(module: str, timings: Sequence[ImportTiming], top: int = 25) -> str:
+    total = sum(timing.cumulative_us for timing in timings if timing.depth == 0)
+    lines = [f"import {module}: {total / 1000:.1f} ms, {len(timings)} modules", ""]
+
+    lines.append(f"{'self ms':>9} {'share':>6}  package")
+    for package, self_us in sorted(package_totals(timings).items(), key=lambda item: -item[1])[:top]:
+        lines.append(f"{self_us / 1000:9.1f} {100 * self_us / max(total, 1):5.1f}%  {package}")
+
+    lines += ["", f"{'cum ms':>9} {'self ms':>9}  module"]
+    for timing in sorted(timings, key=lambda timing: -timing.cumulative_us)[:top]:
+        lines.append(f"{timing.cumulative_us / 1000:9.1f} {timing.self_us / 1000:9.1f}  {timing.module}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Report the import cost of each module")
+    parser.add_argument("modules", nargs="*", default=["app.main"])
+    parser.add_argument("--top", type=int, default=25, help="Rows per table")
+    parser.add_argument("--forbid", action="append", default=None,
+                        help=f"Fail if this package is imported (default: {', '.join(DEFAULT_FORBIDDEN)})")
+    args = parser.parse_args(argv)
+    forbidden = args.forbid if args.forbid is not None else list(DEFAULT_FORBIDDEN)
+
+    status = 0
+    for module in args.modules:
+        timings = measure_imports(module)
+        print(format_report(module, timings, args.top))
+        offending = loaded_forbidden(timings, forbidden)
+        if offending:
+            print(f"\nFAIL: import {module} loads {', '.join(offending)}")
+            status = 1
+        print()
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
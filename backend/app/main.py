@@ -8,6 +8,12 @@ from fastapi.responses import JSONResponse
 
 from app.config import settings
 from app.api.v1.router import api_router
+from app.api.http_cache import HTTPCacheMiddleware
+from app.api.projection import TOTAL_COUNT_HEADER
+from app.core.algebra_bundle import get_default_bundle
+from app.services.executor import ComputeUnavailable, compute_executor
+from app.services.warmup import start_warmup, warmup_state
+from app.tasks.jobs import get_job_manager, shutdown_job_manager
 
 # Create FastAPI app
 app = FastAPI(
@@ -18,6 +24,14 @@ app = FastAPI(
     redoc_url="/redoc",
 )
 
+# ETags and Cache-Control for deterministic GET endpoints (inside CORS, so 304s get CORS headers)
+if settings.HTTP_CACHE_MAX_AGE > 0:
+    app.add_middleware(
+        HTTPCacheMiddleware,
+        prefixes=(f"{settings.API_V1_PREFIX}/groups", f"{settings.API_V1_PREFIX}/irreps"),
+        max_age=settings.HTTP_CACHE_MAX_AGE,
+    )
+
 # CORS Configuration
 app.add_middleware(
     CORSMiddleware,
@@ -25,12 +39,41 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[TOTAL_COUNT_HEADER],
 )
 
 # Include API routes
 app.include_router(api_router, prefix="/api/v1")
 
 
+@app.on_event("startup")
+async def map_algebra_bundle():
+    """Memory-map the prebuilt algebra bundle (pages are loaded on demand)"""
+    get_default_bundle()
+
+
+@app.on_event("startup")
+async def create_job_manager():
+    """Open the job store now, so a misconfigured job backend stops the server at startup"""
+    get_job_manager()
+
+
+@app.on_event("startup")
+async def start_background_warmup():
+    """Warm the registry and result caches without delaying startup"""
+    app.state.warmup_task = start_warmup(compute_executor)
+
+
+@app.on_event("shutdown")
+async def stop_compute_executor():
+    """Stop the warm-up, the worker pools and running jobs"""
+    warmup_task = getattr(app.state, "warmup_task", None)
+    if warmup_task is not None:
+        warmup_task.cancel()
+    compute_executor.shutdown(wait=False)
+    shutdown_job_manager()
+
+
 @app.get("/")
 async def root():
     """Root endpoint - API health check"""
@@ -48,9 +91,19 @@ async def health_check():
     return {
         "status": "healthy",
         "version": "0.1.0",
+        "warmup": warmup_state.to_dict(),
     }
 
 
+@app.get("/ready")
+async def readiness_check():
+    """Readiness probe: 503 until the startup warm-up has finished"""
+    return JSONResponse(
+        status_code=200 if warmup_state.ready else 503,
+        content={"ready": warmup_state.ready, "warmup": warmup_state.to_dict()},
+    )
+
+
 # Error handlers
 @app.exception_handler(404)
 async def not_found_handler(request, exc):
@@ -60,6 +113,14 @@ async def not_found_handler(request, exc):
     )
 
 
+@app.exception_handler(ComputeUnavailable)
+async def compute_unavailable_handler(request, exc):
+    return JSONResponse(
+        status_code=exc.status_code,
+        content={"detail": str(exc)},
+    )
+
+
 @app.exception_handler(500)
 async def internal_error_handler(request, exc):
     return JSONResponse(
@@ -0,0 +1,3 @@
+"""
+Services layer between the API endpoints and app.core.
+"""
@@ -0,0 +1,277 @@
+"""
+Batch execution of many small operations in one request.
+
+Notebooks and the model builder ask for dozens of dimensions, irreps and
+tensor products of the same group at once. A batch resolves each group
+once, deduplicates identical operations by their coalescing key, computes
+all dimensions of a group in a single vectorized Weyl formula call, and
+runs the remaining operations concurrently on the compute executor.
+Persistent operations are looked up in the shared result cache with one
+round trip for the whole batch, and the results computed for the misses
+are written back with one more.
+
+Every operation gets its own outcome, ``{"status": 200, "result": ...}``
+or ``{"status": <code>, "error": ...}``, so one bad entry does not fail
+the others.
+"""
+
+from dataclasses import dataclass, field
+from inspect import signature
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+import asyncio
+
+import numpy as np
+
+from app.config import settings
+from app.core.freudenthal import WeightLimitExceeded
+from app.core.lie_algebra import parse_semisimple_notation
+from app.core.registry import get_algebra
+from app.core.weyl import weyl_dimension, weyl_dimensions
+from . import operations
+from .executor import ComputeExecutor, ComputeUnavailable
+from .result_cache import MISSING, Call, shared_lookup_many, shared_store_many
+
+
+Outcome = Dict[str, Any]
+
+
+def _identity(data: Any) -> Any:
+    return data
+
+
+def _group_params(params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    group_data parameters with ``fields`` in GROUP_FIELDS order.
+
+    The projection ``parse_fields`` applies to the endpoint, so selections
+    in any order share one coalescing key.
+
+    Raises:
+        ValueError: For unknown field names
+    """
+    fields = params.get("fields")
+    if fields is None:
+        return params
+    unknown = set(fields) - set(operations.GROUP_FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown group fields: {', '.join(sorted(map(str, unknown)))}")
+    return {**params, "fields": [name for name in operations.GROUP_FIELDS if name in fields]}
+
+
+def _irrep_result(data: Dict[str, Any]) -> Dict[str, Any]:
+    """irrep_data with its WeightSystem as weight and multiplicity arrays."""
+    data = dict(data)
+    weight_system = data.pop("weight_system")
+    data.update(weights=np.ascontiguousarray(weight_system.dynkin),
+                multiplicities=weight_system.multiplicities)
+    return data
+
+
+@dataclass(frozen=True)
+class BatchOperation:
+    """
+    One kind of batch operation.
+
+    Attributes:
+        fn: Operation called as ``fn(group, **params, **fixed())``
+        heavy: Run on the process pool rather than the thread pool
+        result: Converts the operation's return value for the response
+        fixed: Server-controlled keyword arguments clients cannot set
+        canonical: Rewrites equivalent client parameters to one form
+    """
+
+    fn: Callable[..., Any]
+    heavy: bool = False
+    result: Callable[[Any], Any] = _identity
+    fixed: Callable[[], Dict[str, Any]] = field(default=dict)
+    canonical: Callable[[Dict[str, Any]], Dict[str, Any]] = _identity
+
+    @property
+    def parameters(self) -> Tuple[str, ...]:
+        """Parameters a client may pass (all but the group and the fixed ones)."""
+        names = list(signature(self.fn).parameters)[1:]
+        return tuple(name for name in names if name not in self.fixed() and name != "progress")
+
+
+# Dimensions are not dispatched one by one; see dimension_outcomes
+DIMENSION = "dimension"
+
+BATCH_OPERATIONS: Dict[str, BatchOperation] = {
+    "group": BatchOperation(operations.group_data, canonical=_group_params),
+    "group_info": BatchOperation(operations.group_info),
+    "root_system": BatchOperation(operations.root_system_data),
+    "dynkin_diagram": BatchOperation(operations.dynkin_diagram),
+    "irrep": BatchOperation(operations.irrep_data, heavy=True, result=_irrep_result,
+                            fixed=lambda: {"max_weights": settings.MAX_WEIGHT_SYSTEM_SIZE}),
+    "tensor_product": BatchOperation(operations.tensor_product, heavy=True),
+    "weight_diagram": BatchOperation(operations.weight_diagram, heavy=True),
+}
+
+
+def success(result: Any) -> Outcome:
+    return {"status": 200, "result": result}
+
+
+def failure(error: Exception) -> Outcome:
+    """Outcome of a failed operation, with the status code its endpoint would use."""
+    if isinstance(error, ComputeUnavailable):
+        status = error.status_code
+    elif isinstance(error, WeightLimitExceeded):
+        status = 413
+    else:
+        status = 400
+    return {"status": status, "error": str(error)}
+
+
+def dimension_outcomes(group_name: str, labels: Sequence[Sequence[int]]) -> List[Outcome]:
+    """
+    Dimensions of many irreps of one group in one vectorized call.
+
+    If any label vector is malformed the irreps are evaluated one by one,
+    so the error is reported for that entry only.
+    """
+    try:
+        return [success({"dimension": dimension}) for dimension in weyl_dimensions(group_name, labels)]
+    except Exception:
+        pass
+
+    outcomes = []
+    for highest_weight in labels:
+        try:
+            outcomes.append(success({"dimension": weyl_dimension(group_name, highest_weight)}))
+        except Exception as e:
+            outcomes.append(failure(e))
+    return outcomes
+
+
+def _resolve_group(group_name: Optional[str], resolved: Dict[str, Optional[Exception]]) -> str:
+    """
+    Resolve a group's simple factors in the registry, once per batch.
+
+    Raises:
+        ValueError: If no group was given or it is not supported
+    """
+    if not group_name:
+        raise ValueError("No group given for this operation or the batch")
+    if group_name not in resolved:
+        try:
+            for cartan_type in parse_semisimple_notation(group_name):
+                get_algebra(cartan_type)
+            resolved[group_name] = None
+        except Exception as e:
+            resolved[group_name] = e
+    error = resolved[group_name]
+    if error is not None:
+        raise ValueError(f"Unsupported group {group_name}: {error}")
+    return group_name
+
+
+def _check_params(op: str, params: Dict[str, Any]) -> Optional[BatchOperation]:
+    """
+    Look up a batch operation and check its parameters.
+
+    Returns:
+        The operation, or None for a dimension
+
+    Raises:
+        ValueError: For unknown operations or missing/unexpected parameters
+    """
+    if op == DIMENSION:
+        if set(params) != {"highest_weight"}:
+            raise ValueError("'dimension' takes exactly one parameter: highest_weight")
+        return None
+    spec = BATCH_OPERATIONS.get(op)
+    if spec is None:
+        raise ValueError(f"Unknown operation '{op}'; expected one of {sorted([*BATCH_OPERATIONS, DIMENSION])}")
+    unexpected = set(params) - set(spec.parameters)
+    if unexpected:
+        raise ValueError(f"Unexpected parameters for '{op}': {', '.join(sorted(unexpected))}")
+    try:
+        signature(spec.fn).bind("group", **params)
+    except TypeError as e:
+        raise ValueError(f"Invalid parameters for '{op}': {e}")
+    return spec
+
+
+async def run_batch(executor: ComputeExecutor, requests: Sequence[Dict[str, Any]],
+                    concurrency: int = 8) -> Tuple[List[Outcome], int]:
+    """
+    Run a batch of operations.
+
+    Args:
+        executor: Executor the operations are dispatched to
+        requests: ``{"op", "group", "params"}`` dicts, in response order
+        concurrency: Maximum calls in flight at once
+
+    Returns:
+        (outcomes in request order, number of distinct calls made)
+    """
+    outcomes: List[Optional[Outcome]] = [None] * len(requests)
+    resolved: Dict[str, Optional[Exception]] = {}
+    calls: Dict[Hashable, Tuple[BatchOperation, str, Dict[str, Any], List[int]]] = {}
+    dimensions: Dict[str, Dict[Tuple[int, ...], List[int]]] = {}
+
+    for index, request in enumerate(requests):
+        try:
+            group = _resolve_group(request.get("group"), resolved)
+            params = request.get("params") or {}
+            spec = _check_params(request["op"], params)
+            if spec is None:
+                highest_weight = tuple(params["highest_weight"])
+                canonical = operations.canonical_group_name(group)
+                dimensions.setdefault(canonical, {}).setdefault(highest_weight, []).append(index)
+                continue
+            kwargs = {**spec.canonical(params), **spec.fixed()}
+            key = spec.fn.coalesce_key(group, **kwargs)
+        except Exception as e:
+            outcomes[index] = failure(e)
+            continue
+        calls.setdefault(key, (spec, group, kwargs, []))[3].append(index)
+
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+    # One shared-cache round trip for every persistent call of the batch
+    persistent = [key for key, (spec, _, _, _) in calls.items() if getattr(spec.fn, "persistent", False)]
+    try:
+        cached = await executor.run_light(
+            shared_lookup_many, [(calls[key][0].fn, (calls[key][1],), calls[key][2]) for key in persistent])
+    except ComputeUnavailable:
+        cached = [MISSING] * len(persistent)
+    prefetched = dict(zip(persistent, cached))
+    computed: List[Tuple[Call, Any]] = []
+
+    async def run_call(key: Hashable, spec: BatchOperation, group: str, kwargs: Dict[str, Any],
+                       indices: List[int]) -> None:
+        run = executor.run_heavy if spec.heavy else executor.run_light
+        value = prefetched.get(key, MISSING)
+        try:
+            if value is MISSING:
+                async with semaphore:
+                    value = await run(spec.fn, group, use_shared_cache=key not in prefetched, **kwargs)
+                if key in prefetched:
+                    computed.append(((spec.fn, (group,), kwargs), value))
+            outcome = success(spec.result(value))
+        except Exception as e:
+            outcome = failure(e)
+        for index in indices:
+            outcomes[index] = outcome
+
+    async def run_dimensions(group: str, by_labels: Dict[Tuple[int, ...], List[int]]) -> None:
+        labels = [list(highest_weight) for highest_weight in by_labels]
+        try:
+            async with semaphore:
+                results = await executor.run_light(dimension_outcomes, group, labels)
+        except Exception as e:
+            results = [failure(e)] * len(labels)
+        for outcome, indices in zip(results, by_labels.values()):
+            for index in indices:
+                outcomes[index] = outcome
+
+    await asyncio.gather(*(run_call(key, *call) for key, call in calls.items()),
+                         *(run_dimensions(group, by_labels) for group, by_labels in dimensions.items()))
+    if computed:
+        try:
+            await executor.run_light(shared_store_many, computed)
+        except ComputeUnavailable:
+            pass  # best effort, like every cache write
+    return outcomes, len(calls) + sum(len(by_labels) for by_labels in dimensions.values())
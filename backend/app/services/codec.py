@@ -0,0 +1,191 @@
+"""
+Compact binary encoding of operation results.
+
+Results are plain data (dicts, lists, tuples, numbers, strings) plus numpy
+arrays and WeightSystem objects. Each value is written as a one-byte tag
+followed by its payload; arrays are stored as raw little-endian buffers, so
+a weight system costs little more than its coordinate matrix. Unlike
+pickle, decoding never constructs arbitrary objects, so blobs can safely
+come from a shared store.
+
+Blobs above ``COMPRESS_THRESHOLD`` bytes are zlib-compressed; the first
+byte of every blob says which form it is in.
+"""
+
+from io import BytesIO
+from typing import Any, BinaryIO
+import struct
+import zlib
+
+import numpy as np
+
+from app.core.weight_systems import WeightSystem
+
+
+COMPRESS_THRESHOLD = 512
+
+_RAW = b"\x01"
+_ZLIB = b"\x02"
+
+_NONE, _TRUE, _FALSE = b"N", b"T", b"F"
+_INT, _BIGINT, _FLOAT = b"i", b"I", b"d"
+_STR, _BYTES = b"s", b"b"
+_LIST, _TUPLE, _DICT = b"l", b"t", b"m"
+_ARRAY, _WEIGHT_SYSTEM = b"a", b"W"
+
+_I64 = struct.Struct("<q")
+_F64 = struct.Struct("<d")
+_U32 = struct.Struct("<I")
+
+
+def _write_bytes(out: BinaryIO, data: bytes) -> None:
+    out.write(_U32.pack(len(data)))
+    out.write(data)
+
+
+def _write_array(out: BinaryIO, array: np.ndarray) -> None:
+    array = np.ascontiguousarray(array)
+    dtype = array.dtype.newbyteorder("<") if array.dtype.byteorder == ">" else array.dtype
+    _write_bytes(out, dtype.str.encode())
+    out.write(_U32.pack(array.ndim))
+    for size in array.shape:
+        out.write(_I64.pack(size))
+    _write_bytes(out, array.astype(dtype, copy=False).tobytes())
+
+
+def _write(out: BinaryIO, value: Any) -> None:
+    if value is None:
+        out.write(_NONE)
+    elif isinstance(value, (bool, np.bool_)):
+        out.write(_TRUE if value else _FALSE)
+    elif isinstance(value, (int, np.integer)):
+        value = int(value)
+        if -2 ** 63 <= value < 2 ** 63:
+            out.write(_INT + _I64.pack(value))
+        else:
+            out.write(_BIGINT)
+            _write_bytes(out, str(value).encode())
+    elif isinstance(value, (float, np.floating)):
+        out.write(_FLOAT + _F64.pack(float(value)))
+    elif isinstance(value, str):
+        out.write(_STR)
+        _write_bytes(out, value.encode())
+    elif isinstance(value, (bytes, bytearray, memoryview)):
+        out.write(_BYTES)
+        _write_bytes(out, bytes(value))
+    elif isinstance(value, (list, tuple)):
+        out.write((_LIST if isinstance(value, list) else _TUPLE) + _U32.pack(len(value)))
+        for item in value:
+            _write(out, item)
+    elif isinstance(value, dict):
+        out.write(_DICT + _U32.pack(len(value)))
+        for key, item in value.items():
+            _write(out, key)
+            _write(out, item)
+    elif isinstance(value, np.ndarray):
+        out.write(_ARRAY)
+        _write_array(out, value)
+    elif isinstance(value, WeightSystem):
+        out.write(_WEIGHT_SYSTEM)
+        _write(out, value.cartan_type)
+        _write(out, value.rank)
+        _write(out, value.orthogonal_denominator)
+        _write_array(out, value._coordinates)
+        _write_array(out, value.multiplicities)
+    else:
+        raise TypeError(f"Cannot encode {type(value).__name__}")
+
+
+class _Reader:
+    def __init__(self, data: bytes):
+        self.data = memoryview(data)
+        self.pos = 0
+
+    def take(self, size: int) -> memoryview:
+        if self.pos + size > len(self.data):
+            raise ValueError("Truncated blob")
+        chunk = self.data[self.pos:self.pos + size]
+        self.pos += size
+        return chunk
+
+    def unpack(self, fmt: struct.Struct):
+        return fmt.unpack(self.take(fmt.size))[0]
+
+    def bytes(self) -> bytes:
+        return bytes(self.take(self.unpack(_U32)))
+
+    def array(self) -> np.ndarray:
+        dtype = np.dtype(self.bytes().decode())
+        if dtype.hasobject:
+            raise ValueError("Object arrays are not supported")
+        shape = tuple(self.unpack(_I64) for _ in range(self.unpack(_U32)))
+        return np.frombuffer(self.bytes(), dtype=dtype).reshape(shape)
+
+    def value(self) -> Any:
+        tag = bytes(self.take(1))
+        if tag == _NONE:
+            return None
+        if tag in (_TRUE, _FALSE):
+            return tag == _TRUE
+        if tag == _INT:
+            return self.unpack(_I64)
+        if tag == _BIGINT:
+            return int(self.bytes().decode())
+        if tag == _FLOAT:
+            return self.unpack(_F64)
+        if tag == _STR:
+            return self.bytes().decode()
+        if tag == _BYTES:
+            return self.bytes()
+        if tag in (_LIST, _TUPLE):
+            items = [self.value() for _ in range(self.unpack(_U32))]
+            return items if tag == _LIST else tuple(items)
+        if tag == _DICT:
+            return {self.value(): self.value() for _ in range(self.unpack(_U32))}
+        if tag == _ARRAY:
+            return self.array()
+        if tag == _WEIGHT_SYSTEM:
+            cartan_type, rank, denominator = self.value(), self.value(), self.value()
+            coordinates = self.array()
+            return WeightSystem(cartan_type, coordinates, rank, denominator, self.array())
+        raise ValueError(f"Unknown tag {tag!r}")
+
+
+def encode(value: Any) -> bytes:
+    """
+    Encode a result as a blob.
+
+    Raises:
+        TypeError: If the value contains unsupported types
+    """
+    out = BytesIO()
+    _write(out, value)
+    payload = out.getvalue()
+    if len(payload) > COMPRESS_THRESHOLD:
+        compressed = zlib.compress(payload, 6)
+        if len(compressed) < len(payload):
+            return _ZLIB + compressed
+    return _RAW + payload
+
+
+def decode(blob: bytes) -> Any:
+    """
+    Decode a blob produced by ``encode``.
+
+    Raises:
+        ValueError: If the blob is corrupt
+    """
+    kind, payload = blob[:1], blob[1:]
+    if kind == _ZLIB:
+        try:
+            payload = zlib.decompress(payload)
+        except zlib.error as e:
+            raise ValueError(f"Corrupt blob: {e}")
+    elif kind != _RAW:
+        raise ValueError(f"Unknown blob format {kind!r}")
+
+    reader = _Reader(payload)
+    value = reader.value()
+    if reader.pos != len(reader.data):
+        raise ValueError("Trailing data in blob")
+    return value
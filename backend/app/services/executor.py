@@ -0,0 +1,238 @@
+"""
+Execution layer between the async endpoints and app.core.
+
+Core calculations are CPU-bound, so running them inside ``async def``
+handlers blocks the event loop for every other client. The executor
+dispatches them instead:
+
+- heavy calls (weight systems, tensor products, ...) go to a process pool,
+  so they run in parallel without holding the server's GIL;
+- cheap calls (registry lookups, serialization of cached data) go to a
+  thread pool.
+
+Each pool has a bounded number of outstanding calls; when it is full new
+calls fail fast with ExecutorSaturated (HTTP 503) rather than queueing
+without limit. Calls that exceed their timeout raise ComputeTimeout
+(HTTP 504). A worker process cannot be interrupted mid-call, so a timed
+out call keeps its slot until the worker actually finishes.
+
+Functions that define a ``coalesce_key`` attribute (see
+app.services.operations) are coalesced: identical concurrent calls share
+one in-flight computation and its result, and use a single pool slot.
+Those marked ``persistent`` additionally go through the persistent result
+cache (app.services.result_cache), looked up inside the worker.
+``use_shared_cache=False`` keeps such a call away from the shared cache,
+for callers that batch their shared lookups and writes.
+"""
+
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from threading import Lock
+from typing import Any, Callable, Dict, Hashable, Optional
+import asyncio
+import logging
+import multiprocessing
+
+from app.config import settings
+from .operations import warm_worker
+from .result_cache import call_cached
+from .singleflight import SingleFlight
+
+
+logger = logging.getLogger(__name__)
+
+
+class ComputeUnavailable(RuntimeError):
+    """Base class for calls the executor could not complete."""
+
+    status_code = 503
+
+
+class ExecutorSaturated(ComputeUnavailable):
+    """Raised when a pool already has its maximum number of pending calls."""
+
+    status_code = 503
+
+
+class ComputeTimeout(ComputeUnavailable):
+    """Raised when a call does not finish within its timeout."""
+
+    status_code = 504
+
+
+class _BoundedPool:
+    """An executor plus a counter of calls that have not finished yet."""
+
+    def __init__(self, name: str, factory: Callable[[], Executor], max_pending: int):
+        self.name = name
+        self.max_pending = max_pending
+        self._factory = factory
+        self._executor: Optional[Executor] = None
+        self._pending = 0
+        self._lock = Lock()
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        with self._lock:
+            if self._pending >= self.max_pending:
+                raise ExecutorSaturated(f"{self.name} pool is busy ({self._pending} calls pending)")
+            if self._executor is None:
+                self._executor = self._factory()
+            try:
+                future = self._executor.submit(fn, *args, **kwargs)
+            except BrokenProcessPool:
+                # A worker died; start a fresh pool for this and later calls
+                logger.warning("Restarting broken %s pool", self.name)
+                self._executor = self._factory()
+                future = self._executor.submit(fn, *args, **kwargs)
+            self._pending += 1
+
+        future.add_done_callback(self._release)
+        return future
+
+    def _release(self, _future: Future) -> None:
+        with self._lock:
+            self._pending -= 1
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+
+class ComputeExecutor:
+    """
+    Dispatches core calls to a process pool (heavy) or a thread pool (light).
+
+    With ``mode="thread"`` heavy calls also use threads, and with
+    ``mode="inline"`` every call runs directly in the event loop (useful
+    for debugging).
+    """
+
+    def __init__(self, mode: str = "process", process_workers: Optional[int] = None,
+                 thread_workers: int = 8, max_pending: int = 64, timeout: Optional[float] = 30.0,
+                 start_method: Optional[str] = None):
+        """
+        Args:
+            mode: 'process', 'thread' or 'inline'
+            process_workers: Size of the process pool (default: CPU count)
+            thread_workers: Size of the thread pool
+            max_pending: Maximum outstanding calls per pool
+            timeout: Default per-call timeout in seconds (None: no timeout)
+            start_method: multiprocessing start method for worker processes
+        """
+        if mode not in ("process", "thread", "inline"):
+            raise ValueError(f"Unknown executor mode: {mode}")
+
+        self.mode = mode
+        self.timeout = timeout
+        self.single_flight = SingleFlight()
+
+        self._light = _BoundedPool(
+            "thread",
+            partial(ThreadPoolExecutor, max_workers=thread_workers, thread_name_prefix="compute"),
+            max_pending,
+        )
+        if mode == "process":
+            context = multiprocessing.get_context(start_method)
+            self._heavy = _BoundedPool(
+                "process",
+                partial(ProcessPoolExecutor, max_workers=process_workers, mp_context=context,
+                        initializer=warm_worker),
+                max_pending,
+            )
+        else:
+            self._heavy = self._light
+
+    async def run_heavy(self, fn: Callable, *args, timeout: Optional[float] = None,
+                        use_shared_cache: bool = True, **kwargs) -> Any:
+        """
+        Run a CPU-heavy call on the process pool.
+
+        ``fn`` and its arguments must be picklable (see app.services.operations).
+        ``use_shared_cache=False`` skips the shared cache for persistent calls.
+
+        Raises:
+            ExecutorSaturated: If the pool has too many pending calls
+            ComputeTimeout: If the call takes longer than the timeout
+        """
+        return await self._run(self._heavy, fn, args, kwargs, timeout, use_shared_cache)
+
+    async def run_light(self, fn: Callable, *args, timeout: Optional[float] = None,
+                        use_shared_cache: bool = True, **kwargs) -> Any:
+        """Run a cheap call on the thread pool (same options and errors as ``run_heavy``)."""
+        return await self._run(self._light, fn, args, kwargs, timeout, use_shared_cache)
+
+    async def _run(self, pool: _BoundedPool, fn: Callable, args, kwargs,
+                   timeout: Optional[float], use_shared_cache: bool = True) -> Any:
+        persistent = getattr(fn, "persistent", False)
+        if self.mode == "inline":
+            return call_cached(fn, args, kwargs, use_shared_cache) if persistent else fn(*args, **kwargs)
+
+        def submit() -> Future:
+            if persistent:
+                return pool.submit(call_cached, fn, args, kwargs, use_shared_cache)
+            return pool.submit(fn, *args, **kwargs)
+
+        coalesce_key = getattr(fn, "coalesce_key", None)
+        key: Optional[Hashable] = None
+        if coalesce_key is not None:
+            key = (pool.name, coalesce_key(*args, **kwargs))
+            future = self.single_flight.join(key, submit)
+        else:
+            future = submit()
+
+        timeout = self.timeout if timeout is None else timeout
+        completed = False
+        try:
+            # shield: one waiter giving up must not cancel the call for the others
+            result = await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(future)), timeout)
+            completed = True
+            return result
+        except asyncio.TimeoutError:
+            raise ComputeTimeout(f"{getattr(fn, '__name__', 'call')} exceeded {timeout:g}s")
+        finally:
+            last_waiter = key is None or self.single_flight.leave(key, future)
+            if not completed and last_waiter and not future.done():
+                # Drops the call if it has not started; a running call finishes in the background
+                future.cancel()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "mode": self.mode,
+            "heavy_pending": self._heavy.pending,
+            "light_pending": self._light.pending,
+            "max_pending": self._light.max_pending,
+            **self.single_flight.stats(),
+        }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop both pools; they are restarted lazily on the next call."""
+        self._heavy.shutdown(wait)
+        self._light.shutdown(wait)
+
+
+# Global executor shared by all endpoints
+compute_executor = ComputeExecutor(
+    mode=settings.COMPUTE_MODE,
+    process_workers=settings.COMPUTE_PROCESS_WORKERS,
+    thread_workers=settings.COMPUTE_THREAD_WORKERS,
+    max_pending=settings.COMPUTE_MAX_PENDING,
+    timeout=settings.COMPUTE_TIMEOUT,
+    start_method=settings.COMPUTE_START_METHOD,
+)
+
+
+async def run_heavy(fn: Callable, *args, **kwargs) -> Any:
+    """Run a heavy call on the global executor."""
+    return await compute_executor.run_heavy(fn, *args, **kwargs)
+
+
+async def run_light(fn: Callable, *args, **kwargs) -> Any:
+    """Run a cheap call on the global executor."""
+    return await compute_executor.run_light(fn, *args, **kwargs)
@@ -0,0 +1,220 @@
+"""
+Picklable entry points into app.core.
+
+Every function here takes plain arguments and returns plain data, so it
+can run in a worker process as well as in a thread. Endpoints never call
+the heavy parts of app.core directly; they dispatch these functions
+through the compute executor.
+
+Operations decorated with ``@coalesced`` carry a ``coalesce_key``: a
+canonical description of the call (for most operations 'SO(10)', 'so10'
+and 'D5' give the same key), which the executor uses to share one in-flight computation
+between identical concurrent requests. Their results are pure functions
+of that key, so the executor also stores them in the persistent result
+cache (app.services.result_cache).
+"""
+
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence
+
+from app.core.dimension_search import search_irreps
+from app.core.freudenthal import Character, ProgressCallback, dominant_character
+from app.core.irreps import IrrepCalculator
+from app.core.lie_algebra import parse_semisimple_notation
+from app.core.registry import get_algebra
+from app.core.tensor_products import TensorProductCalculator
+from app.core.weight_systems import calculate_weight_diagram_data
+from app.core.weyl import weyl_dimension, weyl_dimensions
+
+
+def canonical_group_name(group_name: str) -> str:
+    """Canonical Cartan type of a (semisimple) group, or the raw name if it does not parse."""
+    try:
+        return "+".join(parse_semisimple_notation(group_name.strip()))
+    except Exception:
+        return group_name
+
+
+def _freeze(value: Any) -> Hashable:
+    """Hashable form of JSON-like arguments."""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    return value
+
+
+def coalesced(fn: Optional[Callable] = None, *, canonical_group: bool = True,
+              persistent: bool = True) -> Callable:
+    """
+    Mark an operation whose concurrent identical calls may share one result.
+
+    The operation's first argument must be a group name. Pass
+    ``canonical_group=False`` when the result echoes the name as given, and
+    ``persistent=False`` to keep its results out of the result cache.
+    """
+    def decorate(fn: Callable) -> Callable:
+        def coalesce_key(group_name: str, *args, **kwargs) -> Hashable:
+            group = canonical_group_name(group_name) if canonical_group else group_name
+            # Keyword arguments left at None mean the default, as when omitted
+            kwargs = {key: value for key, value in kwargs.items() if value is not None}
+            return (fn.__name__, group, _freeze(args), _freeze(kwargs))
+
+        fn.coalesce_key = coalesce_key
+        fn.persistent = persistent
+        return fn
+
+    return decorate(fn) if fn is not None else decorate
+
+
+def warm_worker() -> None:
+    """Worker initializer: map the algebra bundle before the first task."""
+    from app.core.algebra_bundle import get_default_bundle
+
+    get_default_bundle()
+
+
+# GroupResponse fields, each computed only when requested. Rank and
+# dimension come in closed form; only the root fields resolve the root system.
+GROUP_FIELDS: Dict[str, Callable[[Any], Any]] = {
+    # Unique ID from the canonical Cartan type
+    "id": lambda calc: f"{calc.cartan_type.lower()}-{calc.get_rank()}",
+    "name": lambda calc: calc.physics_name,
+    "cartan_name": lambda calc: calc.cartan_type,
+    "rank": lambda calc: calc.get_rank(),
+    "cartan_matrix": lambda calc: calc.get_cartan_matrix(),
+    "simple_roots": lambda calc: calc.get_simple_roots(),
+    "dimension": lambda calc: calc.get_dimension(),
+    "positive_roots": lambda calc: calc.get_positive_roots(),
+}
+
+# IrrepResponse fields that need the weight system
+WEIGHT_SYSTEM_FIELDS = ("weights", "multiplicities")
+
+
+@coalesced
+def group_data(group_name: str, fields: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+    """
+    GroupResponse payload for a group.
+
+    Args:
+        group_name: Group name in any supported notation
+        fields: GroupResponse fields to compute (default: all), in any order
+
+    Raises:
+        KeyError: For a field that GroupResponse does not have
+    """
+    unknown = set(fields or ()) - set(GROUP_FIELDS)
+    if unknown:
+        raise KeyError(f"Unknown group fields: {', '.join(sorted(unknown))}")
+    calc = get_algebra(group_name)
+    names = GROUP_FIELDS if fields is None else [name for name in GROUP_FIELDS if name in fields]
+    return {name: GROUP_FIELDS[name](calc) for name in names}
+
+
+@coalesced
+def group_info(group_name: str) -> Dict[str, Any]:
+    """Summary information about an algebra."""
+    return get_algebra(group_name).get_algebra_info()
+
+
+@coalesced
+def root_system_data(group_name: str) -> Dict[str, Any]:
+    """Complete root system of an algebra."""
+    return get_algebra(group_name).get_root_system_data()
+
+
+@coalesced
+def dynkin_diagram(group_name: str) -> Dict[str, Any]:
+    """Dynkin diagram of an algebra."""
+    return get_algebra(group_name).get_dynkin_diagram()
+
+
+@coalesced(canonical_group=False)
+def irrep_data(group_name: str, highest_weight: List[int], max_weights: Optional[int] = None,
+               progress: Optional[ProgressCallback] = None) -> Dict[str, Any]:
+    """
+    Irrep data with its weight system as a WeightSystem.
+
+    Raises:
+        WeightLimitExceeded: If the irrep has more than ``max_weights`` weights
+    """
+    calc = IrrepCalculator(group_name, highest_weight)
+    return calc.get_irrep_data(max_weights=max_weights, progress=progress)
+
+
+@coalesced(canonical_group=False)
+def irrep_summary(group_name: str, highest_weight: List[int]) -> Dict[str, Any]:
+    """
+    Irrep data without the weight system: dimension from the Weyl formula.
+
+    Answers irreps of any size, since no weights are generated.
+    """
+    calc = IrrepCalculator(group_name, highest_weight)
+    return {
+        "highest_weight": highest_weight,
+        "dimension": calc.calculate_dimension_weyl(),
+        "latex_name": calc.get_latex_name(),
+        "group": group_name,
+    }
+
+
+def irrep_dimensions(group_name: str, labels: Sequence[Sequence[int]]) -> List[int]:
+    """
+    Exact Weyl dimensions of many irreps of one group, in one vectorized pass.
+
+    Not coalesced: a batch of labels rarely repeats, and its results are
+    cheaper to recompute than to cache.
+    """
+    return weyl_dimensions(group_name, labels)
+
+
+@coalesced(persistent=False)
+def irrep_search(group_name: str, dimension_min: int, dimension_max: int, offset: int = 0,
+                 limit: Optional[int] = None) -> Dict[str, Any]:
+    """
+    One page of the irreps with dimension in ``[dimension_min, dimension_max]``.
+
+    Not kept in the result cache: the dimension index behind it is
+    persisted already.
+    """
+    labels, dimensions = search_irreps(group_name, dimension_min, dimension_max)
+    stop = None if limit is None else offset + limit
+    return {
+        "cartan_type": get_algebra(group_name).cartan_type,
+        "total": len(dimensions),
+        "irreps": [{"dynkin_labels": row, "dimension": dimension}
+                   for row, dimension in zip(labels[offset:stop].tolist(), dimensions[offset:stop].tolist())],
+    }
+
+
+@coalesced
+def tensor_product(group_name: str, irrep1: List[int], irrep2: List[int],
+                   progress: Optional[ProgressCallback] = None) -> Dict[str, Any]:
+    """Tensor product decomposition with its LaTeX formula."""
+    calc = TensorProductCalculator(group_name)
+    decomposition = calc.decompose(irrep1, irrep2, progress)
+
+    return {
+        "decomposition": decomposition,
+        "latex": calc.get_latex_formula(irrep1, irrep2, decomposition),
+    }
+
+
+@coalesced(canonical_group=False)
+def weight_diagram(group_name: str, irrep: List[int]) -> Dict[str, Any]:
+    """Weight diagram data for visualization."""
+    return calculate_weight_diagram_data(group_name, irrep)
+
+
+@coalesced
+def weight_system_header(group_name: str, labels: Sequence[int]) -> Dict[str, Any]:
+    """Canonical type, dominant character and dimension for streaming a weight system."""
+    algebra = get_algebra(group_name)
+    labels = tuple(labels)
+    character: Character = dominant_character(algebra.cartan_type, labels)
+
+    return {
+        "cartan_type": algebra.cartan_type,
+        "character": character,
+        "dimension": weyl_dimension(algebra.cartan_type, labels),
+    }
@@ -0,0 +1,268 @@
+"""
+Persistent result cache shared by every server and worker process.
+
+Operations in app.services.operations are pure functions of their
+canonical inputs, so their results can outlive the process that computed
+them. Results are stored in a SQLite file in WAL mode: any number of
+processes read concurrently while one writes, and a restarted server
+starts warm.
+
+Entries are content-addressed: the key is a SHA-256 digest of the
+operation's canonical call key (operation, Cartan type, Dynkin labels,
+...) and ``RESULT_CACHE_VERSION``, which is bumped whenever the meaning
+of a stored result changes. Shared-cache keys carry the version as a
+``v<N>:`` prefix for the same reason. Values are encoded with app.services.codec.
+When the file grows beyond ``max_bytes`` the least recently used entries
+are evicted.
+
+Misses fall through to the shared second-level cache
+(app.services.shared_cache) when one is configured, so results computed
+on other hosts are reused and copied locally. Batches and the warm-up
+know all their calls in advance: they look them up in the shared cache
+with one ``shared_lookup_many`` round trip and write the results they
+computed back with one ``shared_store_many``.
+
+The cache is best effort: a locked, corrupt or unwritable database is
+logged and treated as a miss, never as a failed calculation.
+"""
+
+from pathlib import Path
+from threading import Lock, local
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+import hashlib
+import logging
+import os
+import sqlite3
+import time
+
+from app.config import settings
+from . import codec
+from .shared_cache import MISSING, get_shared_cache, spec_key
+
+
+logger = logging.getLogger(__name__)
+
+RESULT_CACHE_VERSION = 1
+
+DEFAULT_RESULT_CACHE_PATH = Path(__file__).resolve().parent.parent / "data" / "result_cache.sqlite"
+
+# Fraction of max_bytes kept after an eviction, so evictions are batched
+_EVICT_TO = 0.9
+# Last-access times are refreshed at most this often (seconds) to limit writes
+_TOUCH_INTERVAL = 60.0
+
+
+def result_key(call_key: Hashable) -> str:
+    """Content address of a canonical call key."""
+    return hashlib.sha256(f"{RESULT_CACHE_VERSION}:{call_key!r}".encode()).hexdigest()
+
+
+def shared_key(call_key: Hashable) -> str:
+    """Shared-cache key of a canonical call key, scoped to ``RESULT_CACHE_VERSION``."""
+    return f"v{RESULT_CACHE_VERSION}:{spec_key(call_key)}"
+
+
+class ResultCache:
+    """Encoded results in a SQLite file, with size-bounded LRU eviction."""
+
+    def __init__(self, path: str, max_bytes: int = 256 * 1024 * 1024):
+        """
+        Args:
+            path: Database file (created if missing)
+            max_bytes: Total size of stored values before evicting
+        """
+        self.path = str(path)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._local = local()
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        conn = self._connection()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            " key TEXT PRIMARY KEY, operation TEXT NOT NULL, value BLOB NOT NULL,"
+            " size INTEGER NOT NULL, accessed REAL NOT NULL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed)")
+
+    def _connection(self) -> sqlite3.Connection:
+        """One connection per thread and process (connections must not cross a fork)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn, self._local.pid = conn, os.getpid()
+        return conn
+
+    def get(self, key: str) -> Any:
+        """Cached value for ``key``, or ``MISSING``."""
+        try:
+            conn = self._connection()
+            row = conn.execute("SELECT value, accessed FROM results WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return MISSING
+            value = codec.decode(row[0])
+            now = time.time()
+            if now - row[1] > _TOUCH_INTERVAL:
+                conn.execute("UPDATE results SET accessed = ? WHERE key = ?", (now, key))
+        except (sqlite3.Error, ValueError) as e:
+            logger.warning("Result cache read failed: %s", e)
+            self.misses += 1
+            return MISSING
+        self.hits += 1
+        return value
+
+    def put(self, key: str, operation: str, value: Any) -> bool:
+        """
+        Store a value, evicting old entries if the cache is full.
+
+        Returns:
+            True if the value was stored
+        """
+        try:
+            blob = codec.encode(value)
+        except TypeError as e:
+            logger.warning("Not caching %s result: %s", operation, e)
+            return False
+        if len(blob) > self.max_bytes:
+            return False
+
+        try:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO results (key, operation, value, size, accessed) VALUES (?, ?, ?, ?, ?)",
+                (key, operation, blob, len(blob), time.time()),
+            )
+            self._evict(conn)
+        except sqlite3.Error as e:
+            logger.warning("Result cache write failed: %s", e)
+            return False
+        return True
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        # Keep the most recently used entries that fit in the target size
+        conn.execute(
+            "DELETE FROM results WHERE key IN ("
+            " SELECT key FROM (SELECT key, SUM(size) OVER (ORDER BY accessed DESC, key) AS kept"
+            " FROM results) WHERE kept > ?)",
+            (int(self.max_bytes * _EVICT_TO),),
+        )
+
+    def clear(self) -> None:
+        self._connection().execute("DELETE FROM results")
+
+    def stats(self) -> Dict[str, Any]:
+        entries, size = self._connection().execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results").fetchone()
+        return {"entries": entries, "bytes": size, "max_bytes": self.max_bytes,
+                "hits": self.hits, "misses": self.misses}
+
+
+_result_cache: Optional[ResultCache] = None
+_result_cache_loaded = False
+_result_cache_lock = Lock()
+
+
+def get_result_cache() -> Optional[ResultCache]:
+    """
+    The configured cache of this process, opened on first use.
+
+    Returns None if the cache is disabled or cannot be opened.
+    """
+    global _result_cache, _result_cache_loaded
+
+    if _result_cache_loaded:
+        return _result_cache
+
+    with _result_cache_lock:
+        if not _result_cache_loaded:
+            if settings.RESULT_CACHE_ENABLED:
+                path = settings.RESULT_CACHE_PATH or DEFAULT_RESULT_CACHE_PATH
+                try:
+                    _result_cache = ResultCache(path, settings.RESULT_CACHE_MAX_BYTES)
+                except (sqlite3.Error, OSError) as e:
+                    logger.warning("Result cache %s unavailable: %s", path, e)
+            _result_cache_loaded = True
+
+    return _result_cache
+
+
+# An operation call: (operation, positional arguments, keyword arguments)
+Call = Tuple[Callable, tuple, Dict[str, Any]]
+
+
+def call_cached(fn: Callable, args: tuple, kwargs: Dict[str, Any], use_shared_cache: bool = True) -> Any:
+    """
+    Call an operation through the local and shared result caches.
+
+    Runs inside pool workers, so lookups, computation and storage all
+    happen off the event loop. Only successful results are stored.
+    ``use_shared_cache=False`` skips the shared cache, for callers that
+    already looked the call up with ``shared_lookup_many`` and store its
+    result with ``shared_store_many``.
+    """
+    cache = get_result_cache()
+    shared = get_shared_cache() if use_shared_cache else None
+    if cache is None and shared is None:
+        return fn(*args, **kwargs)
+
+    call_key = fn.coalesce_key(*args, **kwargs)
+    key = result_key(call_key)
+    value = cache.get(key) if cache is not None else MISSING
+    if value is not MISSING:
+        return value
+
+    if shared is not None:
+        value = shared.get(shared_key(call_key))
+    if value is MISSING:
+        value = fn(*args, **kwargs)
+        if shared is not None:
+            shared.set(shared_key(call_key), value)
+    if cache is not None:
+        cache.put(key, call_key[0], value)
+    return value
+
+
+def shared_lookup_many(calls: Sequence[Call]) -> List[Any]:
+    """
+    Look up persistent calls in the shared cache with one round trip.
+
+    Hits are copied to the local cache, as in ``call_cached``. Blocking;
+    run it on the thread pool.
+
+    Returns:
+        Values in call order, ``MISSING`` for misses (all of them without
+        a shared cache)
+    """
+    shared = get_shared_cache()
+    if shared is None or not calls:
+        return [MISSING] * len(calls)
+    call_keys = [fn.coalesce_key(*args, **kwargs) for fn, args, kwargs in calls]
+    values = shared.get_many([shared_key(call_key) for call_key in call_keys])
+
+    cache = get_result_cache()
+    if cache is not None:
+        for call_key, value in zip(call_keys, values):
+            if value is not MISSING:
+                cache.put(result_key(call_key), call_key[0], value)
+    return values
+
+
+def shared_store_many(results: Sequence[Tuple[Call, Any]]) -> int:
+    """
+    Store computed results of persistent calls in the shared cache with one round trip.
+
+    Returns:
+        Number of values stored
+    """
+    shared = get_shared_cache()
+    if shared is None or not results:
+        return 0
+    return shared.set_many({shared_key(fn.coalesce_key(*args, **kwargs)): value
+                            for (fn, args, kwargs), value in results})
@@ -0,0 +1,278 @@
+"""
+Second-level result cache shared between hosts.
+
+The persistent result cache (app.services.result_cache) is local to one
+host. Behind it sits this shared tier, so horizontally scaled API pods
+reuse each other's results. Keys follow the scheme of PROJECT_SPEC.md,
+``operation:group:params``, for example::
+
+    irrep:SU3:1,0
+    tensor:E6:1,0,0,0,0,0:0,0,0,0,0,1
+    irrep:SU3:1,0:max_weights=1000
+
+Values are encoded with app.services.codec, which compresses large blobs.
+Batch lookups and stores take one round trip each (Redis pipelines).
+
+- MemorySharedCache: per-process LRU dict, for development and tests
+- RedisSharedCache: the Redis server from docker-compose
+
+Like the local cache, this tier is best effort: connection errors are
+logged and count as misses.
+"""
+
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Dict, Hashable, List, Mapping, Optional, Sequence
+import logging
+import time
+
+from app.config import settings
+from . import codec
+
+
+logger = logging.getLogger(__name__)
+
+MISSING = object()
+
+# Operation name -> key prefix
+KEY_PREFIXES = {
+    "irrep_data": "irrep",
+    "tensor_product": "tensor",
+    "weight_diagram": "weight_diagram",
+    "weight_system_header": "weight_system",
+    "group_data": "group",
+    "group_info": "group_info",
+    "root_system_data": "root_system",
+    "dynkin_diagram": "dynkin",
+}
+
+
+def _format(value: Any) -> str:
+    if isinstance(value, tuple):
+        if all(not isinstance(item, tuple) for item in value):
+            return ",".join(_format(item) for item in value)
+        return ";".join(_format(item) for item in value)
+    if value is None:
+        return ""
+    return str(value)
+
+
+def spec_key(call_key: Hashable) -> str:
+    """
+    Shared-cache key of a canonical call key (see operations.coalesced).
+
+    Positional parameters follow the group, keyword parameters come last
+    as ``name=value``.
+    """
+    operation, group, args, kwargs = call_key
+    parts = [KEY_PREFIXES.get(operation, operation), str(group).replace(" ", "")]
+    parts.extend(_format(arg) for arg in args)
+    parts.extend(f"{name}={_format(value)}" for name, value in kwargs)
+    return ":".join(parts)
+
+
+class SharedCache(ABC):
+    """Interface shared by all second-level caches."""
+
+    def __init__(self, ttl: Optional[float] = None, prefix: str = ""):
+        """
+        Args:
+            ttl: Seconds to keep entries (None: until evicted)
+            prefix: Prepended to every key, e.g. to separate deployments
+        """
+        self.ttl = ttl
+        self.prefix = prefix
+        self.hits = 0
+        self.misses = 0
+
+    def get_many(self, keys: Sequence[str]) -> List[Any]:
+        """Values for ``keys`` in order, with ``MISSING`` for misses."""
+        values = []
+        for blob in self._get_blobs([self.prefix + key for key in keys]):
+            value = MISSING
+            if blob is not None:
+                try:
+                    value = codec.decode(blob)
+                except ValueError as e:
+                    logger.warning("Ignoring corrupt shared cache entry: %s", e)
+            values.append(value)
+        found = sum(value is not MISSING for value in values)
+        self.hits += found
+        self.misses += len(values) - found
+        return values
+
+    def set_many(self, items: Mapping[str, Any]) -> int:
+        """
+        Store several values.
+
+        Returns:
+            Number of values stored (unencodable values are skipped)
+        """
+        blobs = {}
+        for key, value in items.items():
+            try:
+                blobs[self.prefix + key] = codec.encode(value)
+            except TypeError as e:
+                logger.warning("Not caching %s: %s", key, e)
+        if blobs:
+            self._set_blobs(blobs)
+        return len(blobs)
+
+    def get(self, key: str) -> Any:
+        return self.get_many([key])[0]
+
+    def set(self, key: str, value: Any) -> bool:
+        return self.set_many({key: value}) == 1
+
+    @abstractmethod
+    def delete_many(self, keys: Sequence[str]) -> None:
+        """Remove entries; missing keys are ignored."""
+
+    @abstractmethod
+    def _get_blobs(self, keys: List[str]) -> List[Optional[bytes]]:
+        """Encoded values of prefixed keys, None for misses."""
+
+    @abstractmethod
+    def _set_blobs(self, blobs: Dict[str, bytes]) -> None:
+        """Store encoded values under prefixed keys."""
+
+    def stats(self) -> Dict[str, Any]:
+        return {"backend": type(self).__name__, "hits": self.hits, "misses": self.misses}
+
+
+class MemorySharedCache(SharedCache):
+    """Encoded values in an LRU dict; only visible to the current process."""
+
+    def __init__(self, ttl: Optional[float] = None, prefix: str = "", max_entries: int = 1024):
+        super().__init__(ttl, prefix)
+        self.max_entries = max_entries
+        # key -> (expires_at, blob)
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = Lock()
+
+    def _get_blobs(self, keys: List[str]) -> List[Optional[bytes]]:
+        now = time.time()
+        blobs = []
+        with self._lock:
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is not None and entry[0] is not None and entry[0] <= now:
+                    del self._entries[key]
+                    entry = None
+                if entry is not None:
+                    self._entries.move_to_end(key)
+                blobs.append(entry[1] if entry is not None else None)
+        return blobs
+
+    def _set_blobs(self, blobs: Dict[str, bytes]) -> None:
+        expires_at = time.time() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            for key, blob in blobs.items():
+                self._entries[key] = (expires_at, blob)
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete_many(self, keys: Sequence[str]) -> None:
+        with self._lock:
+            for key in keys:
+                self._entries.pop(self.prefix + key, None)
+
+
+class RedisSharedCache(SharedCache):
+    """Encoded values in Redis; Redis expires and evicts them itself."""
+
+    def __init__(self, url: str, ttl: Optional[float] = None, prefix: str = ""):
+        import redis
+
+        super().__init__(ttl, prefix)
+        self._errors = redis.RedisError
+        self._redis = redis.Redis.from_url(url, socket_timeout=1.0)
+        self._redis.ping()
+
+    def _get_blobs(self, keys: List[str]) -> List[Optional[bytes]]:
+        try:
+            with self._redis.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.get(key)
+                return pipe.execute()
+        except self._errors as e:
+            logger.warning("Shared cache read failed: %s", e)
+            return [None] * len(keys)
+
+    def _set_blobs(self, blobs: Dict[str, bytes]) -> None:
+        expire_ms = max(int(self.ttl * 1000), 1) if self.ttl is not None else None
+        try:
+            with self._redis.pipeline(transaction=False) as pipe:
+                for key, blob in blobs.items():
+                    pipe.set(key, blob, px=expire_ms)
+                pipe.execute()
+        except self._errors as e:
+            logger.warning("Shared cache write failed: %s", e)
+
+    def delete_many(self, keys: Sequence[str]) -> None:
+        if not keys:
+            return
+        try:
+            self._redis.delete(*(self.prefix + key for key in keys))
+        except self._errors as e:
+            logger.warning("Shared cache delete failed: %s", e)
+
+
+def create_shared_cache(kind: str, ttl: Optional[float] = None, prefix: str = "",
+                        redis_url: Optional[str] = None) -> Optional[SharedCache]:
+    """
+    Build the configured shared cache.
+
+    Args:
+        kind: 'none', 'memory', 'redis' or 'auto' (Redis if reachable, else none)
+        ttl: Seconds to keep entries
+        prefix: Key prefix
+        redis_url: Redis URL for the Redis cache
+    """
+    if kind == "none":
+        return None
+    if kind == "memory":
+        return MemorySharedCache(ttl, prefix)
+    if kind == "redis":
+        if not redis_url:
+            raise ValueError("SHARED_CACHE=redis requires REDIS_URL")
+        return RedisSharedCache(redis_url, ttl, prefix)
+    if kind != "auto":
+        raise ValueError(f"Unknown shared cache: {kind}")
+
+    if redis_url:
+        try:
+            return RedisSharedCache(redis_url, ttl, prefix)
+        except Exception as e:
+            logger.info("Redis shared cache unavailable (%s); using the local cache only", e)
+    return None
+
+
+_shared_cache: Optional[SharedCache] = None
+_shared_cache_loaded = False
+_shared_cache_lock = Lock()
+
+
+def get_shared_cache() -> Optional[SharedCache]:
+    """The configured shared cache, connected on first use (None if disabled)."""
+    global _shared_cache, _shared_cache_loaded
+
+    if _shared_cache_loaded:
+        return _shared_cache
+
+    with _shared_cache_lock:
+        if not _shared_cache_loaded:
+            try:
+                _shared_cache = create_shared_cache(
+                    settings.SHARED_CACHE,
+                    ttl=settings.SHARED_CACHE_TTL,
+                    prefix=settings.SHARED_CACHE_PREFIX,
+                    redis_url=settings.REDIS_URL,
+                )
+            except Exception as e:
+                logger.warning("Shared cache unavailable: %s", e)
+            _shared_cache_loaded = True
+
+    return _shared_cache
@@ -0,0 +1,76 @@
+"""
+Single-flight coalescing of identical concurrent calls.
+
+When several requests ask for the same computation at the same time, only
+the first one starts it; the others wait on the same
+``concurrent.futures.Future`` and share its result. Futures are thread-safe
+and can be awaited from any event loop, so coalescing works across request
+handlers and across the thread and process pools of the executor. Once the
+call finishes its key is forgotten, so later requests start a fresh call
+(results are cached elsewhere).
+"""
+
+from concurrent.futures import Future
+from threading import Lock
+from typing import Any, Callable, Dict, Hashable, List
+
+
+class SingleFlight:
+    """Maps call keys to the future of the call currently in flight."""
+
+    def __init__(self):
+        # key -> [future, number of waiters]
+        self._calls: Dict[Hashable, List[Any]] = {}
+        self._lock = Lock()
+        self.started = 0
+        self.coalesced = 0
+
+    def join(self, key: Hashable, start: Callable[[], Future]) -> Future:
+        """
+        Future of the in-flight call for ``key``, starting it if there is none.
+
+        Every ``join`` must be paired with a ``leave``.
+
+        Args:
+            key: Canonical, hashable description of the call
+            start: Starts the call and returns its future
+        """
+        with self._lock:
+            entry = self._calls.get(key)
+            if entry is not None:
+                entry[1] += 1
+                self.coalesced += 1
+                return entry[0]
+
+            future = start()
+            self._calls[key] = [future, 1]
+            self.started += 1
+
+        future.add_done_callback(lambda done: self._forget(key, done))
+        return future
+
+    def leave(self, key: Hashable, future: Future) -> bool:
+        """
+        Stop waiting on a call.
+
+        Returns:
+            True if nobody else waits on it, so it may be cancelled
+        """
+        with self._lock:
+            entry = self._calls.get(key)
+            if entry is None or entry[0] is not future:
+                return True
+            entry[1] -= 1
+            return entry[1] == 0
+
+    def _forget(self, key: Hashable, future: Future) -> None:
+        with self._lock:
+            entry = self._calls.get(key)
+            if entry is not None and entry[0] is future:
+                del self._calls[key]
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    def stats(self) -> Dict[str, int]:
+        return {"in_flight": len(self._calls), "started": self.started, "coalesced": self.coalesced}
@@ -0,0 +1,164 @@
+"""
+Background warm-up of the algebra registry and result caches.
+
+A cold server pays root-system construction and weight-system
+computation on its first requests. At startup the warm-up runs the
+endpoint operations for the supported groups and a configurable hot set
+of irreps and tensor products through the compute executor, so the
+registry, the worker processes and the result caches are populated
+before traffic arrives. It runs as a background task: the server accepts
+requests immediately, and the readiness endpoint reports progress so a
+load balancer can wait for it.
+
+With a shared result cache, a host joining a warm cluster looks all
+persistent warm-up calls up in one round trip and only computes the
+misses, whose results are written back together at the end.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+import asyncio
+import logging
+import time
+
+from app.config import settings
+from app.core.lie_algebra import LieAlgebraCalculator
+from . import operations
+from .executor import ComputeExecutor, ComputeUnavailable
+from .result_cache import MISSING, shared_lookup_many, shared_store_many
+
+
+logger = logging.getLogger(__name__)
+
+PENDING = "pending"
+RUNNING = "running"
+COMPLETE = "complete"
+
+# Operations behind GET /groups/{name}, /info, /root-system and /dynkin-diagram
+GROUP_OPERATIONS = (
+    operations.group_data,
+    operations.group_info,
+    operations.root_system_data,
+    operations.dynkin_diagram,
+)
+
+
+@dataclass
+class WarmupState:
+    """Progress of the warm-up, reported by the health endpoints."""
+
+    status: str = PENDING
+    total: int = 0
+    done: int = 0
+    failed: int = 0
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def ready(self) -> bool:
+        return self.status == COMPLETE
+
+    def to_dict(self) -> Dict[str, Any]:
+        elapsed = None
+        if self.started_at is not None:
+            elapsed = round((self.finished_at or time.time()) - self.started_at, 3)
+        return {
+            "status": self.status,
+            "total": self.total,
+            "done": self.done,
+            "failed": self.failed,
+            "progress": round(self.done / self.total, 3) if self.total else 1.0,
+            "elapsed": elapsed,
+        }
+
+
+# Warm-up state of this server process
+warmup_state = WarmupState()
+
+
+def warmup_calls(groups: Sequence[str], irreps: Sequence[Tuple[str, Sequence[int]]],
+                 tensor_products: Sequence[Tuple[str, Sequence[int], Sequence[int]]],
+                 max_weights: Optional[int] = None) -> List[Tuple[bool, Callable, tuple, dict]]:
+    """
+    The calls to warm, as (heavy, operation, args, kwargs).
+
+    Irreps are warmed with the same arguments as the irrep endpoints (the
+    canonical group name, whatever alias the configuration uses), so their
+    cached results are the ones those endpoints look up.
+    """
+    calls = [(False, operation, (group,), {}) for group in groups for operation in GROUP_OPERATIONS]
+    calls += [(True, operations.irrep_data, (operations.canonical_group_name(group), list(labels)),
+               {"max_weights": max_weights})
+              for group, labels in irreps]
+    calls += [(True, operations.tensor_product, (group, list(irrep1), list(irrep2)), {})
+              for group, irrep1, irrep2 in tensor_products]
+    return calls
+
+
+async def warm_up(executor: ComputeExecutor, calls: Sequence[Tuple[bool, Callable, tuple, dict]],
+                  state: WarmupState, concurrency: int = 2) -> WarmupState:
+    """
+    Run the warm-up calls, recording progress in ``state``.
+
+    Failures are logged and counted but do not stop the warm-up. At most
+    ``concurrency`` calls run at once, leaving the pools to real requests.
+    """
+    state.status, state.total, state.done, state.failed = RUNNING, len(calls), 0, 0
+    state.started_at, state.finished_at = time.time(), None
+    state.errors.clear()
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+    # One shared-cache round trip; hits are already warm (and copied to the local cache)
+    persistent = [index for index, call in enumerate(calls) if getattr(call[1], "persistent", False)]
+    try:
+        cached = await executor.run_light(shared_lookup_many, [calls[index][1:] for index in persistent])
+    except ComputeUnavailable:
+        cached = [MISSING] * len(persistent)
+    prefetched = dict(zip(persistent, cached))
+    computed = []
+
+    async def run(index: int, heavy: bool, operation: Callable, args: tuple, kwargs: dict) -> None:
+        if prefetched.get(index, MISSING) is not MISSING:
+            state.done += 1
+            return
+        async with semaphore:
+            run_call = executor.run_heavy if heavy else executor.run_light
+            try:
+                value = await run_call(operation, *args, use_shared_cache=index not in prefetched, **kwargs)
+                if index in prefetched:
+                    computed.append(((operation, args, kwargs), value))
+            except Exception as e:
+                state.failed += 1
+                state.errors.append(f"{operation.__name__}{args}: {e}")
+                logger.warning("Warm-up of %s%s failed: %s", operation.__name__, args, e)
+            state.done += 1
+
+    await asyncio.gather(*(run(index, *call) for index, call in enumerate(calls)))
+    if computed:
+        try:
+            await executor.run_light(shared_store_many, computed)
+        except ComputeUnavailable as e:
+            logger.warning("Warm-up results not shared: %s", e)
+    state.status, state.finished_at = COMPLETE, time.time()
+    logger.info("Warm-up finished: %d calls, %d failed, %.1fs",
+                state.total, state.failed, state.finished_at - state.started_at)
+    return state
+
+
+def start_warmup(executor: ComputeExecutor) -> Optional[asyncio.Task]:
+    """
+    Start the configured warm-up in the background.
+
+    Returns:
+        The warm-up task, or None if warm-up is disabled (the server is
+        then ready immediately)
+    """
+    if not settings.WARMUP_ENABLED:
+        warmup_state.status = COMPLETE
+        return None
+
+    groups = [group["cartan_type"] for group in LieAlgebraCalculator.list_available_groups()]
+    calls = warmup_calls(groups, settings.WARMUP_IRREPS, settings.WARMUP_TENSOR_PRODUCTS,
+                         max_weights=settings.MAX_WEIGHT_SYSTEM_SIZE)
+    return asyncio.create_task(warm_up(executor, calls, warmup_state, settings.WARMUP_CONCURRENCY))
@@ -0,0 +1,3 @@
+"""
+Asynchronous calculation jobs (submit / status / cancel).
+"""
@@ -0,0 +1,52 @@
+"""
+Celery application for running calculation jobs on separate workers.
+
+Used when JOB_BACKEND=celery (see docker-compose). Workers share job
+records with the API through the Redis job store:
+
+    celery -A app.tasks.celery_app worker --loglevel=info
+"""
+
+from celery import Celery
+
+from app.config import settings
+from .jobs import create_job_store_from_settings, run_job
+from .store import COMPLETED, FAILED, PENDING, RUNNING, finish_fields
+
+
+celery_app = Celery(
+    "grouptheory",
+    broker=settings.CELERY_BROKER_URL or settings.REDIS_URL,
+    backend=settings.CELERY_RESULT_BACKEND or settings.REDIS_URL,
+)
+celery_app.conf.update(
+    task_serializer="json",
+    result_serializer="json",
+    accept_content=["json"],
+    result_expires=settings.JOB_RESULT_TTL,
+)
+
+_store = None
+
+
+def _get_store():
+    global _store
+    if _store is None:
+        _store = create_job_store_from_settings(backend="celery")
+    return _store
+
+
+@celery_app.task(name="calculations.run")
+def run_calculation(task_id: str, operation: str, parameters: dict) -> None:
+    """Run one job and record progress and outcome in the job store."""
+    store = _get_store()
+    if store.update_if(task_id, (PENDING,), status=RUNNING) is None:
+        return  # cancelled (or unknown) before a worker picked it up
+    try:
+        result = run_job(operation, parameters,
+                         lambda percent: store.update_if(task_id, (RUNNING,), progress=percent))
+    except Exception as e:
+        store.update_if(task_id, (RUNNING,), **finish_fields(FAILED, error=f"{type(e).__name__}: {e}"))
+        return
+    # A job cancelled while running keeps its cancelled state
+    store.update_if(task_id, (RUNNING,), **finish_fields(COMPLETED, result=result))
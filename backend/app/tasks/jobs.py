@@ -0,0 +1,329 @@
+"""
+Asynchronous calculation jobs.
+
+Each job runs in its own worker process so it can be cancelled at any
+point by terminating the process. The worker reports progress through a
+pipe; a monitor thread in the server copies progress and the final result
+into the job store. At most ``max_workers`` jobs run at once, the rest wait
+in submission order.
+
+Every status change is a conditional store update (``update_if``) from the
+states it may leave, so a job that finished cannot be cancelled afterwards
+and a cancelled job cannot be completed by a late result.
+"""
+
+from collections import deque
+from inspect import signature
+from threading import Lock, Thread
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+import logging
+import multiprocessing
+
+from app.config import settings
+from app.core.freudenthal import ProgressCallback
+from app.core.weyl import weyl_dimension
+from app.services import operations
+from .store import (
+    ACTIVE_STATES, CANCELLED, COMPLETED, FAILED, PENDING, RUNNING,
+    JobStore, RedisJobStore, create_job_store, finish_fields, new_job,
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+# Job operations: keyword parameters in, JSON-compatible dict out
+
+def _irrep_job(group: str, highest_weight: list, max_weights: Optional[int] = None,
+               progress: Optional[ProgressCallback] = None) -> Dict[str, Any]:
+    # Clients may lower the limit, never raise it
+    limit = settings.JOB_MAX_WEIGHT_SYSTEM_SIZE
+    max_weights = limit if max_weights is None else min(max_weights, limit)
+    data = operations.irrep_data(group, highest_weight, max_weights, progress)
+    weights, multiplicities = data.pop("weight_system").to_lists()
+    data.update(weights=weights, multiplicities=multiplicities)
+    return data
+
+
+def _tensor_product_job(group: str, irrep1: list, irrep2: list,
+                        progress: Optional[ProgressCallback] = None) -> Dict[str, Any]:
+    return operations.tensor_product(group, irrep1, irrep2, progress)
+
+
+def _weight_diagram_job(group: str, irrep: list,
+                        progress: Optional[ProgressCallback] = None) -> Dict[str, Any]:
+    return operations.weight_diagram(group, irrep)
+
+
+def _root_system_job(group: str, progress: Optional[ProgressCallback] = None) -> Dict[str, Any]:
+    return operations.root_system_data(group)
+
+
+def _dimension_job(group: str, highest_weight: list,
+                   progress: Optional[ProgressCallback] = None) -> Dict[str, Any]:
+    return {"dimension": weyl_dimension(group, highest_weight)}
+
+
+JOB_OPERATIONS: Dict[str, Callable[..., Dict[str, Any]]] = {
+    "irrep": _irrep_job,
+    "tensor_product": _tensor_product_job,
+    "weight_diagram": _weight_diagram_job,
+    "root_system": _root_system_job,
+    "dimension": _dimension_job,
+}
+
+
+def validate_job(operation: str, parameters: Dict[str, Any]) -> None:
+    """
+    Check that an operation exists and accepts the given parameters.
+
+    Raises:
+        ValueError: For unknown operations or missing/unexpected parameters
+    """
+    fn = JOB_OPERATIONS.get(operation)
+    if fn is None:
+        raise ValueError(f"Unknown operation '{operation}'; expected one of {sorted(JOB_OPERATIONS)}")
+    if "progress" in parameters:
+        raise ValueError("'progress' is not a parameter")
+    try:
+        signature(fn).bind(**parameters)
+    except TypeError as e:
+        raise ValueError(f"Invalid parameters for '{operation}': {e}")
+
+
+def run_job(operation: str, parameters: Dict[str, Any],
+            progress: Optional[Callable[[int], None]] = None) -> Dict[str, Any]:
+    """
+    Run a job operation, reporting progress as whole percentages.
+
+    Percentages are only reported when they change, and 100 is left for
+    the caller to set together with the result.
+    """
+    last = -1
+
+    def report(fraction: float) -> None:
+        nonlocal last
+        percent = max(0, min(99, int(fraction * 100)))
+        if percent != last and progress is not None:
+            last = percent
+            progress(percent)
+
+    return JOB_OPERATIONS[operation](**parameters, progress=report)
+
+
+def _worker_main(operation: str, parameters: Dict[str, Any], conn) -> None:
+    """Entry point of a job process: send progress, then the result or error."""
+    try:
+        result = run_job(operation, parameters, lambda percent: conn.send(("progress", percent)))
+        conn.send(("result", result))
+    except Exception as e:
+        conn.send(("error", f"{type(e).__name__}: {e}"))
+    finally:
+        conn.close()
+
+
+class JobManager:
+    """Runs jobs in local worker processes and records them in a JobStore."""
+
+    def __init__(self, store: JobStore, max_workers: int = 2, start_method: Optional[str] = None):
+        """
+        Args:
+            store: Where job records live
+            max_workers: Jobs allowed to run at the same time
+            start_method: multiprocessing start method for job processes
+        """
+        self.store = store
+        self.max_workers = max_workers
+        self._context = multiprocessing.get_context(start_method)
+        self._queue: Deque[Tuple[str, str, Dict[str, Any]]] = deque()
+        self._running: Dict[str, multiprocessing.Process] = {}
+        self._lock = Lock()
+
+    def submit(self, operation: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Queue a job.
+
+        Raises:
+            ValueError: If the operation or its parameters are invalid
+        """
+        validate_job(operation, parameters)
+        self.store.purge_expired()
+
+        job = new_job(operation, parameters)
+        self.store.create(job)
+        with self._lock:
+            self._queue.append((job["task_id"], operation, parameters))
+        self._dispatch()
+        return self.store.get(job["task_id"]) or job
+
+    def get(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """Current job record, or None if unknown or expired."""
+        return self.store.get(task_id)
+
+    def cancel(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Cancel a pending or running job.
+
+        Returns:
+            The job record (unchanged if it had already finished), or None
+            if the job is unknown
+        """
+        job = self.store.update_if(task_id, ACTIVE_STATES, **finish_fields(CANCELLED))
+        if job is None:
+            return self.store.get(task_id)
+
+        with self._lock:
+            self._queue = deque(entry for entry in self._queue if entry[0] != task_id)
+            process = self._running.get(task_id)
+
+        if process is not None:
+            process.terminate()
+        return job
+
+    def _dispatch(self) -> None:
+        """Start queued jobs while there are free worker slots."""
+        while True:
+            with self._lock:
+                if not self._queue or len(self._running) >= self.max_workers:
+                    return
+                task_id, operation, parameters = self._queue.popleft()
+                if self.store.update_if(task_id, (PENDING,), status=RUNNING) is None:
+                    continue  # cancelled while queued
+                parent_conn, child_conn = self._context.Pipe(duplex=False)
+                process = self._context.Process(
+                    target=_worker_main, args=(operation, parameters, child_conn),
+                    name=f"job-{task_id}", daemon=True,
+                )
+                process.start()
+                child_conn.close()
+                self._running[task_id] = process
+
+            Thread(target=self._monitor, args=(task_id, process, parent_conn),
+                   name=f"job-monitor-{task_id}", daemon=True).start()
+
+    def _monitor(self, task_id: str, process: multiprocessing.Process, conn) -> None:
+        """Copy progress and the outcome of one job process into the store."""
+        outcome = None
+        try:
+            while outcome is None:
+                kind, payload = conn.recv()
+                if kind == "progress":
+                    self.store.update_if(task_id, (RUNNING,), progress=payload)
+                else:
+                    outcome = (kind, payload)
+        except (EOFError, OSError):
+            pass
+        finally:
+            conn.close()
+        process.join()
+
+        with self._lock:
+            self._running.pop(task_id, None)
+
+        # No-ops if the job was cancelled or the server shut down meanwhile
+        if outcome is not None and outcome[0] == "result":
+            self.store.update_if(task_id, (RUNNING,), **finish_fields(COMPLETED, result=outcome[1]))
+        elif outcome is not None:
+            self.store.update_if(task_id, (RUNNING,), **finish_fields(FAILED, error=outcome[1]))
+        else:
+            self.store.update_if(task_id, (RUNNING,), **finish_fields(
+                FAILED, error=f"Worker exited with code {process.exitcode}"))
+
+        self._dispatch()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"running": len(self._running), "queued": len(self._queue)}
+
+    def shutdown(self) -> None:
+        """Terminate running jobs and drop queued ones."""
+        with self._lock:
+            queued = [entry[0] for entry in self._queue]
+            self._queue.clear()
+            running = list(self._running.items())
+
+        # Record the outcome first, so the monitors' exit reports are no-ops
+        for task_id in queued + [task_id for task_id, _ in running]:
+            self.store.update_if(task_id, ACTIVE_STATES, **finish_fields(FAILED, error="Server shut down"))
+        for task_id, process in running:
+            process.terminate()
+
+
+class CeleryJobManager(JobManager):
+    """Dispatches jobs to Celery workers; the store must be shared (Redis)."""
+
+    def __init__(self, store: JobStore):
+        super().__init__(store, max_workers=0)
+
+    def submit(self, operation: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        from .celery_app import run_calculation
+
+        validate_job(operation, parameters)
+        job = new_job(operation, parameters)
+        self.store.create(job)
+        run_calculation.apply_async(args=(job["task_id"], operation, parameters), task_id=job["task_id"])
+        return job
+
+    def cancel(self, task_id: str) -> Optional[Dict[str, Any]]:
+        from .celery_app import celery_app
+
+        job = self.store.update_if(task_id, ACTIVE_STATES, **finish_fields(CANCELLED))
+        if job is None:
+            return self.store.get(task_id)
+        celery_app.control.revoke(task_id, terminate=True)
+        return job
+
+    def shutdown(self) -> None:
+        pass
+
+
+def create_job_store_from_settings(backend: Optional[str] = None) -> JobStore:
+    """
+    Build the job store of a job backend.
+
+    Args:
+        backend: 'local' or 'celery' (default: ``JOB_BACKEND``)
+
+    Raises:
+        ValueError: If the Celery backend would get a store its workers
+            cannot see (anything but Redis, including the 'auto' fallbacks)
+    """
+    store = create_job_store(
+        settings.JOB_STORE,
+        ttl=settings.JOB_RESULT_TTL,
+        sqlite_path=settings.JOB_DB_PATH,
+        redis_url=settings.REDIS_URL,
+    )
+    if (backend or settings.JOB_BACKEND) == "celery" and not isinstance(store, RedisJobStore):
+        raise ValueError(f"JOB_BACKEND=celery needs a Redis job store shared with the workers; "
+                         f"JOB_STORE={settings.JOB_STORE} gave {type(store).__name__} "
+                         f"(check REDIS_URL and that Redis is reachable)")
+    return store
+
+
+_job_manager: Optional[JobManager] = None
+_job_manager_lock = Lock()
+
+
+def get_job_manager() -> JobManager:
+    """The process-wide job manager, created on first use."""
+    global _job_manager
+
+    with _job_manager_lock:
+        if _job_manager is None:
+            store = create_job_store_from_settings()
+            if settings.JOB_BACKEND == "celery":
+                _job_manager = CeleryJobManager(store)
+            else:
+                _job_manager = JobManager(store, settings.JOB_MAX_WORKERS, settings.COMPUTE_START_METHOD)
+        return _job_manager
+
+
+def shutdown_job_manager() -> None:
+    """Stop the job manager if it was started."""
+    global _job_manager
+
+    with _job_manager_lock:
+        manager, _job_manager = _job_manager, None
+    if manager is not None:
+        manager.shutdown()
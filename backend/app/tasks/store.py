@@ -0,0 +1,291 @@
+"""
+Job record stores.
+
+A job record is a plain JSON-compatible dict (see ``new_job``). Stores keep
+records until they expire: finished jobs are dropped ``ttl`` seconds after
+completion, pending and running jobs never expire.
+
+- MemoryJobStore: per-process dict, the default with no configuration
+- SQLiteJobStore: a local file, shared by every process on the host
+- RedisJobStore: shared with Celery workers when Redis is available
+"""
+
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from pathlib import Path
+from threading import Lock
+from typing import Any, Collection, Dict, Optional
+import json
+import logging
+import sqlite3
+import time
+import uuid
+
+
+logger = logging.getLogger(__name__)
+
+PENDING = "pending"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+ACTIVE_STATES = (PENDING, RUNNING)
+FINISHED_STATES = (COMPLETED, FAILED, CANCELLED)
+
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def new_job(operation: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
+    """A fresh pending job record."""
+    return {
+        "task_id": uuid.uuid4().hex,
+        "operation": operation,
+        "parameters": parameters,
+        "status": PENDING,
+        "progress": 0,
+        "result": None,
+        "error": None,
+        "created_at": _now_iso(),
+        "completed_at": None,
+    }
+
+
+def finish_fields(status: str, **fields) -> Dict[str, Any]:
+    """Fields to update when a job reaches a final state."""
+    fields.update(status=status, completed_at=_now_iso())
+    if status == COMPLETED:
+        fields["progress"] = 100
+    return fields
+
+
+class JobStore(ABC):
+    """Interface shared by all job stores."""
+
+    def __init__(self, ttl: float):
+        """
+        Args:
+            ttl: Seconds to keep finished jobs
+        """
+        self.ttl = ttl
+
+    @abstractmethod
+    def create(self, job: Dict[str, Any]) -> None:
+        """Store a new job record."""
+
+    @abstractmethod
+    def get(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """The job record, or None if unknown or expired."""
+
+    @abstractmethod
+    def update_if(self, task_id: str, allowed_states: Optional[Collection[str]],
+                  **fields) -> Optional[Dict[str, Any]]:
+        """
+        Merge fields into a job if its status is one of ``allowed_states``.
+
+        The status check and the write are one atomic step, so concurrent
+        transitions (cancel vs. completion) cannot overwrite each other.
+
+        Args:
+            task_id: Job to update
+            allowed_states: Statuses the job may be in (None: any)
+
+        Returns:
+            The updated record, or None if the job is unknown or in another state
+        """
+
+    def update(self, task_id: str, **fields) -> Optional[Dict[str, Any]]:
+        """Merge fields into a job; returns the updated record or None if unknown."""
+        return self.update_if(task_id, None, **fields)
+
+    def purge_expired(self) -> int:
+        """Drop expired jobs; returns how many were removed."""
+        return 0
+
+    def _expires_at(self, job: Dict[str, Any]) -> Optional[float]:
+        return time.time() + self.ttl if job["status"] in FINISHED_STATES else None
+
+
+class MemoryJobStore(JobStore):
+    """Jobs in a dict; only visible to the current process."""
+
+    def __init__(self, ttl: float):
+        super().__init__(ttl)
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._expiry: Dict[str, float] = {}
+        self._lock = Lock()
+
+    def create(self, job: Dict[str, Any]) -> None:
+        with self._lock:
+            self._jobs[job["task_id"]] = dict(job)
+
+    def get(self, task_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            expires_at = self._expiry.get(task_id)
+            if expires_at is not None and expires_at <= time.time():
+                self._jobs.pop(task_id, None)
+                self._expiry.pop(task_id, None)
+            job = self._jobs.get(task_id)
+            return dict(job) if job is not None else None
+
+    def update_if(self, task_id: str, allowed_states: Optional[Collection[str]],
+                  **fields) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            job = self._jobs.get(task_id)
+            if job is None or (allowed_states is not None and job["status"] not in allowed_states):
+                return None
+            job.update(fields)
+            expires_at = self._expires_at(job)
+            if expires_at is not None:
+                self._expiry[task_id] = expires_at
+            return dict(job)
+
+    def purge_expired(self) -> int:
+        now = time.time()
+        with self._lock:
+            expired = [task_id for task_id, at in self._expiry.items() if at <= now]
+            for task_id in expired:
+                self._jobs.pop(task_id, None)
+                del self._expiry[task_id]
+        return len(expired)
+
+
+class SQLiteJobStore(JobStore):
+    """Jobs in a SQLite file (WAL mode), shared across local processes."""
+
+    def __init__(self, path: str, ttl: float):
+        super().__init__(ttl)
+        self.path = str(path)
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._lock = Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                " task_id TEXT PRIMARY KEY, data TEXT NOT NULL, expires_at REAL)"
+            )
+
+    def create(self, job: Dict[str, Any]) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO jobs (task_id, data, expires_at) VALUES (?, ?, ?)",
+                (job["task_id"], json.dumps(job), self._expires_at(job)),
+            )
+
+    def get(self, task_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM jobs WHERE task_id = ? AND (expires_at IS NULL OR expires_at > ?)",
+                (task_id, time.time()),
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def update_if(self, task_id: str, allowed_states: Optional[Collection[str]],
+                  **fields) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute("SELECT data FROM jobs WHERE task_id = ?", (task_id,)).fetchone()
+                job = json.loads(row[0]) if row is not None else None
+                if job is None or (allowed_states is not None and job["status"] not in allowed_states):
+                    self._conn.execute("COMMIT")
+                    return None
+                job.update(fields)
+                self._conn.execute(
+                    "UPDATE jobs SET data = ?, expires_at = ? WHERE task_id = ?",
+                    (json.dumps(job), self._expires_at(job), task_id),
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return job
+
+    def purge_expired(self) -> int:
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM jobs WHERE expires_at <= ?", (time.time(),))
+        return cursor.rowcount
+
+
+class RedisJobStore(JobStore):
+    """Jobs as JSON strings in Redis; Redis expires finished jobs itself."""
+
+    KEY_PREFIX = "job:"
+
+    def __init__(self, url: str, ttl: float):
+        import redis
+
+        super().__init__(ttl)
+        self._redis = redis.Redis.from_url(url)
+        self._redis.ping()
+
+    def _key(self, task_id: str) -> str:
+        return f"{self.KEY_PREFIX}{task_id}"
+
+    def create(self, job: Dict[str, Any]) -> None:
+        self._redis.set(self._key(job["task_id"]), json.dumps(job))
+
+    def get(self, task_id: str) -> Optional[Dict[str, Any]]:
+        data = self._redis.get(self._key(task_id))
+        return json.loads(data) if data else None
+
+    def update_if(self, task_id: str, allowed_states: Optional[Collection[str]],
+                  **fields) -> Optional[Dict[str, Any]]:
+        import redis
+
+        key = self._key(task_id)
+        with self._redis.pipeline() as pipe:
+            while True:
+                try:
+                    pipe.watch(key)
+                    data = pipe.get(key)
+                    job = json.loads(data) if data is not None else None
+                    if job is None or (allowed_states is not None and job["status"] not in allowed_states):
+                        return None
+                    job.update(fields)
+                    pipe.multi()
+                    if job["status"] in FINISHED_STATES:
+                        pipe.set(key, json.dumps(job), ex=max(int(self.ttl), 1))
+                    else:
+                        pipe.set(key, json.dumps(job))
+                    pipe.execute()
+                    return job
+                except redis.WatchError:
+                    continue
+
+
+def create_job_store(kind: str, ttl: float, sqlite_path: Optional[str] = None,
+                     redis_url: Optional[str] = None) -> JobStore:
+    """
+    Build the configured job store.
+
+    Args:
+        kind: 'memory', 'sqlite', 'redis' or 'auto' (Redis if reachable,
+              else SQLite if a path is configured, else memory)
+        ttl: Seconds to keep finished jobs
+        sqlite_path: Database file for the SQLite store
+        redis_url: Redis URL for the Redis store
+    """
+    if kind == "memory":
+        return MemoryJobStore(ttl)
+    if kind == "sqlite":
+        return SQLiteJobStore(sqlite_path or ":memory:", ttl)
+    if kind == "redis":
+        if not redis_url:
+            raise ValueError("JOB_STORE=redis requires REDIS_URL")
+        return RedisJobStore(redis_url, ttl)
+    if kind != "auto":
+        raise ValueError(f"Unknown job store: {kind}")
+
+    if redis_url:
+        try:
+            return RedisJobStore(redis_url, ttl)
+        except Exception as e:
+            logger.info("Redis job store unavailable (%s); using a local store", e)
+    if sqlite_path:
+        return SQLiteJobStore(sqlite_path, ttl)
+    return MemoryJobStore(ttl)
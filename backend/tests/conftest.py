@@ -0,0 +1,46 @@
+"""
+Shared fixtures: keep every test run away from the on-disk caches and indexes in app/data.
+
+Heavy calls run in spawned worker processes, which read their settings from
+the environment, so the environment is set before the app is imported.
+Fixtures then reset the caches of this process before every test.
+"""
+
+import atexit
+import os
+import shutil
+import tempfile
+
+import pytest
+
+
+# Worker processes keep their own dimension indexes; give them a directory of this run
+_STATE_DIR = tempfile.mkdtemp(prefix="grouptheory-tests-")
+atexit.register(shutil.rmtree, _STATE_DIR, ignore_errors=True)
+
+os.environ["RESULT_CACHE_ENABLED"] = "false"
+os.environ["SHARED_CACHE"] = "none"
+os.environ["DIMENSION_INDEX_DIR"] = os.path.join(_STATE_DIR, "dimension_index")
+
+
+@pytest.fixture(autouse=True)
+def isolated_caches(monkeypatch):
+    """No persistent or shared result cache unless a test installs one"""
+    from app.config import settings
+    from app.services import result_cache, shared_cache
+
+    monkeypatch.setattr(settings, "RESULT_CACHE_ENABLED", False)
+    monkeypatch.setattr(result_cache, "_result_cache", None)
+    monkeypatch.setattr(result_cache, "_result_cache_loaded", False)
+    monkeypatch.setattr(shared_cache, "_shared_cache", None)
+    monkeypatch.setattr(shared_cache, "_shared_cache_loaded", True)
+
+
+@pytest.fixture(autouse=True)
+def isolated_dimension_indexes(tmp_path, monkeypatch):
+    """Dimension indexes built from scratch in a directory of the test"""
+    from app.config import settings
+    from app.core import dimension_search
+
+    monkeypatch.setattr(settings, "DIMENSION_INDEX_DIR", str(tmp_path / "dimension_index"))
+    monkeypatch.setattr(dimension_search, "_indexes", {})
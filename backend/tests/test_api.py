@@ -4,12 +4,30 @@ Integration tests for API endpoints
 These tests verify the complete request/response cycle.
 """
 
+import json
+import time
+
+import numpy as np
 import pytest
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
-# TODO: Import after implementing endpoints
-# from app.main import app
-# client = TestClient(app)
+from app.api import responses
+from app.api.responses import FastJSONResponse
+from app.api.columnar import COLUMNAR_MEDIA_TYPE, decode_columnar, encode_columnar, wants_columnar
+from app.api.http_cache import HTTPCacheMiddleware
+from app.api.v1.endpoints.irreps import IrrepResponse
+from app.api.v1.router import api_router
+from app.config import settings
+from app.core.lie_algebra import LieAlgebraCalculator
+from app.core.weyl import weyl_dimension
+from app.import_report import ImportTiming, loaded_forbidden, measure_imports, parse_importtime
+from app.main import app
+from app.services import operations
+from app.services.executor import ComputeTimeout, ExecutorSaturated, compute_executor
+from app.services.warmup import warmup_calls, warmup_state
+
+client = TestClient(app)
 
 
 @pytest.mark.integration
@@ -75,6 +93,24 @@ class TestIrrepEndpoints:
     def test_weight_system_size_limit(self):
         """Test that large weight systems are truncated"""
         pytest.skip("Endpoint not implemented yet")
+    
+    def test_aliases_share_warmed_result(self, monkeypatch):
+        """Test that every group alias looks up the irrep result the warm-up stores"""
+        (_, operation, args, kwargs), = warmup_calls([], [("SU3", [1, 0])], [],
+                                                     max_weights=settings.MAX_WEIGHT_SYSTEM_SIZE)
+        keys = []
+        run_heavy = compute_executor.run_heavy
+        
+        async def record(fn, *args, **kwargs):
+            keys.append(fn.coalesce_key(*args, **kwargs))
+            return await run_heavy(fn, *args, **kwargs)
+        
+        monkeypatch.setattr(compute_executor, "run_heavy", record)
+        for irrep_id in ("su3-1_0", "SU3-1_0", "A2-1_0", "SU(3)-1_0"):
+            assert client.get(f"/api/v1/irreps/{irrep_id}").status_code == 200
+        assert client.post("/api/v1/irreps/", json={"group_id": "su3", "highest_weight": [1, 0]}).status_code == 201
+        
+        assert set(keys) == {operation.coalesce_key(*args, **kwargs)}
 
 
 @pytest.mark.integration
@@ -82,22 +118,33 @@ class TestTensorProductEndpoints:
     """Test tensor product endpoints"""
     
     def test_tensor_product_su5(self):
-        """Test POST /api/v1/tensor-product"""
-        pytest.skip("Endpoint not implemented yet")
-        # response = client.post("/api/v1/tensor-product", json={
-        #     "group": "SU(5)",
-        #     "irrep1": [1, 0, 0, 0],
-        #     "irrep2": [0, 0, 0, 1]
-        # })
-        # assert response.status_code == 200
-        # data = response.json()
-        # assert data["total_dimension"] == 25
-        # decomposition = data["decomposition"]
-        # assert len(decomposition) == 2
+        """Test POST /api/v1/irreps/tensor-product"""
+        response = client.post("/api/v1/irreps/tensor-product", json={
+            "group": "SU(5)",
+            "irrep1": [1, 0, 0, 0],
+            "irrep2": [0, 0, 0, 1]
+        })
+        assert response.status_code == 200
+        decomposition = response.json()["decomposition"]
+        assert [item["dimension"] for item in decomposition] == [24, 1]
     
     def test_tensor_product_dimension_conservation(self):
         """Test that dimensions are conserved in tensor products"""
-        pytest.skip("Endpoint not implemented yet")
+        response = client.post("/api/v1/irreps/tensor-product", json={
+            "group": "SO(10)",
+            "irrep1": [0, 0, 0, 0, 1],
+            "irrep2": [0, 0, 0, 1, 0]
+        })
+        assert response.status_code == 200
+        decomposition = response.json()["decomposition"]
+        assert sum(item["multiplicity"] * item["dimension"] for item in decomposition) == 16 * 16
+    
+    def test_tensor_product_wrong_rank(self):
+        """Test that mismatched labels are rejected"""
+        response = client.post("/api/v1/irreps/tensor-product", json={
+            "group": "SU3", "irrep1": [1, 0, 0], "irrep2": [1, 0]
+        })
+        assert response.status_code == 400
 
 
 @pytest.mark.integration
@@ -144,9 +191,458 @@ class TestErrorHandling:
         """Test handling of missing required fields"""
         pytest.skip("Endpoint not implemented yet")
     
-    def test_computation_timeout(self):
+    def test_computation_timeout(self, monkeypatch):
         """Test handling of computation timeouts"""
-        pytest.skip("Endpoint not implemented yet")
+        async def slow(*args, **kwargs):
+            raise ComputeTimeout("tensor_product exceeded 30s")
+        
+        monkeypatch.setattr(compute_executor, "run_heavy", slow)
+        response = client.post("/api/v1/irreps/tensor-product", json={
+            "group": "SU3", "irrep1": [1, 0], "irrep2": [1, 0]
+        })
+        assert response.status_code == 504
+    
+    def test_executor_saturated(self, monkeypatch):
+        """Test that a full worker pool returns 503"""
+        async def busy(*args, **kwargs):
+            raise ExecutorSaturated("process pool is busy")
+        
+        monkeypatch.setattr(compute_executor, "run_light", busy)
+        assert client.get("/api/v1/groups/SU3").status_code == 503
+
+
+@pytest.mark.integration
+class TestCalculationEndpoints:
+    """Test the asynchronous calculation jobs"""
+    
+    def test_submit_and_poll(self):
+        """Test POST /api/v1/calculations/submit and polling the status"""
+        response = client.post("/api/v1/calculations/submit", json={
+            "operation": "dimension",
+            "parameters": {"group": "E7", "highest_weight": [0, 0, 0, 0, 0, 0, 1]}
+        })
+        assert response.status_code == 202
+        task_id = response.json()["task_id"]
+        
+        for _ in range(600):
+            data = client.get(f"/api/v1/calculations/{task_id}/status").json()
+            if data["status"] not in ("pending", "running"):
+                break
+            time.sleep(0.05)
+        assert data["status"] == "completed"
+        assert data["result"] == {"dimension": 56}
+        
+        # Finished jobs can no longer be cancelled
+        assert client.delete(f"/api/v1/calculations/{task_id}").status_code == 409
+    
+    def test_invalid_operation(self):
+        """Test that unknown operations are rejected"""
+        response = client.post("/api/v1/calculations/submit", json={
+            "operation": "factorize", "parameters": {}
+        })
+        assert response.status_code == 400
+    
+    def test_unknown_task(self):
+        """Test status and cancel for unknown tasks"""
+        assert client.get("/api/v1/calculations/nope/status").status_code == 404
+        assert client.delete("/api/v1/calculations/nope").status_code == 404
+
+
+@pytest.mark.integration
+class TestFastJSON:
+    """Test the direct serialization of core results"""
+    
+    def test_irrep_response_from_arrays(self):
+        """Test that WeightSystem arrays serialize like the validated model"""
+        response = client.get("/api/v1/irreps/e6-1_0_0_0_0_0")
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data["weights"]) == len(data["multiplicities"]) == data["dimension"] == 27
+        assert all(isinstance(label, int) for label in data["weights"][0])
+        assert set(data) == set(IrrepResponse.model_fields)
+    
+    def test_status_codes_preserved(self):
+        """Test that create endpoints still answer 201"""
+        assert client.post("/api/v1/groups/create", json={"name": "E8"}).status_code == 201
+        response = client.post("/api/v1/irreps/", json={"group_id": "SU3", "highest_weight": [1, 1]})
+        assert response.status_code == 201
+        assert sorted(response.json()["multiplicities"]) == [1, 1, 1, 1, 1, 1, 2]
+    
+    def test_openapi_schema_unchanged(self):
+        """Test that response models still document the endpoints"""
+        paths = app.openapi()["paths"]
+        schema = paths["/api/v1/groups/{group_name}"]["get"]["responses"]["200"]["content"]["application/json"]
+        assert schema["schema"] == {"$ref": "#/components/schemas/GroupResponse"}
+        assert "201" in paths["/api/v1/irreps/"]["post"]["responses"]
+    
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_dumps(self, monkeypatch, use_orjson):
+        """Test NumPy encoding with and without orjson"""
+        if not use_orjson:
+            monkeypatch.setattr(responses, "orjson", None)
+        content = {"weights": np.array([[1, 0], [-1, 1]], dtype=np.int8)[:, :1],
+                   "dimension": np.int64(3), "ratio": 0.5, "labels": (1, 2)}
+        assert json.loads(responses.dumps(content)) == {
+            "weights": [[1], [-1]], "dimension": 3, "ratio": 0.5, "labels": [1, 2]
+        }
+    
+    def test_dumps_beyond_64_bits(self):
+        """Test that content orjson rejects is encoded by the standard library"""
+        dimension = 3 ** 60 * 2 ** 20
+        content = {"dimension": dimension, "multiplicities": np.array([1, 2], dtype=np.int64)}
+        assert json.loads(responses.dumps(content)) == {"dimension": dimension, "multiplicities": [1, 2]}
+        assert json.loads(FastJSONResponse([dimension]).body) == [dimension]
+
+
+COLUMNAR = {"Accept": COLUMNAR_MEDIA_TYPE}
+
+
+@pytest.mark.integration
+class TestColumnarFormat:
+    """Test the binary columnar response format"""
+    
+    def test_irrep_columns(self):
+        """Test that an irrep decodes to the same data as its JSON, in fewer bytes"""
+        url = "/api/v1/irreps/e7-0_0_0_0_0_1_0"
+        as_json = client.get(url)
+        response = client.get(url, headers=COLUMNAR)
+        assert response.headers["content-type"] == COLUMNAR_MEDIA_TYPE
+        assert response.headers["etag"] != as_json.headers["etag"]
+        
+        body = decode_columnar(response.content)
+        data = as_json.json()
+        assert body["meta"]["dimension"] == data["dimension"] == 1539
+        assert body["columns"]["weights"].dtype == np.int8
+        assert body["columns"]["weights"].tolist() == data["weights"]
+        assert body["columns"]["multiplicities"].tolist() == data["multiplicities"]
+        assert len(response.content) * 2 < len(as_json.content)
+    
+    def test_created_irrep_columns(self):
+        """Test POST /api/v1/irreps/ in the columnar format"""
+        response = client.post("/api/v1/irreps/", headers=COLUMNAR,
+                               json={"group_id": "SU3", "highest_weight": [1, 1]})
+        assert response.status_code == 201
+        columns = decode_columnar(response.content)["columns"]
+        assert columns["weights"].shape == (7, 2)
+        assert columns["multiplicities"].sum() == 8
+    
+    def test_root_system_columns(self):
+        """Test that roots are float32 columns"""
+        data = client.get("/api/v1/groups/E8/root-system").json()
+        columns = decode_columnar(client.get("/api/v1/groups/E8/root-system", headers=COLUMNAR).content)["columns"]
+        assert columns["positive_roots"].dtype == np.float32
+        assert columns["positive_roots"].shape == (120, 8)
+        np.testing.assert_allclose(columns["positive_roots"], data["positive_roots"], atol=1e-6)
+        assert columns["cartan_matrix"].tolist() == data["cartan_matrix"]
+    
+    def test_weight_diagram_columns(self):
+        """Test that weight records become one column per key"""
+        response = client.post("/api/v1/irreps/weight-system", headers=COLUMNAR,
+                               json={"group": "SU3", "irrep": [1, 1]})
+        body = decode_columnar(response.content)
+        assert body["meta"]["num_weights"] == 7
+        assert body["columns"]["multiplicity"].tolist().count(2) == 1
+        assert body["columns"]["i3"].dtype == np.float32
+    
+    @pytest.mark.parametrize("accept,expected", [
+        (None, False),
+        ("application/json", False),
+        ("*/*", False),
+        (COLUMNAR_MEDIA_TYPE, True),
+        (f"{COLUMNAR_MEDIA_TYPE}, application/json;q=0.5", True),
+        (f"application/json, {COLUMNAR_MEDIA_TYPE};q=0.5", False),
+        (f"{COLUMNAR_MEDIA_TYPE};q=0", False),
+    ])
+    def test_negotiation(self, accept, expected):
+        """Test Accept header negotiation"""
+        assert wants_columnar(accept) is expected
+    
+    @pytest.mark.parametrize("with_http_cache", [True, False])
+    def test_vary_accept_once(self, with_http_cache):
+        """Test that negotiated endpoints send Vary: Accept once, in either format, with or without ETags"""
+        negotiated = FastAPI()
+        negotiated.include_router(api_router, prefix="/api/v1")
+        if with_http_cache:
+            negotiated.add_middleware(HTTPCacheMiddleware)
+        negotiated_client = TestClient(negotiated)
+        
+        for headers in ({}, COLUMNAR):
+            for response in (negotiated_client.get("/api/v1/irreps/su3-1_0", headers=headers),
+                             negotiated_client.get("/api/v1/groups/G2/root-system", headers=headers),
+                             negotiated_client.post("/api/v1/irreps/weight-system", headers=headers,
+                                                    json={"group": "SU3", "irrep": [1, 0]})):
+                assert response.status_code == 200
+                assert response.headers.get_list("vary") == ["Accept"]
+        
+        if with_http_cache:
+            etag = negotiated_client.get("/api/v1/irreps/su3-1_0").headers["etag"]
+            revalidated = negotiated_client.get("/api/v1/irreps/su3-1_0", headers={"If-None-Match": etag})
+            assert revalidated.status_code == 304
+            assert revalidated.headers.get_list("vary") == ["Accept"]
+    
+    def test_alignment(self):
+        """Test that every column starts at an 8-byte aligned offset"""
+        body = encode_columnar({"name": "x"}, {"a": [1, 2, 3], "b": [[0.5, 1.5]], "c": [70000], "d": [300]})
+        header = json.loads(body[8:8 + int.from_bytes(body[4:8], "little")])
+        assert all(column["offset"] % 8 == 0 for column in header["columns"])
+        assert [column["dtype"] for column in header["columns"]] == ["int8", "float32", "int32", "int16"]
+
+
+@pytest.mark.integration
+class TestProjection:
+    """Test fields= projection and offset/limit paging"""
+    
+    def test_group_fields(self):
+        """Test that only the requested group fields are returned"""
+        response = client.get("/api/v1/groups/E8?fields=dimension,rank")
+        assert response.status_code == 200
+        assert response.json() == {"rank": 8, "dimension": 248}
+        assert "x-total-count" not in response.headers
+    
+    def test_group_fields_skip_roots(self, monkeypatch):
+        """Test that unrequested root fields are never computed"""
+        def fail(self):
+            raise AssertionError("positive roots computed")
+        
+        monkeypatch.setattr(LieAlgebraCalculator, "get_positive_roots", fail)
+        assert operations.group_data("SO(10)", fields=("rank", "dimension")) == {"rank": 5, "dimension": 45}
+        with pytest.raises(AssertionError):
+            operations.group_data("SO(10)")
+    
+    def test_positive_roots_paging(self):
+        """Test offset/limit on the positive roots"""
+        full = client.get("/api/v1/groups/E7").json()["positive_roots"]
+        response = client.get("/api/v1/groups/E7?fields=positive_roots&offset=10&limit=5")
+        assert response.headers["x-total-count"] == "63"
+        assert response.json() == {"positive_roots": full[10:15]}
+        assert client.get("/api/v1/groups/E7?offset=60").json()["positive_roots"] == full[60:]
+    
+    def test_irrep_fields_without_weight_system(self, monkeypatch):
+        """Test that an irrep beyond the weight limit answers a dimension-only request"""
+        monkeypatch.setattr(settings, "MAX_WEIGHT_SYSTEM_SIZE", 10)
+        url = "/api/v1/irreps/e8-0_0_0_0_0_0_1_1"
+        assert client.get(url).status_code == 413
+        response = client.get(f"{url}?fields=dimension,id")
+        assert response.status_code == 200
+        assert response.json() == {"id": "e8-0_0_0_0_0_0_1_1", "dimension": 4096000}
+    
+    def test_irrep_paging(self):
+        """Test that weights and multiplicities are paged together"""
+        full = client.get("/api/v1/irreps/su3-2_2").json()
+        response = client.get("/api/v1/irreps/su3-2_2?fields=weights,multiplicities&offset=3&limit=4")
+        assert response.headers["x-total-count"] == str(len(full["weights"]))
+        assert response.json() == {"weights": full["weights"][3:7],
+                                   "multiplicities": full["multiplicities"][3:7]}
+    
+    def test_irrep_paging_columnar(self):
+        """Test paging in the columnar format"""
+        response = client.post("/api/v1/irreps/?fields=multiplicities&limit=2", headers=COLUMNAR,
+                               json={"group_id": "SU3", "highest_weight": [1, 1]})
+        assert response.status_code == 201
+        body = decode_columnar(response.content)
+        assert body["meta"] == {}
+        assert body["columns"]["multiplicities"].shape == (2,)
+    
+    @pytest.mark.parametrize("url", [
+        "/api/v1/groups/SU3?fields=rank,roots",
+        "/api/v1/groups/SU3?fields=,",
+        "/api/v1/irreps/su3-1_0?fields=weight",
+    ])
+    def test_unknown_fields_rejected(self, url):
+        """Test that unknown field names are a client error"""
+        response = client.get(url)
+        assert response.status_code == 400
+    
+    def test_negative_offset_rejected(self):
+        """Test paging parameter validation"""
+        assert client.get("/api/v1/groups/SU3?offset=-1").status_code == 422
+
+
+@pytest.mark.integration
+class TestDimensionsEndpoint:
+    """Test POST /api/v1/irreps/dimensions"""
+    
+    def test_dimensions_in_order(self):
+        """Test a label scan against single-irrep dimensions"""
+        labels = [[a, b] for a in range(6) for b in range(6)]
+        response = client.post("/api/v1/irreps/dimensions", json={"group": "SU(3)", "dynkin_labels": labels})
+        assert response.status_code == 200
+        dimensions = response.json()["dimensions"]
+        assert dimensions == [(a + 1) * (b + 1) * (a + b + 2) // 2 for a, b in labels]
+    
+    def test_exact_beyond_64_bits(self):
+        """Test that huge dimensions are returned as exact integers"""
+        response = client.post("/api/v1/irreps/dimensions",
+                               json={"group": "E8", "dynkin_labels": [[10] * 8, [0] * 8]})
+        assert response.status_code == 200
+        assert response.json()["dimensions"] == [weyl_dimension("E8", [10] * 8), 1]
+    
+    @pytest.mark.parametrize("labels", [[[1, 0], [1, 0, 0]], [[1, -1]]])
+    def test_invalid_labels(self, labels):
+        """Test that malformed label vectors are a client error"""
+        response = client.post("/api/v1/irreps/dimensions", json={"group": "SU3", "dynkin_labels": labels})
+        assert response.status_code == 400
+    
+    def test_limit(self, monkeypatch):
+        """Test that oversized requests are rejected"""
+        monkeypatch.setattr(settings, "MAX_DIMENSION_BATCH_SIZE", 2)
+        response = client.post("/api/v1/irreps/dimensions", json={"group": "SU2", "dynkin_labels": [[1]] * 3})
+        assert response.status_code == 413
+
+
+@pytest.mark.integration
+class TestIrrepSearch:
+    """Test GET /api/v1/irreps/search"""
+    
+    def test_exact_dimension(self):
+        """Test the SU(4) irreps of dimension 20"""
+        response = client.get("/api/v1/irreps/search?group=SU4&dimension=20")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["cartan_type"] == "A3"
+        assert data["total"] == 5
+        assert [irrep["dynkin_labels"] for irrep in data["irreps"]] == [
+            [0, 0, 3], [0, 1, 1], [0, 2, 0], [1, 1, 0], [3, 0, 0]]
+    
+    def test_range_and_paging(self):
+        """Test a dimension range, sorted and paged"""
+        full = client.get("/api/v1/irreps/search?group=E6&dimension_min=27&dimension_max=1000").json()
+        dimensions = [irrep["dimension"] for irrep in full["irreps"]]
+        assert dimensions == sorted(dimensions)
+        assert dimensions[:3] == [27, 27, 78]
+        assert all(27 <= dimension <= 1000 for dimension in dimensions)
+        
+        response = client.get("/api/v1/irreps/search?group=E6&dimension_min=27&dimension_max=1000&offset=2&limit=2")
+        assert response.headers["x-total-count"] == str(full["total"])
+        assert response.json()["irreps"] == full["irreps"][2:4]
+    
+    @pytest.mark.parametrize("query", [
+        "group=SU4",
+        "group=SU4&dimension=20&dimension_max=30",
+        "group=NotAGroup&dimension=20",
+        "group=SU3xSU2&dimension=6",
+        "group=SU4&dimension_max=1000000000",
+    ])
+    def test_invalid_searches(self, query):
+        """Test that malformed searches are client errors"""
+        assert client.get(f"/api/v1/irreps/search?{query}").status_code == 400
+    
+    def test_route_precedes_irrep_ids(self):
+        """Test that /irreps/search is not parsed as an irrep ID"""
+        assert client.get("/api/v1/irreps/search?group=SU2&dimension=2").json()["irreps"] == [
+            {"dynkin_labels": [1], "dimension": 2}]
+
+
+@pytest.mark.integration
+class TestBatchEndpoint:
+    """Test POST /api/v1/batch"""
+    
+    def test_mixed_batch(self):
+        """Test that results come back in order, with per-operation errors"""
+        response = client.post("/api/v1/batch", json={"group": "SU3", "operations": [
+            {"op": "dimension", "params": {"highest_weight": [2, 1]}},
+            {"op": "irrep", "params": {"highest_weight": [1, 1]}},
+            {"op": "tensor_product", "params": {"irrep1": [1, 0], "irrep2": [1, 0]}},
+            {"op": "group", "group": "E8", "params": {"fields": ["rank", "dimension"]}},
+            {"op": "dimension", "params": {"highest_weight": [2, 1]}},
+            {"op": "irrep", "params": {"highest_weight": [1]}},
+        ]})
+        assert response.status_code == 200
+        data = response.json()
+        results = data["results"]
+        assert results[0] == results[4] == {"status": 200, "result": {"dimension": 15}}
+        assert sum(results[1]["result"]["multiplicities"]) == 8
+        assert sorted(irrep["dimension"] for irrep in results[2]["result"]["decomposition"]) == [3, 6]
+        assert results[3]["result"] == {"rank": 8, "dimension": 248}
+        assert results[5]["status"] == 400
+        assert data["unique_operations"] == 5
+    
+    def test_batch_limit(self, monkeypatch):
+        """Test that oversized batches are rejected"""
+        monkeypatch.setattr(settings, "BATCH_MAX_OPERATIONS", 2)
+        operation = {"op": "dimension", "group": "SU2", "params": {"highest_weight": [1]}}
+        response = client.post("/api/v1/batch", json={"operations": [operation] * 3})
+        assert response.status_code == 413
+
+
+@pytest.mark.integration
+class TestHTTPCaching:
+    """Test ETags, Cache-Control and conditional GETs"""
+    
+    def test_etag_and_not_modified(self, monkeypatch):
+        """Test that a matching If-None-Match is answered without computing"""
+        response = client.get("/api/v1/groups/SU3")
+        etag = response.headers["etag"]
+        assert response.status_code == 200
+        assert response.headers["cache-control"].startswith("public, max-age=")
+        
+        async def fail(*args, **kwargs):
+            raise AssertionError("core called for a cached response")
+        
+        monkeypatch.setattr(compute_executor, "run_light", fail)
+        cached = client.get("/api/v1/groups/SU3", headers={"If-None-Match": f'"other", W/{etag}'})
+        assert cached.status_code == 304
+        assert cached.content == b""
+        assert cached.headers["etag"] == etag
+    
+    def test_etag_is_canonical(self):
+        """Test that the ETag depends on the representation, not on parameter order or aliases"""
+        first = client.get("/api/v1/groups/?skip=0&limit=5").headers["etag"]
+        assert client.get("/api/v1/groups/?limit=5&skip=0").headers["etag"] == first
+        assert client.get("/api/v1/groups/?limit=6&skip=0").headers["etag"] != first
+        etags = {client.get(f"/api/v1/groups/{name}").headers["etag"] for name in ("SU3", "su3", "A2")}
+        assert len(etags) == 1
+        assert client.get("/api/v1/groups/SU4").headers["etag"] not in etags
+    
+    def test_alias_revalidates(self):
+        """Test that a tag issued for one alias revalidates another"""
+        etag = client.get("/api/v1/groups/SU3").headers["etag"]
+        response = client.get("/api/v1/groups/A2", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+    
+    def test_wildcard_does_not_hide_errors(self):
+        """Test that If-None-Match: * neither answers unknown groups nor skips the endpoint"""
+        response = client.get("/api/v1/groups/NOPE", headers={"If-None-Match": "*"})
+        assert response.status_code == 404
+        assert "etag" not in response.headers
+        assert client.get("/api/v1/groups/SU3", headers={"If-None-Match": "*"}).status_code == 200
+    
+    def test_only_successful_gets_are_cached(self):
+        """Test that errors and POSTs carry no caching headers"""
+        invalid = client.get("/api/v1/groups/NotAGroup")
+        assert invalid.status_code == 404
+        assert "etag" not in invalid.headers
+        
+        response = client.post("/api/v1/irreps/tensor-product", json={
+            "group": "SU3", "irrep1": [1, 0], "irrep2": [0, 1]
+        })
+        assert response.status_code == 200
+        assert "etag" not in response.headers
+        assert "etag" not in client.get("/health").headers
+    
+    def test_middleware_paths_and_revalidation(self):
+        """Test prefix boundaries, and 304s for tags the middleware has not issued itself"""
+        calls = []
+        
+        async def endpoint(scope, receive, send):
+            calls.append(scope["path"])
+            await send({"type": "http.response.start", "status": 200,
+                        "headers": [(b"content-type", b"application/json")]})
+            await send({"type": "http.response.body", "body": b'{"rank": 2}'})
+        
+        first = TestClient(HTTPCacheMiddleware(endpoint, prefixes=("/groups",)))
+        etag = first.get("/groups/A2").headers["etag"]
+        assert "etag" in first.get("/groups").headers
+        assert "etag" not in first.get("/groupsX/A2").headers
+        
+        # Another worker process: no remembered tag, so the endpoint runs and the body matches
+        second = TestClient(HTTPCacheMiddleware(endpoint, prefixes=("/groups",)))
+        calls.clear()
+        response = second.get("/groups/A2", headers={"If-None-Match": etag})
+        assert (response.status_code, response.content, calls) == (304, b"", ["/groups/A2"])
+        assert second.get("/groups/A2", headers={"If-None-Match": etag}).status_code == 304
+        assert calls == ["/groups/A2"]
 
 
 @pytest.mark.integration
@@ -176,6 +672,101 @@ class TestHealthEndpoints:
     
     def test_health_endpoint(self):
         """Test GET /health"""
-        pytest.skip("Endpoint not implemented yet")
-        # response = client.get("/health")
-        # assert response.status_code == 200
+        response = client.get("/health")
+        assert response.status_code == 200
+        assert response.json()["warmup"]["status"] in ("pending", "running", "complete")
+    
+    def test_readiness_follows_warmup(self, monkeypatch):
+        """Test that GET /ready returns 503 until the warm-up completes"""
+        monkeypatch.setattr(warmup_state, "status", "running")
+        monkeypatch.setattr(warmup_state, "total", 4)
+        monkeypatch.setattr(warmup_state, "done", 1)
+        response = client.get("/ready")
+        assert response.status_code == 503
+        assert response.json()["warmup"]["progress"] == 0.25
+        
+        monkeypatch.setattr(warmup_state, "status", "complete")
+        assert client.get("/ready").status_code == 200
+
+
+@pytest.mark.integration
+class TestColdStart:
+    """Test the import cost of the application"""
+    
+    def test_app_does_not_import_sympy(self):
+        """Test that starting the API never loads SymPy"""
+        timings = measure_imports("app.main")
+        assert any(timing.module == "app.main" for timing in timings)
+        assert loaded_forbidden(timings, ["sympy"]) == []
+    
+    def test_core_submodules_import_alone(self):
+        """Test that app.core loads its calculators only on demand"""
+        timings = measure_imports("app.core.algebra_bundle")
+        assert loaded_forbidden(timings, ["app.core.irreps", "app.core.tensor_products", "sympy"]) == []
+    
+    def test_parse_importtime(self):
+        """Test parsing of -X importtime output"""
+        output = (
+            "import time: self [us] | cumulative | imported package\n"
+            "import time:       120 |        120 |   zlib\n"
+            "import time:      3000 |       3120 | app.codec\n"
+        )
+        assert parse_importtime(output) == [
+            ImportTiming("zlib", 120, 120, 1), ImportTiming("app.codec", 3000, 3120, 0),
+        ]
+
+
+def _read_ndjson(response):
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+@pytest.mark.integration
+class TestWeightSystemStreaming:
+    """Test the streaming NDJSON weight-system endpoint"""
+    
+    def test_stream_whole_weight_system(self):
+        """Test streaming the 27 of E6 in one go"""
+        response = client.post("/api/v1/irreps/weight-system/stream", json={
+            "group": "E6",
+            "dynkin_labels": [1, 0, 0, 0, 0, 0],
+        })
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        
+        lines = _read_ndjson(response)
+        assert lines[0]["type"] == "header"
+        assert lines[0]["dimension"] == 27
+        assert lines[-1] == {"type": "end", "returned": 27, "next_cursor": None}
+        assert sum(line["multiplicity"] for line in lines[1:-1]) == 27
+    
+    def test_resume_with_cursor(self):
+        """Test that paging with cursors yields every weight exactly once"""
+        request = {"group": "SO(10)", "dynkin_labels": [0, 1, 0, 0, 0], "max_weights": 7}
+        weights = []
+        multiplicity_total = 0
+        
+        while True:
+            lines = _read_ndjson(client.post("/api/v1/irreps/weight-system/stream", json=request))
+            weights.extend(tuple(line["weight"]) for line in lines[1:-1])
+            multiplicity_total += sum(line["multiplicity"] for line in lines[1:-1])
+            if lines[-1]["next_cursor"] is None:
+                break
+            request["cursor"] = lines[-1]["next_cursor"]
+        
+        # 40 roots plus the zero weight (multiplicity 5) of the 45
+        assert len(weights) == len(set(weights)) == 41
+        assert multiplicity_total == 45
+    
+    def test_invalid_cursor(self):
+        """Test that malformed cursors are rejected"""
+        response = client.post("/api/v1/irreps/weight-system/stream", json={
+            "group": "A2", "dynkin_labels": [1, 1], "cursor": "not-a-cursor",
+        })
+        assert response.status_code == 400
+    
+    def test_non_streaming_limit_enforced(self):
+        """Test that MAX_WEIGHT_SYSTEM_SIZE is enforced on create_irrep"""
+        response = client.post("/api/v1/irreps/", json={
+            "group_id": "E8", "highest_weight": [1, 0, 0, 0, 0, 0, 0, 0],
+        })
+        assert response.status_code == 413
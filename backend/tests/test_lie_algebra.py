@@ -4,10 +4,16 @@ Unit tests for Lie algebra computations using SymPy
 Tests basic SymPy functionality and our wrapper functions.
 """
 
+import numpy as np
 import pytest
 from sympy.liealgebras.root_system import RootSystem
 from sympy.liealgebras.cartan_type import CartanType
 
+from app.core.algebra_bundle import AlgebraBundle, build_bundle
+from app.core.lie_algebra import LieAlgebraCalculator
+from app.core.registry import AlgebraRegistry
+from app.core.root_systems import IntegerRootSystem, count_positive_roots, parse_cartan_type
+
 
 class TestSymPyBasics:
     """Test basic SymPy Lie algebra functionality"""
@@ -189,3 +195,175 @@ class TestAlgebraSpecificProperties:
         # SO(10) algebra dimension = 5*(2*5-1) = 45
         # = rank + num_roots = 5 + 40
         assert ct.rank() + len(rs.all_roots()) == 45
+
+
+class TestIntegerRootSystem:
+    """Test the native integer root-system engine"""
+    
+    @pytest.mark.parametrize("cartan_type,expected_num_positive", [
+        ("A1", 1),
+        ("A2", 3),
+        ("A4", 10),
+        ("B3", 9),
+        ("C4", 16),
+        ("D5", 20),
+        ("E6", 36),
+        ("E7", 63),
+        ("E8", 120),
+        ("F4", 24),
+        ("G2", 6),
+        ("A30", 465),
+        ("D20", 380),
+    ])
+    def test_number_of_positive_roots(self, cartan_type, expected_num_positive):
+        """Test positive root counts for all Cartan series"""
+        rs = IntegerRootSystem(cartan_type)
+        assert rs.num_positive_roots == expected_num_positive
+        assert count_positive_roots(*parse_cartan_type(cartan_type)) == expected_num_positive
+    
+    @pytest.mark.parametrize("cartan_type", ["A4", "B3", "C3", "D5", "E6", "E7", "E8", "F4", "G2"])
+    def test_cartan_matrix_matches_sympy(self, cartan_type):
+        """Test that the Cartan matrix follows SymPy's conventions"""
+        rs = IntegerRootSystem(cartan_type)
+        assert rs.cartan_matrix.tolist() == CartanType(cartan_type).cartan_matrix().tolist()
+    
+    @pytest.mark.parametrize("cartan_type", ["A3", "B4", "C4", "D4", "E6", "E8", "F4", "G2"])
+    def test_roots_closed_under_reflections(self, cartan_type):
+        """Test that simple reflections permute the root system"""
+        rs = IntegerRootSystem(cartan_type)
+        positive = rs.positive_roots_orthogonal
+        roots = np.vstack([positive, -positive])
+        root_set = set(map(tuple, roots.tolist()))
+        assert len(root_set) == len(roots)
+        
+        for alpha in rs.simple_roots:
+            for beta in roots:
+                reflected = beta - (2 * (beta @ alpha) // (alpha @ alpha)) * alpha
+                assert tuple(reflected.tolist()) in root_set
+    
+    @pytest.mark.parametrize("cartan_type,expected", [
+        ("A2", [1, 1]),
+        ("G2", [3, 2]),
+        ("F4", [2, 3, 4, 2]),
+        ("E8", [2, 3, 4, 6, 5, 4, 3, 2]),
+    ])
+    def test_highest_root(self, cartan_type, expected):
+        """Test the highest root in the simple-root basis"""
+        assert IntegerRootSystem(cartan_type).highest_root.tolist() == expected
+    
+    @pytest.mark.parametrize("cartan_type", ["E9", "F3", "X3", "A0", "B1"])
+    def test_invalid_types_rejected(self, cartan_type):
+        """Test that unsupported Cartan types raise ValueError"""
+        with pytest.raises(ValueError):
+            IntegerRootSystem(cartan_type)
+    
+    def test_calculator_uses_engine(self):
+        """Test LieAlgebraCalculator output for SU(3)"""
+        calc = LieAlgebraCalculator("SU(3)")
+        assert calc.get_rank() == 2
+        assert calc.get_dimension() == 8
+        assert calc.get_simple_roots() == [[1.0, -1.0, 0.0], [0.0, 1.0, -1.0]]
+        assert len(calc.get_all_roots()) == 6
+        assert calc.get_algebra_info()["num_positive_roots"] == 3
+
+
+class TestAlgebraRegistry:
+    """Test the interned algebra registry"""
+    
+    def test_notations_share_one_algebra(self):
+        """Test that SU(5), SU5 and A4 resolve to the same object"""
+        registry = AlgebraRegistry(maxsize=4)
+        
+        algebra = registry.get("SU(5)")
+        assert registry.get("SU5") is algebra
+        assert registry.get("A4") is algebra
+        assert registry.stats()["misses"] == 1
+        assert registry.stats()["hits"] == 2
+    
+    def test_lru_eviction(self):
+        """Test that the least recently used algebra is evicted"""
+        registry = AlgebraRegistry(maxsize=2)
+        
+        registry.get("A2")
+        registry.get("D5")
+        registry.get("A2")      # A2 becomes most recent
+        registry.get("E6")      # evicts D5
+        
+        assert len(registry) == 2
+        assert "A2" in registry
+        assert "SO(10)" not in registry
+    
+    def test_disabled_registry(self):
+        """Test that a disabled registry builds fresh objects"""
+        registry = AlgebraRegistry(maxsize=4, enabled=False)
+        
+        assert registry.get("SU(3)") is not registry.get("SU(3)")
+        assert len(registry) == 0
+    
+    def test_invalid_group_not_interned(self):
+        """Test that unsupported groups raise and are not cached"""
+        registry = AlgebraRegistry(maxsize=4)
+        
+        with pytest.raises(ValueError):
+            registry.get("E9")
+        assert len(registry) == 0
+    
+    def test_root_system_is_lazy_and_read_only(self):
+        """Test lazy derived data and read-only arrays"""
+        registry = AlgebraRegistry(maxsize=4)
+        algebra = registry.get("E8")
+        
+        assert "root_system" not in algebra.__dict__
+        assert algebra.get_dimension() == 248
+        assert algebra.get_rank() == 8
+        assert "root_system" not in algebra.__dict__
+        assert len(algebra.get_positive_roots()) == 120
+        assert "root_system" in algebra.__dict__
+        with pytest.raises(ValueError):
+            algebra.root_system.positive_roots[0, 0] = 5
+
+
+class TestAlgebraBundle:
+    """Test the prebuilt memory-mapped algebra bundle"""
+    
+    @pytest.fixture
+    def bundle(self, tmp_path):
+        path = tmp_path / "algebras.bin"
+        build_bundle(path, ["A2", "B3", "E8", "G2"])
+        return AlgebraBundle(path)
+    
+    def test_bundle_contents(self, bundle):
+        """Test that only the requested algebras are bundled"""
+        assert bundle.cartan_types() == ["A2", "B3", "E8", "G2"]
+        assert "E8" in bundle
+        assert "E7" not in bundle
+        assert bundle.get_root_system("E7") is None
+    
+    @pytest.mark.parametrize("cartan_type", ["A2", "B3", "E8", "G2"])
+    def test_bundle_matches_computed(self, bundle, cartan_type):
+        """Test that mapped arrays equal freshly generated data"""
+        mapped = bundle.get_root_system(cartan_type)
+        computed = IntegerRootSystem(cartan_type)
+        
+        assert np.array_equal(mapped.cartan_matrix, computed.cartan_matrix)
+        assert np.array_equal(mapped.positive_roots, computed.positive_roots)
+        assert np.array_equal(mapped.positive_roots_orthogonal,
+                              computed.positive_roots_orthogonal)
+        assert np.array_equal(mapped.inverse_cartan.numerator,
+                              computed.inverse_cartan.numerator)
+        assert mapped.quadratic_form.denominator == computed.quadratic_form.denominator
+        assert np.array_equal(mapped.highest_root, computed.highest_root)
+    
+    def test_mapped_arrays_are_read_only(self, bundle):
+        """Test that mapped arrays cannot be modified"""
+        rs = bundle.get_root_system("E8")
+        assert not rs.positive_roots.flags.writeable
+        with pytest.raises(ValueError):
+            rs.cartan_matrix[0, 0] = 0
+    
+    def test_rejects_foreign_file(self, tmp_path):
+        """Test that non-bundle files are rejected"""
+        path = tmp_path / "garbage.bin"
+        path.write_bytes(b"not a bundle at all")
+        with pytest.raises(ValueError):
+            AlgebraBundle(path)
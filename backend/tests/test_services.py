@@ -0,0 +1,764 @@
+"""
+Unit tests for the services layer
+
+Tests the compute executor that sits between the endpoints and app.core,
+the local and shared result caches, the startup warm-up, and the
+calculation job subsystem.
+"""
+
+import asyncio
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import Future
+
+import numpy as np
+import pytest
+
+from app.config import settings
+from app.core.freudenthal import WeightLimitExceeded
+from app.core.registry import get_algebra
+from app.core.weight_systems import WeightSystem
+from app.services import codec, operations, result_cache as result_cache_module, shared_cache as shared_cache_module
+from app.services.batch import BATCH_OPERATIONS, BatchOperation, run_batch
+from app.services.executor import ComputeExecutor, ComputeTimeout, ExecutorSaturated
+from app.services.result_cache import MISSING, RESULT_CACHE_VERSION, ResultCache, result_key
+from app.services.shared_cache import (
+    MemorySharedCache, RedisSharedCache, SharedCache, create_shared_cache, spec_key,
+)
+from app.services.singleflight import SingleFlight
+from app.services.warmup import WarmupState, warm_up, warmup_calls
+from app.tasks.jobs import JobManager, create_job_store_from_settings, run_job, validate_job
+from app.tasks.store import (
+    FINISHED_STATES, JobStore, MemoryJobStore, SQLiteJobStore, create_job_store, finish_fields, new_job,
+)
+
+
+def _wait_for(event: threading.Event) -> str:
+    event.wait(5)
+    return "released"
+
+
+class TestComputeExecutor:
+    """Test dispatch, bounded queues and timeouts"""
+
+    @pytest.mark.slow
+    def test_process_pool_runs_operations(self):
+        """Test that heavy operations run in worker processes"""
+        executor = ComputeExecutor(mode="process", process_workers=1)
+        try:
+            result = asyncio.run(executor.run_heavy(operations.tensor_product, "SU3", [1, 0], [0, 1]))
+        finally:
+            executor.shutdown()
+
+        assert [item["dimension"] for item in result["decomposition"]] == [8, 1]
+
+    @pytest.mark.unit
+    def test_thread_pool_runs_operations(self):
+        """Test that light operations run on the thread pool"""
+        executor = ComputeExecutor(mode="thread")
+        try:
+            data = asyncio.run(executor.run_light(operations.group_data, "E6"))
+        finally:
+            executor.shutdown()
+
+        assert data["dimension"] == 78
+
+    @pytest.mark.unit
+    def test_bounded_queue(self):
+        """Test that calls beyond max_pending fail fast"""
+        executor = ComputeExecutor(mode="thread", thread_workers=1, max_pending=1)
+        release = threading.Event()
+
+        async def scenario():
+            first = asyncio.ensure_future(executor.run_light(_wait_for, release))
+            await asyncio.sleep(0.05)
+            with pytest.raises(ExecutorSaturated):
+                await executor.run_light(_wait_for, release)
+            release.set()
+            return await first
+
+        try:
+            assert asyncio.run(scenario()) == "released"
+            assert executor.stats()["light_pending"] == 0
+        finally:
+            executor.shutdown()
+
+    @pytest.mark.unit
+    def test_timeout(self):
+        """Test that slow calls raise ComputeTimeout"""
+        executor = ComputeExecutor(mode="thread", timeout=0.05)
+        try:
+            with pytest.raises(ComputeTimeout):
+                asyncio.run(executor.run_heavy(time.sleep, 0.5))
+        finally:
+            executor.shutdown()
+
+    @pytest.mark.unit
+    def test_errors_propagate(self):
+        """Test that core errors reach the caller unchanged"""
+        executor = ComputeExecutor(mode="inline")
+        with pytest.raises(ValueError):
+            asyncio.run(executor.run_heavy(operations.tensor_product, "SU3", [1, 0], [1, 0, 0]))
+
+    @pytest.mark.unit
+    def test_invalid_mode(self):
+        """Test that unknown modes are rejected"""
+        with pytest.raises(ValueError):
+            ComputeExecutor(mode="cluster")
+
+
+_slow_calls = []
+
+
+def _slow_square(x: int) -> int:
+    _slow_calls.append(x)
+    time.sleep(0.2)
+    return x * x
+
+
+_slow_square.coalesce_key = lambda x: ("square", x)
+
+
+class TestSingleFlight:
+    """Test coalescing of identical concurrent calls"""
+
+    @pytest.mark.unit
+    def test_identical_calls_share_one_computation(self):
+        """Test that concurrent identical calls run once"""
+        executor = ComputeExecutor(mode="thread")
+        _slow_calls.clear()
+
+        async def scenario():
+            return await asyncio.gather(*(executor.run_light(_slow_square, 7) for _ in range(5)),
+                                        executor.run_light(_slow_square, 8))
+
+        try:
+            assert asyncio.run(scenario()) == [49] * 5 + [64]
+        finally:
+            executor.shutdown()
+
+        assert sorted(_slow_calls) == [7, 8]
+        assert executor.stats()["coalesced"] == 4
+        assert executor.stats()["in_flight"] == 0
+
+    @pytest.mark.unit
+    def test_timed_out_waiter_does_not_cancel_others(self):
+        """Test that one waiter giving up leaves the shared call running"""
+        executor = ComputeExecutor(mode="thread", thread_workers=1)
+        _slow_calls.clear()
+
+        async def scenario():
+            impatient = executor.run_light(_slow_square, 3, timeout=0.01)
+            patient = executor.run_light(_slow_square, 3)
+            return await asyncio.gather(impatient, patient, return_exceptions=True)
+
+        try:
+            impatient, patient = asyncio.run(scenario())
+        finally:
+            executor.shutdown()
+
+        assert isinstance(impatient, ComputeTimeout)
+        assert patient == 9
+        assert _slow_calls == [3]
+
+    @pytest.mark.unit
+    def test_canonical_keys(self):
+        """Test that equivalent group names coalesce"""
+        key = operations.tensor_product.coalesce_key
+        assert key("SO(10)", [1, 0, 0, 0, 0], [0, 0, 0, 0, 1]) == key("D5", [1, 0, 0, 0, 0], (0, 0, 0, 0, 1))
+        assert key("SO(10)", [1, 0, 0, 0, 0], [0, 0, 0, 0, 1]) != key("SO(10)", [0, 0, 0, 0, 1], [1, 0, 0, 0, 0])
+        assert operations.root_system_data.coalesce_key("su(5)") == operations.root_system_data.coalesce_key("A4")
+
+    @pytest.mark.unit
+    def test_failures_are_shared_and_forgotten(self):
+        """Test that a failing call reaches every waiter and is not kept"""
+        flight = SingleFlight()
+        future = Future()
+        assert flight.join("k", lambda: future) is flight.join("k", lambda: Future())
+        future.set_exception(ValueError("bad labels"))
+
+        assert len(flight) == 0
+        assert flight.stats() == {"in_flight": 0, "started": 1, "coalesced": 1}
+
+
+_cached_calls = []
+
+
+@operations.coalesced
+def _counted_dimension(group_name: str, labels: list) -> int:
+    _cached_calls.append(group_name)
+    if min(labels) < 0:
+        raise ValueError("negative labels")
+    return get_algebra(group_name).get_dimension() + sum(labels)
+
+
+@pytest.fixture
+def result_cache(tmp_path, monkeypatch):
+    """A fresh result cache installed as the process-wide one"""
+    cache = ResultCache(str(tmp_path / "results.sqlite"), max_bytes=1024 * 1024)
+    monkeypatch.setattr(result_cache_module, "_result_cache", cache)
+    monkeypatch.setattr(result_cache_module, "_result_cache_loaded", True)
+    return cache
+
+
+class TestResultCache:
+    """Test the persistent result cache and its encoding"""
+
+    @pytest.mark.unit
+    def test_codec_round_trip(self):
+        """Test that nested results survive encoding"""
+        value = {
+            "name": "E6", "rank": 6, "huge": 3 ** 80, "ratio": 0.5, "flags": [True, False, None],
+            "character": (((1, 0), 1), ((0, 0), 2)), "matrix": np.arange(6, dtype=np.int16).reshape(2, 3),
+        }
+        decoded = codec.decode(codec.encode(value))
+
+        assert decoded.pop("matrix").tolist() == [[0, 1, 2], [3, 4, 5]]
+        value.pop("matrix")
+        assert decoded == value
+
+    @pytest.mark.unit
+    def test_codec_weight_system(self):
+        """Test that weight systems are stored compactly and decode intact"""
+        rs = get_algebra("E6").root_system
+        weights = WeightSystem.from_character(rs, operations.dominant_character("E6", (0, 0, 0, 0, 0, 1)))
+        blob = codec.encode({"weight_system": weights})
+        decoded = codec.decode(blob)["weight_system"]
+
+        assert len(blob) < weights.nbytes + 200
+        assert decoded.to_lists() == weights.to_lists()
+        assert decoded.orthogonal_denominator == weights.orthogonal_denominator
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("blob", [b"", b"\x09abc", b"\x01i\x00", b"\x02not zlib"])
+    def test_codec_rejects_corrupt_blobs(self, blob):
+        """Test that corrupt blobs raise ValueError"""
+        with pytest.raises(ValueError):
+            codec.decode(blob)
+
+    @pytest.mark.unit
+    def test_shared_between_connections(self, tmp_path):
+        """Test that a result stored by one process is visible to another"""
+        path = str(tmp_path / "shared.sqlite")
+        writer, reader = ResultCache(path), ResultCache(path)
+        key = result_key(operations.tensor_product.coalesce_key("SO(10)", [1, 0, 0, 0, 0], [1, 0, 0, 0, 0]))
+
+        assert reader.get(key) is MISSING
+        assert writer.put(key, "tensor_product", {"decomposition": [54, 45, 1]})
+        assert reader.get(key) == {"decomposition": [54, 45, 1]}
+        assert key == result_key(operations.tensor_product.coalesce_key("D5", (1, 0, 0, 0, 0), [1, 0, 0, 0, 0]))
+
+    @pytest.mark.unit
+    def test_size_based_eviction(self, tmp_path):
+        """Test that the least recently used entries are evicted first"""
+        cache = ResultCache(str(tmp_path / "small.sqlite"), max_bytes=3000)
+        for i in range(5):
+            cache.put(f"k{i}", "op", os.urandom(800))
+            time.sleep(0.01)
+
+        stats = cache.stats()
+        assert stats["bytes"] <= 3000
+        assert cache.get("k4") is not MISSING
+        assert cache.get("k0") is MISSING
+
+    @pytest.mark.unit
+    def test_executor_uses_cache(self, result_cache):
+        """Test that persistent operations compute once and failures are not stored"""
+        executor = ComputeExecutor(mode="thread")
+        _cached_calls.clear()
+        try:
+            first = asyncio.run(executor.run_light(_counted_dimension, "SU(3)", [1, 1]))
+            second = asyncio.run(executor.run_light(_counted_dimension, "A2", [1, 1]))
+            for _ in range(2):
+                with pytest.raises(ValueError):
+                    asyncio.run(executor.run_light(_counted_dimension, "A2", [-1, 0]))
+        finally:
+            executor.shutdown()
+
+        assert first == second == 10
+        assert _cached_calls == ["SU(3)", "A2", "A2"]
+        assert result_cache.stats()["entries"] == 1
+
+
+@pytest.fixture(params=["memory", "redis"])
+def shared_cache(request):
+    """Each shared cache backend, with keys isolated per test"""
+    prefix = f"test:{uuid.uuid4().hex}:"
+    if request.param == "memory":
+        yield MemorySharedCache(ttl=60, prefix=prefix)
+        return
+
+    pytest.importorskip("redis")
+    try:
+        cache = RedisSharedCache(os.environ.get("REDIS_URL", "redis://localhost:6379/15"), ttl=60, prefix=prefix)
+    except Exception as e:
+        pytest.skip(f"Redis unavailable: {e}")
+    yield cache
+    keys = cache._redis.keys(prefix + "*")
+    if keys:
+        cache._redis.delete(*keys)
+
+
+class TestSharedCache:
+    """Test the second-level cache backends and key scheme"""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("operation,args,kwargs,expected", [
+        (operations.irrep_data, ("SU3", [1, 0]), {}, "irrep:SU3:1,0"),
+        (operations.irrep_data, ("SU3", [1, 0]), {"max_weights": 1000}, "irrep:SU3:1,0:max_weights=1000"),
+        (operations.tensor_product, ("E6", [1, 0, 0, 0, 0, 0], [0, 0, 0, 0, 0, 1]), {},
+         "tensor:E6:1,0,0,0,0,0:0,0,0,0,0,1"),
+        (operations.group_data, ("SO(10)",), {}, "group:D5"),
+    ])
+    def test_key_scheme(self, operation, args, kwargs, expected):
+        """Test that keys follow the operation:group:params scheme"""
+        assert spec_key(operation.coalesce_key(*args, **kwargs)) == expected
+
+    @pytest.mark.unit
+    def test_batch_round_trip(self, shared_cache):
+        """Test that batches keep their order and report misses"""
+        stored = shared_cache.set_many({"irrep:SU3:1,0": {"dimension": 3}, "irrep:SU3:1,1": {"dimension": 8}})
+
+        assert stored == 2
+        assert shared_cache.get_many(["irrep:SU3:1,1", "irrep:SU3:2,0", "irrep:SU3:1,0"]) == \
+            [{"dimension": 8}, MISSING, {"dimension": 3}]
+        assert (shared_cache.hits, shared_cache.misses) == (2, 1)
+
+    @pytest.mark.unit
+    def test_large_values(self, shared_cache):
+        """Test that large weight systems round-trip compressed"""
+        rs = get_algebra("E7").root_system
+        weights = WeightSystem.from_character(rs, operations.dominant_character("E7", (0, 0, 0, 0, 0, 1, 0)))
+
+        assert shared_cache.set("irrep:E7:0,0,0,0,0,1,0", {"weight_system": weights})
+        assert shared_cache.get("irrep:E7:0,0,0,0,0,1,0")["weight_system"].to_lists() == weights.to_lists()
+
+    @pytest.mark.unit
+    def test_expiry_and_delete(self, shared_cache):
+        """Test that entries expire after the TTL and can be deleted"""
+        shared_cache.ttl = 0.2
+        shared_cache.set_many({"group:A2": 1, "group:A3": 2})
+        shared_cache.delete_many(["group:A3"])
+
+        assert shared_cache.get_many(["group:A2", "group:A3"]) == [1, MISSING]
+        time.sleep(0.3)
+        assert shared_cache.get("group:A2") is MISSING
+
+    @pytest.mark.unit
+    def test_unencodable_values_are_skipped(self, shared_cache):
+        """Test that values the codec cannot encode are not stored"""
+        assert shared_cache.set_many({"a": object(), "b": 2}) == 1
+        assert shared_cache.get_many(["a", "b"]) == [MISSING, 2]
+
+    @pytest.mark.unit
+    def test_factory(self):
+        """Test building caches from settings values"""
+        assert create_shared_cache("none") is None
+        assert create_shared_cache("auto") is None
+        assert isinstance(create_shared_cache("memory", ttl=5), MemorySharedCache)
+        with pytest.raises(ValueError):
+            create_shared_cache("redis")
+
+    @pytest.mark.unit
+    def test_results_reused_across_hosts(self, tmp_path, monkeypatch):
+        """Test that a result computed on one host is served to another from the shared tier"""
+        shared = MemorySharedCache(ttl=60)
+        monkeypatch.setattr(shared_cache_module, "_shared_cache", shared)
+        monkeypatch.setattr(shared_cache_module, "_shared_cache_loaded", True)
+        monkeypatch.setattr(result_cache_module, "_result_cache_loaded", True)
+        executor = ComputeExecutor(mode="inline")
+        _cached_calls.clear()
+
+        for host in ("one", "two"):
+            local = ResultCache(str(tmp_path / f"{host}.sqlite"))
+            monkeypatch.setattr(result_cache_module, "_result_cache", local)
+            assert asyncio.run(executor.run_light(_counted_dimension, "E6", [1, 0])) == 79
+            assert local.stats()["entries"] == 1
+
+        assert _cached_calls == ["E6"]
+        assert shared.get(f"v{RESULT_CACHE_VERSION}:_counted_dimension:E6:1,0") == 79
+
+    @pytest.mark.unit
+    def test_version_bump_skips_shared_entries(self, tmp_path, monkeypatch):
+        """Test that results stored under an older cache version are not served"""
+        shared = MemorySharedCache(ttl=60)
+        monkeypatch.setattr(shared_cache_module, "_shared_cache", shared)
+        monkeypatch.setattr(shared_cache_module, "_shared_cache_loaded", True)
+        monkeypatch.setattr(result_cache_module, "_result_cache", None)
+        monkeypatch.setattr(result_cache_module, "_result_cache_loaded", True)
+        executor = ComputeExecutor(mode="inline")
+        _cached_calls.clear()
+
+        asyncio.run(executor.run_light(_counted_dimension, "E6", [2, 0]))
+        monkeypatch.setattr(result_cache_module, "RESULT_CACHE_VERSION", RESULT_CACHE_VERSION + 1)
+        asyncio.run(executor.run_light(_counted_dimension, "E6", [2, 0]))
+
+        assert _cached_calls == ["E6", "E6"]
+
+    @pytest.mark.unit
+    def test_batch_and_warm_up_use_one_round_trip(self, monkeypatch):
+        """Test that batches and warm-up read and write the shared cache once for all their calls"""
+        class Counting(MemorySharedCache):
+            def _get_blobs(self, keys):
+                reads.append(len(keys))
+                return super()._get_blobs(keys)
+
+            def _set_blobs(self, blobs):
+                writes.append(len(blobs))
+                super()._set_blobs(blobs)
+
+        reads, writes = [], []
+        monkeypatch.setattr(shared_cache_module, "_shared_cache", Counting(ttl=60))
+        monkeypatch.setattr(shared_cache_module, "_shared_cache_loaded", True)
+        monkeypatch.setitem(BATCH_OPERATIONS, "counted", BatchOperation(_counted_dimension))
+        requests = [{"op": "counted", "group": "E6", "params": {"labels": labels}}
+                    for labels in ([1, 0], [2, 0], [3, 0], [1, 0])]
+        warmup = [(False, _counted_dimension, ("E6", [labels, 1]), {}) for labels in range(3)]
+        executor = ComputeExecutor(mode="thread")
+        _cached_calls.clear()
+        try:
+            first = asyncio.run(run_batch(executor, requests))
+            second = asyncio.run(run_batch(executor, requests))
+            for _ in range(2):
+                asyncio.run(warm_up(executor, warmup, WarmupState()))
+        finally:
+            executor.shutdown()
+
+        assert first == second
+        assert [outcome["result"] for outcome in first[0]] == [79, 80, 81, 79]
+        assert len(_cached_calls) == 6
+        assert reads == [3, 3, 3, 3]
+        assert writes == [3, 3]
+
+    @pytest.mark.unit
+    def test_redis_errors_are_misses(self):
+        """Test that a Redis outage degrades to misses, also for deletes"""
+        class Outage(Exception):
+            pass
+
+        class Down:
+            def __getattr__(self, name):
+                def fail(*args, **kwargs):
+                    raise Outage("connection refused")
+                return fail
+
+        cache = RedisSharedCache.__new__(RedisSharedCache)
+        SharedCache.__init__(cache)
+        cache._errors, cache._redis = Outage, Down()
+
+        cache.delete_many(["group:A2"])
+        cache.set("group:A2", 1)
+        assert cache.get("group:A2") is MISSING
+
+    @pytest.mark.unit
+    def test_incomplete_backend_rejected(self):
+        """Test that a backend missing part of the interface cannot be built"""
+        class ReadOnly(SharedCache):
+            def _get_blobs(self, keys):
+                return [None] * len(keys)
+
+        with pytest.raises(TypeError):
+            ReadOnly()
+
+
+class TestWarmup:
+    """Test the startup warm-up"""
+
+    @pytest.mark.unit
+    def test_warmup_calls(self):
+        """Test that the plan covers group endpoints, irreps and tensor products"""
+        calls = warmup_calls(["A2", "E6"], [("SU3", (1, 0))], [("SU3", [1, 0], [0, 1])], max_weights=1000)
+
+        assert len(calls) == 2 * 4 + 2
+        assert calls[-2] == (True, operations.irrep_data, ("A2", [1, 0]), {"max_weights": 1000})
+        assert calls[-1][:2] == (True, operations.tensor_product)
+
+    @pytest.mark.unit
+    def test_warm_up_records_progress(self, result_cache):
+        """Test that warm-up fills the caches and survives failing calls"""
+        calls = warmup_calls(["A2", "NotAGroup"], [("SU3", [1, 1])], [("SU3", [1, 0], [0, 1])])
+        executor = ComputeExecutor(mode="thread")
+        state = WarmupState()
+        try:
+            asyncio.run(warm_up(executor, calls, state))
+        finally:
+            executor.shutdown()
+
+        assert state.ready
+        assert state.to_dict()["progress"] == 1.0
+        assert (state.total, state.failed) == (10, 4)
+        assert result_cache.stats()["entries"] == 6
+
+
+def _counted(fn, calls):
+    """Wrap a coalesced operation, recording each call."""
+    def counted(group_name, *args, **kwargs):
+        calls.append(group_name)
+        return fn(group_name, *args, **kwargs)
+
+    counted.coalesce_key = fn.coalesce_key
+    counted.persistent = False
+    return counted
+
+
+class TestBatch:
+    """Test batch execution"""
+
+    @staticmethod
+    def _run(requests, **kwargs):
+        executor = ComputeExecutor(mode="thread")
+        try:
+            return asyncio.run(run_batch(executor, requests, **kwargs))
+        finally:
+            executor.shutdown()
+
+    @pytest.mark.unit
+    def test_duplicates_run_once(self, result_cache, monkeypatch):
+        """Test that identical operations, in any group notation, share one call"""
+        calls = []
+        group_info = operations.group_info
+        monkeypatch.setitem(BATCH_OPERATIONS, "group_info", BatchOperation(
+            _counted(group_info, calls)))
+        requests = [{"op": "group_info", "group": group, "params": {}} for group in ("SU3", "SU(3)", "A2", "E6")]
+        requests.append({"op": "tensor_product", "group": "SU3", "params": {"irrep1": [1, 0], "irrep2": [0, 1]}})
+        requests.append(requests[-1])
+
+        outcomes, unique = self._run(requests)
+
+        assert unique == 3
+        assert len(calls) == 2
+        assert [outcome["status"] for outcome in outcomes] == [200] * 6
+        assert outcomes[0]["result"]["dimension"] == 8
+        assert outcomes[3]["result"]["dimension"] == 78
+        assert len(outcomes[5]["result"]["decomposition"]) == 2
+
+    @pytest.mark.unit
+    def test_group_fields_in_any_order(self):
+        """Test that group field selections in different orders share one call"""
+        selections = [["rank", "name"], ["name", "rank"], ["name", "rank", "name"], ["rank", "bogus"]]
+        outcomes, unique = self._run(
+            [{"op": "group", "group": "E6", "params": {"fields": fields}} for fields in selections])
+
+        assert unique == 1
+        assert outcomes[0] == outcomes[1] == outcomes[2]
+        assert list(outcomes[0]["result"]) == ["name", "rank"]
+        assert outcomes[3]["status"] == 400
+        assert "bogus" in outcomes[3]["error"]
+
+    @pytest.mark.unit
+    def test_dimensions_vectorized_per_group(self):
+        """Test that dimensions of one group are evaluated together, errors per entry"""
+        labels = [[1, 0], [0, 1], [1, 1], [1, 0, 0], [2, 2]]
+        outcomes, unique = self._run(
+            [{"op": "dimension", "group": "SU3", "params": {"highest_weight": label}} for label in labels]
+            + [{"op": "dimension", "group": "E8", "params": {"highest_weight": [0] * 7 + [1]}}])
+
+        assert [outcome.get("result") for outcome in outcomes] == [
+            {"dimension": 3}, {"dimension": 3}, {"dimension": 8}, None, {"dimension": 27}, {"dimension": 248}]
+        assert outcomes[3]["status"] == 400
+        assert unique == 6
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("request_, message", [
+        ({"op": "cube_root", "group": "SU3", "params": {}}, "Unknown operation"),
+        ({"op": "group_info", "group": "E9", "params": {}}, "Unsupported group"),
+        ({"op": "group_info", "group": None, "params": {}}, "No group"),
+        ({"op": "irrep", "group": "SU3", "params": {"highest_weight": [1, 0], "max_weights": 10 ** 9}},
+         "Unexpected parameters"),
+        ({"op": "tensor_product", "group": "SU3", "params": {"irrep1": [1, 0]}}, "Invalid parameters"),
+        ({"op": "dimension", "group": "SU3", "params": {}}, "highest_weight"),
+    ])
+    def test_invalid_operations(self, request_, message):
+        """Test that invalid entries fail on their own without being dispatched"""
+        outcomes, unique = self._run([request_])
+
+        assert unique == 0
+        assert outcomes[0]["status"] == 400
+        assert message in outcomes[0]["error"]
+
+    @pytest.mark.unit
+    def test_weight_limit(self, result_cache, monkeypatch):
+        """Test that the server's weight limit applies to batched irreps"""
+        monkeypatch.setattr(settings, "MAX_WEIGHT_SYSTEM_SIZE", 5)
+        outcomes, _ = self._run([{"op": "irrep", "group": "SU3", "params": {"highest_weight": hw}}
+                                 for hw in ([1, 0], [2, 2])])
+
+        assert outcomes[0]["status"] == 200
+        assert outcomes[0]["result"]["multiplicities"].tolist() == [1, 1, 1]
+        assert outcomes[1]["status"] == 413
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def job_store(request, tmp_path):
+    if request.param == "memory":
+        return MemoryJobStore(ttl=60)
+    return SQLiteJobStore(str(tmp_path / "jobs.db"), ttl=60)
+
+
+def _wait_until_finished(manager: JobManager, task_id: str, timeout: float = 60) -> dict:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        job = manager.get(task_id)
+        if job["status"] in FINISHED_STATES:
+            return job
+        time.sleep(0.05)
+    raise AssertionError(f"Job {task_id} did not finish")
+
+
+class TestJobStore:
+    """Test job record stores"""
+
+    @pytest.mark.unit
+    def test_create_update_get(self, job_store):
+        """Test the lifecycle of a job record"""
+        job = new_job("dimension", {"group": "E6", "highest_weight": [1, 0, 0, 0, 0, 0]})
+        job_store.create(job)
+
+        assert job_store.get(job["task_id"])["status"] == "pending"
+        job_store.update(job["task_id"], status="running", progress=40)
+        assert job_store.get(job["task_id"])["progress"] == 40
+        job_store.update(job["task_id"], **finish_fields("completed", result={"dimension": 27}))
+
+        record = job_store.get(job["task_id"])
+        assert record["status"] == "completed"
+        assert record["progress"] == 100
+        assert record["result"] == {"dimension": 27}
+        assert record["completed_at"] is not None
+
+    @pytest.mark.unit
+    def test_unknown_job(self, job_store):
+        """Test that unknown jobs are reported as None"""
+        assert job_store.get("missing") is None
+        assert job_store.update("missing", progress=10) is None
+
+    @pytest.mark.unit
+    def test_finished_jobs_expire(self, job_store):
+        """Test retention of finished jobs"""
+        job_store.ttl = 0
+        running, finished = new_job("dimension", {}), new_job("dimension", {})
+        job_store.create(running)
+        job_store.create(finished)
+        job_store.update(running["task_id"], status="running")
+        job_store.update(finished["task_id"], **finish_fields("failed", error="boom"))
+
+        assert job_store.get(finished["task_id"]) is None
+        assert job_store.get(running["task_id"]) is not None
+
+    @pytest.mark.unit
+    def test_conditional_update(self, job_store):
+        """Test that transitions only apply from the allowed states"""
+        job = new_job("dimension", {})
+        job_store.create(job)
+        task_id = job["task_id"]
+
+        assert job_store.update_if(task_id, ("running",), progress=10) is None
+        assert job_store.update_if(task_id, ("pending",), status="running")["status"] == "running"
+        assert job_store.update_if(task_id, ("pending", "running"), **finish_fields("cancelled"))["status"] == "cancelled"
+        # A late result does not overwrite the cancellation
+        assert job_store.update_if(task_id, ("running",), **finish_fields("completed", result={})) is None
+
+        record = job_store.get(task_id)
+        assert record["status"] == "cancelled"
+        assert record["result"] is None
+        assert job_store.update_if("missing", None, progress=10) is None
+
+    @pytest.mark.unit
+    def test_incomplete_store_rejected(self):
+        """Test that a store must implement the whole interface"""
+        class GetOnly(JobStore):
+            def get(self, task_id):
+                return None
+
+        with pytest.raises(TypeError):
+            GetOnly(ttl=60)
+
+    @pytest.mark.unit
+    def test_auto_store_without_services(self):
+        """Test the fallback when Redis is not configured"""
+        assert isinstance(create_job_store("auto", ttl=60), MemoryJobStore)
+
+
+class TestJobManager:
+    """Test local job processes"""
+
+    @pytest.mark.slow
+    def test_job_completes_with_progress(self):
+        """Test that a job runs in a worker process and reports its result"""
+        manager = JobManager(MemoryJobStore(ttl=60), max_workers=1)
+        job = manager.submit("irrep", {"group": "F4", "highest_weight": [0, 0, 1, 0]})
+        record = _wait_until_finished(manager, job["task_id"])
+
+        assert record["status"] == "completed", record["error"]
+        assert record["progress"] == 100
+        assert sum(record["result"]["multiplicities"]) == record["result"]["dimension"] == 273
+
+    @pytest.mark.slow
+    def test_cancel(self):
+        """Test cancelling a running job and a queued one"""
+        manager = JobManager(MemoryJobStore(ttl=60), max_workers=1)
+        parameters = {"group": "E8", "irrep1": [0, 0, 0, 0, 0, 1, 0, 0], "irrep2": [0, 0, 0, 0, 1, 0, 0, 0]}
+        running = manager.submit("tensor_product", parameters)
+        queued = manager.submit("tensor_product", parameters)
+
+        assert queued["status"] == "pending"
+        assert manager.cancel(queued["task_id"])["status"] == "cancelled"
+        assert manager.cancel(running["task_id"])["status"] == "cancelled"
+        time.sleep(0.5)
+        assert manager.get(running["task_id"])["status"] == "cancelled"
+        assert manager.stats() == {"running": 0, "queued": 0}
+
+    @pytest.mark.slow
+    def test_cancel_finished_job(self):
+        """Test that cancelling a finished job leaves it unchanged"""
+        manager = JobManager(MemoryJobStore(ttl=60), max_workers=1)
+        job = manager.submit("dimension", {"group": "A2", "highest_weight": [1, 0]})
+        record = _wait_until_finished(manager, job["task_id"])
+
+        assert record["status"] == "completed"
+        assert manager.cancel(job["task_id"]) == record
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("operation,parameters", [
+        ("unknown", {}),
+        ("irrep", {"group": "SU3"}),
+        ("dimension", {"group": "SU3", "highest_weight": [1, 0], "extra": 1}),
+    ])
+    def test_invalid_submission(self, operation, parameters):
+        """Test that invalid jobs are rejected before they are queued"""
+        with pytest.raises(ValueError):
+            validate_job(operation, parameters)
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("parameters", [{}, {"max_weights": 10 ** 9}])
+    def test_irrep_job_weight_limit(self, monkeypatch, parameters):
+        """Test that irrep jobs stay within the job weight limit, whatever they ask for"""
+        monkeypatch.setattr(settings, "JOB_MAX_WEIGHT_SYSTEM_SIZE", 10)
+        with pytest.raises(WeightLimitExceeded):
+            run_job("irrep", {"group": "SU3", "highest_weight": [2, 2], **parameters})
+        assert run_job("irrep", {"group": "SU3", "highest_weight": [1, 1], "max_weights": 10})["dimension"] == 8
+
+    @pytest.mark.unit
+    def test_celery_requires_redis_store(self, monkeypatch):
+        """Test that the Celery backend refuses a store its workers cannot see"""
+        monkeypatch.setattr(settings, "JOB_STORE", "auto")
+        monkeypatch.setattr(settings, "REDIS_URL", None)
+        monkeypatch.setattr(settings, "JOB_BACKEND", "local")
+        assert isinstance(create_job_store_from_settings(), MemoryJobStore)
+
+        with pytest.raises(ValueError, match="Redis"):
+            create_job_store_from_settings(backend="celery")
+        monkeypatch.setattr(settings, "JOB_BACKEND", "celery")
+        with pytest.raises(ValueError, match="Redis"):
+            create_job_store_from_settings()
+
+    @pytest.mark.unit
+    def test_run_job_progress(self):
+        """Test that progress is reported as increasing percentages below 100"""
+        reported = []
+        result = run_job("irrep", {"group": "E6", "highest_weight": [1, 1, 0, 0, 0, 0]}, reported.append)
+
+        assert result["dimension"] == sum(result["multiplicities"])
+        assert reported == sorted(set(reported))
+        assert reported[-1] == 99